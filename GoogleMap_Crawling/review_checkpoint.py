@@ -0,0 +1,68 @@
+## 공원별 리뷰 수집 체크포인트 (이어받기 / 증분 크롤링)
+import os
+import json
+from datetime import datetime
+
+import pandas as pd
+
+
+# ====================================================================================
+class ReviewCheckpoint:
+    """
+    공원 하나의 수집 상태를 JSON 파일로 관리
+    - review_ids: 지금까지 CSV에 저장된 data-review-id 집합
+    - last_crawled_at: 마지막으로 리뷰를 저장한 시각
+    CSV에 먼저 쓰고 체크포인트를 나중에 갱신하므로, 그 사이에 중단되더라도
+    다음 실행 때 CSV의 리뷰ID 컬럼과 합쳐서 중복 저장을 막는다.
+    """
+    def __init__(self, checkpoint_path, csv_path):
+        self.checkpoint_path = checkpoint_path
+        self.csv_path = csv_path
+        self.review_ids = set()
+        self.last_crawled_at = None
+        self.load()
+
+    def load(self):
+        if os.path.exists(self.checkpoint_path):
+            with open(self.checkpoint_path, "r", encoding="utf-8") as f:
+                state = json.load(f)
+            self.review_ids = set(state.get("review_ids", []))
+            self.last_crawled_at = state.get("last_crawled_at")
+
+        if os.path.exists(self.csv_path):
+            try:
+                saved = pd.read_csv(self.csv_path, usecols=["리뷰ID"])
+                self.review_ids.update(saved["리뷰ID"].dropna().astype(str))
+            except ValueError:
+                pass  # 리뷰ID 컬럼이 없는 기존 CSV
+
+    def save(self):
+        os.makedirs(os.path.dirname(self.checkpoint_path) or ".", exist_ok=True)
+        state = {
+            "review_ids": sorted(self.review_ids),
+            "last_crawled_at": self.last_crawled_at,
+        }
+        tmp_path = self.checkpoint_path + ".tmp"
+        with open(tmp_path, "w", encoding="utf-8") as f:
+            json.dump(state, f, ensure_ascii=False)
+        os.replace(tmp_path, self.checkpoint_path)
+
+    def commit(self, rows):
+        """새 리뷰 rows를 CSV에 이어 쓰고 체크포인트 갱신"""
+        rows = [r for r in rows if r.get("리뷰ID") not in self.review_ids]
+        if not rows:
+            return 0
+
+        df = pd.DataFrame(rows)
+        if os.path.exists(self.csv_path):
+            # 기존 CSV의 컬럼 순서에 맞춰 이어 쓰기 (리뷰ID 컬럼이 없는 예전 파일도 호환)
+            columns = pd.read_csv(self.csv_path, nrows=0).columns
+            df.reindex(columns=columns).to_csv(self.csv_path, mode="a", header=False, index=False, encoding="utf-8")
+        else:
+            os.makedirs(os.path.dirname(self.csv_path) or ".", exist_ok=True)
+            df.to_csv(self.csv_path, index=False, encoding="utf-8-sig")
+
+        self.review_ids.update(r["리뷰ID"] for r in rows)
+        self.last_crawled_at = datetime.now().isoformat(timespec="seconds")
+        self.save()
+        return len(rows)
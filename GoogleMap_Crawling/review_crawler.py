@@ -0,0 +1,725 @@
+## 구글맵 리뷰 크롤러 (키워드/URL 모드, 드라이버 풀 배치 크롤링, 저장된 HTML 재파싱)
+import os
+import re
+import json
+import time
+import queue
+import argparse
+import threading
+from contextlib import contextmanager
+from concurrent.futures import ThreadPoolExecutor, as_completed
+
+import pandas as pd
+
+from selenium import webdriver
+from selenium.webdriver.common.by import By
+from selenium.webdriver.common.keys import Keys
+from selenium.webdriver.chrome.service import Service
+from selenium.webdriver.support.ui import WebDriverWait
+from selenium.webdriver.support import expected_conditions as EC
+from selenium.common.exceptions import NoSuchElementException, TimeoutException
+from webdriver_manager.chrome import ChromeDriverManager
+
+from review_checkpoint import ReviewCheckpoint
+from review_parser import clean_content, parse_review_file
+
+# ====================================================================================
+def create_driver(headless=False, driver_path=None):
+    """
+    크롬 드라이버 생성
+    driver_path: 이미 설치된 chromedriver 경로 (없으면 ChromeDriverManager로 설치)
+    """
+    options = webdriver.ChromeOptions()
+    if headless:
+        options.add_argument("--headless=new")
+    options.add_argument("--disable-gpu")
+    options.add_argument("--lang=ko-KR")
+    options.add_argument("--window-size=1280,2000")
+
+    if driver_path is None:
+        driver_path = ChromeDriverManager().install()
+    return webdriver.Chrome(service=Service(driver_path), options=options)
+
+
+def sort_reviews_by_newest(driver, wait):
+    """리뷰 정렬을 '최신순'으로 변경 (실패해도 크롤링은 계속 진행)"""
+    try:
+        sort_btn = wait.until(EC.element_to_be_clickable((By.XPATH, "//button[contains(@aria-label, '정렬') or .//span[text()='정렬']]")))
+        driver.execute_script("arguments[0].click();", sort_btn)
+        newest = wait.until(EC.element_to_be_clickable((By.XPATH, "//*[@role='menuitemradio' and contains(., '최신순')]")))
+        driver.execute_script("arguments[0].click();", newest)
+        time.sleep(1)
+        return True
+    except TimeoutException:
+        print("[warn] 리뷰 정렬(최신순) 버튼을 찾지 못해 기본 정렬로 진행합니다.")
+        return False
+
+
+# ====================================================================================
+# 스크롤 대기 / 더보기 펼치기 (adaptive 모드)
+EXPAND_MORE_JS = """
+var n = 0;
+document.querySelectorAll("div[data-review-id] button").forEach(function (b) {
+    var label = b.getAttribute("aria-label") || "";
+    if ((b.innerText || "").indexOf("자세히") >= 0 || label.indexOf("더보기") >= 0) {
+        b.click();
+        n += 1;
+    }
+});
+return n;
+"""
+
+COUNT_CARDS_JS = "return document.querySelectorAll('div[data-review-id]').length;"
+
+
+def expand_more_buttons(driver):
+    """화면에 있는 모든 '자세히' 버튼을 스크립트 한 번으로 펼침. 펼친 개수 반환"""
+    try:
+        return driver.execute_script(EXPAND_MORE_JS) or 0
+    except Exception as e:
+        print(f"[warn] '더보기' 일괄 펼치기 중 에러: {e}")
+        return 0
+
+
+def count_review_cards(driver):
+    return driver.execute_script(COUNT_CARDS_JS) or 0
+
+
+def wait_for_more_cards(driver, prev_count, max_wait=3.0, poll=0.1):
+    """
+    리뷰 카드 수가 prev_count보다 늘어나는 즉시 반환 (최대 max_wait초 대기)
+    반환: 대기 후 카드 수
+    """
+    try:
+        WebDriverWait(driver, max_wait, poll_frequency=poll).until(
+            lambda d: count_review_cards(d) > prev_count
+        )
+    except TimeoutException:
+        pass
+    return count_review_cards(driver)
+
+
+def summarize_page_timings(page_timings):
+    """스크롤(페이지)별 소요 시간 요약 출력"""
+    if not page_timings:
+        return
+    n = len(page_timings)
+    total = sum(t["total"] for t in page_timings)
+    reviews = sum(t["new_reviews"] for t in page_timings)
+    print(f"[timing] 스크롤 {n}회, 총 {total:.1f}s, 리뷰 {reviews}개 ({reviews / total if total else 0:.1f}개/s)")
+    for key, label in (("expand", "더보기 펼치기"), ("extract", "카드 추출"), ("scroll_wait", "스크롤 대기")):
+        part = sum(t[key] for t in page_timings)
+        print(f"[timing]   {label}: 평균 {part / n:.2f}s / 합계 {part:.1f}s")
+
+
+# ====================================================================================
+# 리뷰 카드 추출
+def _fallback_author(card):
+    # 대체 셀렉터 시도 (간혹 클래스가 바뀌는 경우)
+    try:
+        return card.find_element(By.XPATH, ".//button[contains(@aria-label,'프로필')]/div").text
+    except Exception:
+        return ""
+
+
+def _fallback_rating(card):
+    # 대체: role='img' + aria-label
+    try:
+        return card.find_element(By.XPATH, ".//*[@role='img' and contains(@aria-label,'별표')]").get_attribute('aria-label')
+    except Exception:
+        return ""
+
+
+def _fallback_date(card):
+    # 대체: time 태그
+    try:
+        return card.find_element(By.XPATH, ".//span/time").text
+    except Exception:
+        return ""
+
+
+def extract_review_by_elements(card, review_id, require_text=False):
+    """
+    카드 하나를 find_element 호출로 항목별 추출 (element 모드)
+    require_text: 본문(wiI7pd)이 없으면 None 반환
+    """
+    # 본문 + 태그(볼드) 결합
+    main_content = ""
+    try:
+        main_content = card.find_element(By.CLASS_NAME, 'wiI7pd').text
+    except NoSuchElementException:
+        pass
+    if require_text and not main_content.strip():
+        return None
+
+    tag_content = ""
+    try:
+        tag_elements = card.find_elements(By.CLASS_NAME, 'PBK6be')
+        tag_content = " ".join([t.text for t in tag_elements if t.text.strip()])
+    except NoSuchElementException:
+        pass
+
+    # 작성자 / 별점 / 날짜
+    try:
+        author = card.find_element(By.CLASS_NAME, 'd4r55').text
+    except NoSuchElementException:
+        author = _fallback_author(card)
+
+    # 별점은 aria-label: "별표 N개"
+    try:
+        rating = card.find_element(By.CLASS_NAME, 'kvMYJc').get_attribute('aria-label')
+    except NoSuchElementException:
+        rating = _fallback_rating(card)
+
+    try:
+        date_txt = card.find_element(By.CLASS_NAME, 'rsqaWe').text
+    except NoSuchElementException:
+        date_txt = _fallback_date(card)
+
+    return {
+        "리뷰ID": review_id,
+        "작성자": author,
+        "내용": clean_content(main_content, tag_content),
+        "별점": rating,
+        "작성일": date_txt
+    }
+
+
+# 아직 추출하지 않은 카드만 골라 한 번에 JSON으로 반환하고, 추출한 카드에는 data-crawled 표시
+SNAPSHOT_REVIEWS_JS = """
+var out = [];
+var seen = {};
+document.querySelectorAll("div[data-review-id]").forEach(function (card) {
+    var id = card.getAttribute("data-review-id");
+    if (!id || seen[id] || card.closest("[data-crawled]")) return;
+    seen[id] = true;
+    card.setAttribute("data-crawled", "1");
+
+    var text = function (sel) {
+        var el = card.querySelector(sel);
+        return el ? (el.innerText || "") : "";
+    };
+    var ratingEl = card.querySelector(".kvMYJc");
+    var tags = [];
+    card.querySelectorAll(".PBK6be").forEach(function (t) {
+        if ((t.innerText || "").trim()) tags.push(t.innerText);
+    });
+    out.push({
+        id: id,
+        author: text(".d4r55"),
+        text: text(".wiI7pd"),
+        tags: tags.join(" "),
+        rating: ratingEl ? (ratingEl.getAttribute("aria-label") || "") : "",
+        date: text(".rsqaWe")
+    });
+});
+return JSON.stringify(out);
+"""
+
+
+def extract_reviews_by_script(driver, require_text=False):
+    """
+    새 리뷰 카드 전체를 execute_script 한 번으로 추출 (script 모드)
+    작성자/별점/날짜 중 빈 항목이 있는 카드만 기존 XPath 대체 셀렉터로 다시 조회
+    require_text: 본문(wiI7pd)이 없는 카드는 (리뷰ID, None)으로 반환
+    반환: (리뷰ID, row) 리스트
+    """
+    snapshot = json.loads(driver.execute_script(SNAPSHOT_REVIEWS_JS) or "[]")
+    rows = []
+    for r in snapshot:
+        if require_text and not r["text"].strip():
+            rows.append((r["id"], None))
+            continue
+        author, rating, date_txt = r["author"], r["rating"], r["date"]
+        if not (author and rating and date_txt):
+            try:
+                card = driver.find_element(By.CSS_SELECTOR, f'div[data-review-id="{r["id"]}"]')
+                author = author or _fallback_author(card)
+                rating = rating or _fallback_rating(card)
+                date_txt = date_txt or _fallback_date(card)
+            except NoSuchElementException:
+                pass
+        rows.append((r["id"], {
+            "리뷰ID": r["id"],
+            "작성자": author,
+            "내용": clean_content(r["text"], r["tags"]),
+            "별점": rating,
+            "작성일": date_txt
+        }))
+    return rows
+
+
+def save_review_snapshot(scrollable_div, path):
+    """리뷰 패널 HTML 저장 (실패해도 크롤링 결과에는 영향 없음)"""
+    try:
+        os.makedirs(os.path.dirname(path) or ".", exist_ok=True)
+        with open(path, "w", encoding="utf-8") as f:
+            f.write(scrollable_div.get_attribute("outerHTML"))
+    except Exception as e:
+        print(f"[warn] 리뷰 패널 HTML 저장 실패: {e}")
+
+
+def crawl_reviews_by_count(key_words=None, target_reviews=50, headless=False, timeout=12, place_url=None, driver=None,
+                           known_review_ids=None, on_batch=None, sort_newest=False,
+                           wait_mode="fixed", max_wait=3.0, stagnant_limit=None, extract_mode="element",
+                           require_text=False, snapshot_path=None):
+    """
+    key_words: 키워드 검색어 (place_url이 없을 때 사용)
+    place_url: 구글맵 장소 상세 URL (이 값이 있으면 키워드 검색을 건너뜀)
+    driver: 재사용할 드라이버 (넘겨주면 새로 띄우지 않고, 끝난 뒤에도 종료하지 않음)
+    known_review_ids: 이미 저장된 리뷰 ID 집합. 최신순으로 정렬한 뒤 이 ID를 만나면 스크롤을 멈춤
+    on_batch: 스크롤 한 번마다 새로 모은 리뷰(rows 리스트)를 넘겨받는 콜백 (중간 저장용)
+    sort_newest: 리뷰를 최신순으로 정렬 (known_review_ids가 있으면 자동으로 켜짐)
+    wait_mode: "fixed"    - 스크롤 후 1.3초, '자세히' 클릭마다 0.2초 고정 대기 (기존 방식)
+               "adaptive" - 카드 수가 늘어나는 즉시 다음 단계로 진행(최대 max_wait초),
+                            '자세히' 버튼은 스크립트 한 번으로 일괄 펼침
+    stagnant_limit: 새 리뷰 없는 스크롤이 몇 번 이어지면 종료할지 (기본: fixed 5회, adaptive 2회)
+    extract_mode: "element" - 카드마다 find_element로 항목을 하나씩 읽음 (기존 방식)
+                  "script"  - 새 카드 전체를 execute_script 한 번으로 JSON 추출,
+                              작성자/별점/날짜가 비어 있는 카드만 XPath 대체 셀렉터로 보완
+    require_text: 본문(wiI7pd)이 없는 리뷰는 건너뜀 (한강공원 크롤링 방식)
+    snapshot_path: 수집이 끝난 리뷰 패널 HTML을 저장할 경로 (replay 모드로 다시 파싱 가능)
+    반환 DataFrame의 attrs["page_timings"]에 스크롤별 소요 시간 기록
+    """
+    if wait_mode not in ("fixed", "adaptive"):
+        raise ValueError(f"지원하지 않는 wait_mode: {wait_mode}")
+    if extract_mode not in ("element", "script"):
+        raise ValueError(f"지원하지 않는 extract_mode: {extract_mode}")
+    adaptive = wait_mode == "adaptive"
+    if stagnant_limit is None:
+        stagnant_limit = 2 if adaptive else 5
+    known_review_ids = known_review_ids or set()
+    owns_driver = driver is None
+    if owns_driver:
+        driver = create_driver(headless=headless)
+
+    try:
+        wait = WebDriverWait(driver, timeout)
+
+        # --- 0) URL 모드: 장소 링크로 직접 진입 ---
+        if place_url:
+            # hl=ko 보장
+            if "hl=ko" not in place_url:
+                sep = "&" if "?" in place_url else "?"
+                place_url = f"{place_url}{sep}hl=ko"
+            driver.get(place_url)
+        else:
+            # --- 1) 키워드 모드: 검색 후 첫 결과 진입 ---
+            driver.get('https://www.google.co.kr/maps/?hl=ko')
+            q = wait.until(EC.presence_of_element_located((By.CSS_SELECTOR, "#searchboxinput")))
+            q.clear(); q.send_keys(key_words); q.send_keys(Keys.ENTER)
+            time.sleep(2)
+
+            try:
+                first_result = wait.until(EC.element_to_be_clickable((By.CSS_SELECTOR, "a.hfpxzc")))
+                driver.execute_script("arguments[0].click();", first_result)
+                time.sleep(1.5)
+            except Exception:
+                pass
+
+        # --- 2) 리뷰 탭으로 이동 ---
+        # 2-a) 현재 페이지에 리뷰 버튼이 있으면 클릭
+        try:
+            review_btn_xpath = "//button[contains(@aria-label, '리뷰') or .//div[text()='리뷰'] or .//span[text()='리뷰']]"
+            review_btn = wait.until(EC.element_to_be_clickable((By.XPATH, review_btn_xpath)))
+            driver.execute_script("arguments[0].click();", review_btn)
+        except TimeoutException:
+            # 2-b) 일부 페이지는 리뷰 카운트(“리뷰 n개”) 버튼만 보이는 경우가 있어 대체 시도
+            try:
+                alt_xpath = "//button[contains(., '리뷰') and (contains(., '개') or contains(., '전체'))]"
+                alt_btn = wait.until(EC.element_to_be_clickable((By.XPATH, alt_xpath)))
+                driver.execute_script("arguments[0].click();", alt_btn)
+            except TimeoutException:
+                raise RuntimeError("리뷰 탭(또는 리뷰 보기 버튼)을 찾거나 클릭하는 데 실패했습니다.")
+
+        # --- 3) 리뷰 스크롤 영역 확보 ---
+        scrollable_div = wait.until(EC.presence_of_element_located((By.CSS_SELECTOR, 'div.m6QErb.DxyBCb.kA9KIf.dS8AEf')))
+
+        if sort_newest or known_review_ids:
+            sort_reviews_by_newest(driver, wait)
+
+        rows = []
+        seen_review_ids = set()
+        stagnant = 0
+        flushed = 0
+        reached_known = False
+        page_timings = []
+
+        print("\n[info] 리뷰 수집을 시작합니다 (URL/키워드 공통 로직)...")
+        while True:
+            if len(rows) >= target_reviews:
+                print(f"[info] 목표 리뷰 수({target_reviews}개) 이상({len(rows)}개)을 수집하여 종료합니다.")
+                break
+
+            page_start = time.perf_counter()
+            rows_before = len(rows)
+            if adaptive or extract_mode == "script":
+                expand_more_buttons(driver)
+            t_expand = time.perf_counter()
+
+            # 리뷰 카드 (script 모드는 새 카드 전체를 execute_script 한 번으로 추출)
+            if extract_mode == "script":
+                items = extract_reviews_by_script(driver, require_text=require_text)
+            else:
+                review_cards = driver.find_elements(By.XPATH, "//div[@data-review-id]")
+                items = ((card.get_attribute('data-review-id') or "", card) for card in review_cards)
+
+            new_reviews_found_in_this_scroll = False
+            for review_id, item in items:
+                if not review_id:
+                    continue
+                if review_id in seen_review_ids:
+                    continue
+                if review_id in known_review_ids:
+                    # 최신순 정렬이므로 이후 카드는 모두 이미 수집된 리뷰
+                    reached_known = True
+                    break
+
+                # 새 리뷰
+                new_reviews_found_in_this_scroll = True
+                seen_review_ids.add(review_id)
+
+                # 더보기 펼치기 (adaptive 모드는 위에서 일괄 처리)
+                if not adaptive and extract_mode != "script":
+                    try:
+                        more_button = item.find_element(By.XPATH, ".//button[contains(., '자세히') or contains(@aria-label, '더보기')]")
+                        driver.execute_script("arguments[0].click();", more_button)
+                        time.sleep(0.2)
+                    except NoSuchElementException:
+                        pass
+                    except Exception as e:
+                        print(f"[warn] '더보기' 버튼 클릭 중 에러: {e}")
+
+                if extract_mode == "script":
+                    row = item
+                else:
+                    try:
+                        row = extract_review_by_elements(item, review_id, require_text=require_text)
+                    except Exception as e:
+                        print(f"[warn] 리뷰 데이터 추출 중 에러: {e}")
+                        row = None
+                if row is not None:
+                    rows.append(row)
+
+            t_extract = time.perf_counter()
+            print(f"리뷰 수집 중... 현재 {len(rows)} / {target_reviews}개")
+
+            # 중간 저장 (목표 수를 넘는 부분은 제외)
+            if on_batch is not None:
+                batch = rows[flushed:target_reviews]
+                if batch:
+                    on_batch(batch)
+                    flushed += len(batch)
+
+            done = reached_known or len(rows) >= target_reviews
+            if not done:
+                # 스크롤 다운
+                card_count = count_review_cards(driver) if adaptive else 0
+                driver.execute_script('arguments[0].scrollTop = arguments[0].scrollHeight', scrollable_div)
+                if adaptive:
+                    wait_for_more_cards(driver, card_count, max_wait=max_wait)
+                else:
+                    time.sleep(1.3)
+            t_scroll = time.perf_counter()
+
+            page_timings.append({
+                "new_reviews": len(rows) - rows_before,
+                "expand": t_expand - page_start,
+                "extract": t_extract - t_expand,
+                "scroll_wait": t_scroll - t_extract,
+                "total": t_scroll - page_start,
+            })
+
+            if reached_known:
+                print("[info] 이미 수집된 리뷰에 도달하여 수집을 종료합니다.")
+                break
+
+            if not new_reviews_found_in_this_scroll:
+                stagnant += 1
+                if stagnant >= stagnant_limit:
+                    print("[info] 더 이상 새로운 리뷰가 로드되지 않아 수집을 중단합니다.")
+                    break
+            else:
+                stagnant = 0
+
+        summarize_page_timings(page_timings)
+        if snapshot_path:
+            save_review_snapshot(scrollable_div, snapshot_path)
+        df = pd.DataFrame(rows[:target_reviews])
+        df.attrs["page_timings"] = page_timings
+        return df
+
+    finally:
+        if owns_driver:
+            driver.quit()
+
+
+# ====================================================================================
+class DriverPool:
+    """
+    재사용 가능한 크롬 드라이버 풀
+    - chromedriver 설치는 풀 생성 시 한 번만 수행
+    - 드라이버는 필요할 때 만들고(size개 까지), 공원이 바뀌어도 세션을 그대로 재사용
+    - 크롤링 중 에러가 난 드라이버는 버리고 다음 요청 때 새로 생성
+    """
+    def __init__(self, size=3, headless=True):
+        self.size = size
+        self.headless = headless
+        self.driver_path = ChromeDriverManager().install()
+        self._idle = queue.Queue()
+        self._lock = threading.Lock()
+        self._created = 0
+        self._all = []
+
+    def _new_driver(self):
+        # 자리(_created)는 호출 전에 잡아 둠, 생성이 실패하면 자리를 돌려줘야 다른 요청이 영원히 기다리지 않음
+        try:
+            driver = create_driver(headless=self.headless, driver_path=self.driver_path)
+        except Exception:
+            with self._lock:
+                self._created -= 1
+            raise
+        with self._lock:
+            self._all.append(driver)
+        return driver
+
+    def _checkout(self, poll_sec=1.0):
+        """놀고 있는 드라이버 -> 없으면 자리가 남을 때 새로 생성 -> 둘 다 안 되면 잠깐 기다렸다가 다시 확인"""
+        while True:
+            try:
+                return self._idle.get_nowait()
+            except queue.Empty:
+                pass
+            with self._lock:
+                can_create = self._created < self.size
+                if can_create:
+                    self._created += 1
+            if can_create:
+                return self._new_driver()
+            # _discard로 자리가 비어도 알 수 있도록 timeout을 두고 기다림
+            try:
+                return self._idle.get(timeout=poll_sec)
+            except queue.Empty:
+                continue
+
+    @contextmanager
+    def acquire(self):
+        driver = self._checkout()
+
+        healthy = True
+        try:
+            yield driver
+        except Exception:
+            healthy = False
+            raise
+        finally:
+            if healthy:
+                self._idle.put(driver)
+            else:
+                self._discard(driver)
+
+    def _discard(self, driver):
+        try:
+            driver.quit()
+        except Exception:
+            pass
+        with self._lock:
+            if driver in self._all:
+                self._all.remove(driver)
+            self._created -= 1
+
+    def close(self):
+        with self._lock:
+            drivers, self._all = self._all, []
+            self._created = 0
+        for driver in drivers:
+            try:
+                driver.quit()
+            except Exception:
+                pass
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc):
+        self.close()
+
+
+# ====================================================================================
+def make_target(query, target_reviews=1500, name=None):
+    """
+    query: 구글맵 장소 URL 또는 검색 키워드
+    name: 저장 파일 이름 접두사 (없으면 query 사용)
+    """
+    is_url = query.startswith("http://") or query.startswith("https://")
+    if name is None:
+        name = re.sub(r'[\\/:*?"<>|]', "_", query)
+    return {
+        "name": name,
+        "key_words": None if is_url else query,
+        "place_url": query if is_url else None,
+        "target_reviews": target_reviews,
+    }
+
+
+def load_targets(csv_path, target_reviews=1500):
+    """
+    googlemap_crawling_target_parks.csv (gu, park_name) 형식에서 크롤링 대상 목록 생성
+    파일명은 기존 data 폴더 규칙(예: 강남_도산공원)을 따름
+    """
+    df = pd.read_csv(csv_path)
+    targets = []
+    for gu, park_name in zip(df["gu"], df["park_name"]):
+        gu_short = gu[:-1] if gu.endswith("구") and len(gu) > 2 else gu
+        targets.append(make_target(park_name, target_reviews, name=f"{gu_short}_{park_name}"))
+    return targets
+
+
+def _crawl_one(pool, target, out_dir, timeout, incremental, wait_mode, extract_mode, require_text, save_snapshots):
+    out = os.path.join(out_dir, f"{target['name']}_reviews.csv")
+    snapshot_path = os.path.join(out_dir, "snapshots", f"{target['name']}.html") if save_snapshots else None
+    checkpoint = None
+    if incremental:
+        checkpoint = ReviewCheckpoint(os.path.join(out_dir, "checkpoints", f"{target['name']}.json"), out)
+
+    with pool.acquire() as driver:
+        df = crawl_reviews_by_count(
+            key_words=target["key_words"],
+            place_url=target["place_url"],
+            target_reviews=target["target_reviews"],
+            timeout=timeout,
+            driver=driver,
+            known_review_ids=checkpoint.review_ids.copy() if checkpoint else None,
+            on_batch=checkpoint.commit if checkpoint else None,
+            wait_mode=wait_mode,
+            extract_mode=extract_mode,
+            require_text=require_text,
+            snapshot_path=snapshot_path,
+        )
+
+    if checkpoint:
+        # 스크롤 도중 on_batch로 이미 이어 쓰기 완료
+        return out if os.path.exists(out) else None
+    if df.empty:
+        return None
+    df.to_csv(out, index=False, encoding="utf-8-sig")
+    return out
+
+
+def crawl_parks_parallel(targets, workers=3, out_dir="./data", headless=True, timeout=12, incremental=False,
+                         wait_mode="adaptive", extract_mode="script", require_text=False, save_snapshots=False):
+    """
+    targets: make_target / load_targets로 만든 대상 목록
+    workers: 동시에 띄울 드라이버(=처리 스레드) 수
+    incremental: 공원별 체크포인트를 사용해 새 리뷰만 기존 CSV에 이어 쓰기
+                 (중단되더라도 스크롤마다 저장된 리뷰는 남음)
+    wait_mode: 스크롤 대기 방식 ("adaptive" 또는 "fixed", crawl_reviews_by_count 참고)
+    extract_mode: 카드 추출 방식 ("script" 또는 "element", crawl_reviews_by_count 참고)
+    require_text: 본문이 없는 리뷰 제외
+    save_snapshots: out_dir/snapshots/에 공원별 리뷰 패널 HTML 저장 (replay 모드 입력)
+    반환: {공원 이름: 저장된 파일 경로 또는 None}
+    """
+    os.makedirs(out_dir, exist_ok=True)
+    results = {}
+
+    with DriverPool(size=workers, headless=headless) as pool:
+        with ThreadPoolExecutor(max_workers=workers) as executor:
+            futures = {
+                executor.submit(_crawl_one, pool, target, out_dir, timeout, incremental, wait_mode, extract_mode,
+                                require_text, save_snapshots): target["name"]
+                for target in targets
+            }
+            for i, future in enumerate(as_completed(futures), start=1):
+                name = futures[future]
+                try:
+                    results[name] = future.result()
+                    if results[name]:
+                        print(f"({i}/{len(targets)}) ✅ '{name}' 저장 완료: {results[name]}")
+                    else:
+                        print(f"({i}/{len(targets)}) '{name}' 리뷰가 비어 있어 저장하지 않았습니다.")
+                except Exception as e:
+                    results[name] = None
+                    print(f"({i}/{len(targets)}) !!!!!! '{name}' 크롤링 중 오류 발생: {e}")
+
+    return results
+
+
+def replay_snapshots(html_paths, out_dir="./data", require_text=False):
+    """
+    저장된 리뷰 패널 HTML을 브라우저 없이 다시 파싱해 공원별 *_reviews.csv로 저장
+    (파싱 로직 회귀 테스트, 보관된 페이지 재처리용)
+    반환: {공원 이름: 저장된 파일 경로 또는 None}
+    """
+    os.makedirs(out_dir, exist_ok=True)
+    results = {}
+    for path in html_paths:
+        name = os.path.splitext(os.path.basename(path))[0]
+        start = time.perf_counter()
+        rows = parse_review_file(path, require_text=require_text)
+        elapsed = time.perf_counter() - start
+        if not rows:
+            results[name] = None
+            print(f"'{name}' 리뷰가 비어 있어 저장하지 않았습니다.")
+            continue
+        out = os.path.join(out_dir, f"{name}_reviews.csv")
+        pd.DataFrame(rows).to_csv(out, index=False, encoding="utf-8-sig")
+        results[name] = out
+        print(f"✅ '{name}' {len(rows)}개 리뷰 파싱 ({elapsed:.2f}s): {out}")
+    return results
+
+
+# ============================
+# CLI
+# ============================
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="구글맵 공원 리뷰 크롤러")
+    sub = parser.add_subparsers(dest="command", required=True)
+
+    crawl = sub.add_parser("crawl", help="키워드/URL 목록을 드라이버 풀로 병렬 크롤링")
+    crawl.add_argument("queries", nargs="*", help="장소 URL 또는 검색 키워드 (없으면 --targets 파일 사용)")
+    crawl.add_argument("--targets", default="googlemap_crawling_target_parks.csv", help="gu,park_name 형식의 대상 CSV")
+    crawl.add_argument("--count", type=int, default=1500, help="공원별 목표 리뷰 수")
+    crawl.add_argument("--workers", type=int, default=3, help="동시에 사용할 드라이버 수")
+    crawl.add_argument("--out-dir", default="./data")
+    crawl.add_argument("--timeout", type=int, default=12)
+    crawl.add_argument("--show-browser", action="store_true", help="헤드리스 모드를 끄고 브라우저 창 표시")
+    crawl.add_argument("--wait-mode", choices=["adaptive", "fixed"], default="adaptive")
+    crawl.add_argument("--extract-mode", choices=["script", "element"], default="script")
+    crawl.add_argument("--incremental", action="store_true", help="체크포인트 기준으로 새 리뷰만 이어서 수집")
+    crawl.add_argument("--require-text", action="store_true", help="본문이 없는 리뷰 제외")
+    crawl.add_argument("--save-snapshots", action="store_true", help="리뷰 패널 HTML을 out-dir/snapshots/에 저장")
+
+    replay = sub.add_parser("replay", help="저장된 리뷰 패널 HTML을 브라우저 없이 파싱")
+    replay.add_argument("html_files", nargs="+")
+    replay.add_argument("--out-dir", default="./data")
+    replay.add_argument("--require-text", action="store_true", help="본문이 없는 리뷰 제외")
+
+    args = parser.parse_args(argv)
+
+    if args.command == "replay":
+        replay_snapshots(args.html_files, out_dir=args.out_dir, require_text=args.require_text)
+        return
+
+    if args.queries:
+        targets = [make_target(q, args.count) for q in args.queries]
+    else:
+        targets = load_targets(args.targets, args.count)
+
+    print(f"총 {len(targets)}개 공원을 {args.workers}개 드라이버로 크롤링합니다.")
+    crawl_parks_parallel(
+        targets,
+        workers=args.workers,
+        out_dir=args.out_dir,
+        headless=not args.show_browser,
+        timeout=args.timeout,
+        incremental=args.incremental,
+        wait_mode=args.wait_mode,
+        extract_mode=args.extract_mode,
+        require_text=args.require_text,
+        save_snapshots=args.save_snapshots,
+    )
+    print("\n\n모든 공원에 대한 크롤링 작업이 완료되었습니다.")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,61 @@
+## 저장된 구글맵 리뷰 패널 HTML을 브라우저 없이 파싱 (replay 모드)
+import re
+
+from bs4 import BeautifulSoup
+
+
+# ====================================================================================
+def clean_content(main_content, tag_content):
+    """본문 + 태그(볼드) 결합 후 정리"""
+    full_content = f"{main_content} {tag_content}".strip().replace('\n', ' ')
+    # 불필요 조각(타임코드 등) 제거: "0:06" 같은 패턴
+    return re.sub(r"\b\d{1,2}:\d{2}\b", "", full_content).strip()
+
+
+def _text(card, selector):
+    el = card.select_one(selector)
+    return el.get_text("\n").strip() if el else ""
+
+
+def parse_review_html(html, require_text=False):
+    """
+    리뷰 패널 HTML(스크롤 영역의 outerHTML 등)에서 리뷰 목록 추출
+    셀렉터와 대체 셀렉터는 크롤러(review_crawler)의 추출 로직과 동일하게 유지
+    require_text: 본문(wiI7pd)이 없는 리뷰는 제외
+    반환: 크롤러와 같은 컬럼(리뷰ID, 작성자, 내용, 별점, 작성일)의 dict 리스트
+    """
+    soup = BeautifulSoup(html, "html.parser")
+    rows = []
+    seen = set()
+    for card in soup.select("div[data-review-id]"):
+        review_id = card.get("data-review-id") or ""
+        # 카드 안쪽에 같은 data-review-id를 가진 요소가 중첩되어 있으므로 가장 바깥 카드만 사용
+        if not review_id or review_id in seen:
+            continue
+        seen.add(review_id)
+
+        main_content = _text(card, ".wiI7pd")
+        if require_text and not main_content:
+            continue
+        tag_content = " ".join(t.get_text().strip() for t in card.select(".PBK6be") if t.get_text().strip())
+
+        author = _text(card, ".d4r55") or _text(card, "button[aria-label*='프로필'] > div")
+
+        rating_el = card.select_one(".kvMYJc") or card.select_one("[role='img'][aria-label*='별표']")
+        rating = rating_el.get("aria-label", "") if rating_el else ""
+
+        date_txt = _text(card, ".rsqaWe") or _text(card, "span > time")
+
+        rows.append({
+            "리뷰ID": review_id,
+            "작성자": author,
+            "내용": clean_content(main_content, tag_content),
+            "별점": rating,
+            "작성일": date_txt
+        })
+    return rows
+
+
+def parse_review_file(path, require_text=False):
+    with open(path, "r", encoding="utf-8") as f:
+        return parse_review_html(f.read(), require_text=require_text)
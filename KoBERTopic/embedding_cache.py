@@ -0,0 +1,104 @@
+## 리뷰 임베딩 디스크 캐시 (내용 해시 -> 벡터)
+# 리뷰 문장을 한 번만 인코딩하고, 이후 실행에서는 memory-map된 .npy에서 바로 읽는다.
+# 캐시 구조:
+#   {cache_dir}/shard_00000.npy        float32 (n, dim) 벡터
+#   {cache_dir}/shard_00000.keys.json  각 행의 sha1 키 목록
+import os
+import json
+import hashlib
+
+import numpy as np
+
+from topic_config import EMBEDDING_MODEL
+
+CACHE_DIR = "./bertopic_results/embedding_cache/"
+
+
+# ====================================================================================
+class EmbeddingCache:
+    def __init__(self, cache_dir=CACHE_DIR, model_name=EMBEDDING_MODEL, batch_size=64):
+        # 모델마다 벡터가 다르므로 하위 폴더를 분리
+        self.cache_dir = os.path.join(cache_dir, model_name.replace("/", "__"))
+        self.model_name = model_name
+        self.batch_size = batch_size
+        self._model = None
+        self._index = {}    # key -> (shard 번호, 행 번호)
+        self._shards = []   # memory-map된 shard 배열
+        os.makedirs(self.cache_dir, exist_ok=True)
+        self._load_index()
+
+    @staticmethod
+    def key(text):
+        return hashlib.sha1(text.encode("utf-8")).hexdigest()
+
+    def _shard_paths(self, shard_no):
+        base = os.path.join(self.cache_dir, f"shard_{shard_no:05d}")
+        return base + ".npy", base + ".keys.json"
+
+    def _load_index(self):
+        shard_no = 0
+        while True:
+            npy_path, keys_path = self._shard_paths(shard_no)
+            if not (os.path.exists(npy_path) and os.path.exists(keys_path)):
+                break
+            with open(keys_path, "r", encoding="utf-8") as f:
+                keys = json.load(f)
+            self._shards.append(np.load(npy_path, mmap_mode="r"))
+            for row, k in enumerate(keys):
+                self._index.setdefault(k, (shard_no, row))
+            shard_no += 1
+
+    def _write_shard(self, keys, vectors):
+        shard_no = len(self._shards)
+        npy_path, keys_path = self._shard_paths(shard_no)
+        # 벡터를 먼저 쓰고 키 목록을 나중에 써서, 중간에 끊겨도 불완전한 shard는 무시되도록 함
+        tmp_npy = npy_path + ".tmp.npy"
+        np.save(tmp_npy, vectors.astype(np.float32))
+        os.replace(tmp_npy, npy_path)
+        tmp_keys = keys_path + ".tmp"
+        with open(tmp_keys, "w", encoding="utf-8") as f:
+            json.dump(keys, f)
+        os.replace(tmp_keys, keys_path)
+
+        self._shards.append(np.load(npy_path, mmap_mode="r"))
+        for row, k in enumerate(keys):
+            self._index[k] = (shard_no, row)
+
+    @property
+    def model(self):
+        # 캐시에 없는 문장이 있을 때만 트랜스포머를 불러옴
+        if self._model is None:
+            from sentence_transformers import SentenceTransformer
+            self._model = SentenceTransformer(self.model_name)
+        return self._model
+
+    def __len__(self):
+        return len(self._index)
+
+    def __contains__(self, text):
+        return self.key(text) in self._index
+
+    def encode(self, docs, show_progress_bar=False):
+        """
+        docs 순서대로 (len(docs), dim) 임베딩 반환
+        캐시에 없는 문장만 인코딩하여 새 shard로 저장
+        """
+        keys = [self.key(d) for d in docs]
+        missing = {}
+        for k, d in zip(keys, docs):
+            if k not in self._index and k not in missing:
+                missing[k] = d
+
+        if missing:
+            new_keys = list(missing)
+            vectors = self.model.encode(
+                [missing[k] for k in new_keys],
+                batch_size=self.batch_size,
+                show_progress_bar=show_progress_bar,
+                convert_to_numpy=True,
+            )
+            self._write_shard(new_keys, np.asarray(vectors))
+
+        if not keys:
+            return np.empty((0, 0), dtype=np.float32)
+        return np.stack([self._shards[s][r] for s, r in (self._index[k] for k in keys)]).astype(np.float32)
@@ -0,0 +1,14 @@
+## 리뷰 파일명 -> 공원 이름 (topic_config / review_sentiment 공통)
+# topic_config는 bertopic / umap / Mecab을 불러오므로, 감성 분석처럼 토픽 모델이 필요 없는 스크립트도
+# 같은 규칙을 쓸 수 있게 의존성 없는 모듈로 분리
+import os
+
+REVIEW_SUFFIXES = ('_reviews_dic_cleaned.csv', '_reviews_url_cleaned.csv')
+
+
+def park_name_from_path(file_path):
+    # 파일명에서 공원 이름 추출 (예: '중랑_중랑캠핑숲_reviews_dic_cleaned.csv' -> '중랑_중랑캠핑숲')
+    name = os.path.basename(file_path)
+    for suffix in REVIEW_SUFFIXES:
+        name = name.replace(suffix, '')
+    return name
@@ -0,0 +1,215 @@
+## 리뷰 단위 감성 분석 (긴 리뷰는 겹치는 구간으로 나눠서 모두 반영)
+# sentiment_engine.py의 토픽 단위 분석은 대표 문서를 이어 붙인 뒤 512토큰 이후를 잘라내므로
+# 뒷부분 내용이 점수에 반영되지 않는다. 여기서는
+#   1) measure/NAT/data의 모든 공원 리뷰를 하나의 스트림으로 읽고
+#   2) 리뷰마다 max_length 토큰 구간(stride만큼 겹침)으로 나눈 뒤
+#   3) block_size개 리뷰의 구간을 길이순으로 묶어 배치 추론하고
+#   4) 구간 확률을 토큰 수 가중 평균해서 리뷰 점수로 합친다.
+# 결과는 블록마다 CSV에 이어 쓰므로 메모리 사용량이 블록 크기로 제한되고, 중단 후 이어서 실행할 수 있다.
+# 마지막으로 리뷰 결과를 _document_topics.csv의 토픽과 맞춰 공원 x 토픽 감성을 집계한다.
+import os
+import json
+import glob
+import sqlite3
+import argparse
+
+import numpy as np
+import pandas as pd
+
+from park_names import park_name_from_path
+from sentiment_engine import SentimentEngine, CACHE_PATH, SENTIMENT_DIR
+
+DATA_DIR = "./measure/NAT/data/"
+RESULTS_DIR = "./bertopic_results/"
+REVIEW_OUT = os.path.join(SENTIMENT_DIR, "review_sentiment.csv")
+TOPIC_OUT = os.path.join(SENTIMENT_DIR, "topic_review_sentiment.csv")
+
+
+# ====================================================================================
+def load_topic_ids(park_name, results_dir=RESULTS_DIR):
+    """공원별 _document_topics.csv의 Topic_ID (리뷰 순서와 같음), 없으면 None"""
+    path = os.path.join(results_dir, f"{park_name}_document_topics.csv")
+    if not os.path.exists(path):
+        return None
+    return pd.read_csv(path, usecols=["Topic_ID"])["Topic_ID"].tolist()
+
+
+def iter_reviews(data_dir=DATA_DIR, results_dir=RESULTS_DIR, skip=None):
+    """
+    모든 공원 리뷰를 (Park_nm, Review_idx, Topic_ID, 내용) 순서로 생성
+    Review_idx는 결측 리뷰를 제거한 뒤의 순번 (topic 결과의 행 순서와 동일)
+    """
+    skip = skip or set()
+    for file_path in sorted(glob.glob(os.path.join(data_dir, "*.csv"))):
+        park_name = park_name_from_path(file_path)
+        df = pd.read_csv(file_path, usecols=["내용"]).dropna(subset=["내용"])
+        docs = df["내용"].astype(str).tolist()
+        topic_ids = load_topic_ids(park_name, results_dir)
+        if topic_ids is None or len(topic_ids) != len(docs):
+            topic_ids = [None] * len(docs)  # 토픽 결과가 없거나 리뷰 수가 달라 순서를 맞출 수 없음
+        for idx, (doc, topic) in enumerate(zip(docs, topic_ids)):
+            if (park_name, idx) not in skip:
+                yield park_name, idx, topic, doc
+
+
+class ReviewSentimentScorer:
+    def __init__(self, engine, stride=128, cache_path=CACHE_PATH):
+        self.engine = engine
+        self.tokenizer = engine.tokenizer
+        # 한 구간에 들어갈 본문 토큰 수 (CLS / SEP 등 special token 제외)
+        self.body = engine.max_length - self.tokenizer.num_special_tokens_to_add()
+        self.step = max(1, self.body - stride)
+        self._conn = None
+        if cache_path:
+            self._conn = sqlite3.connect(cache_path)
+            self._conn.execute("CREATE TABLE IF NOT EXISTS review_probs (key TEXT PRIMARY KEY, probs TEXT NOT NULL)")
+
+    def windows(self, text):
+        """리뷰 하나 -> special token이 붙은 구간 input_ids 목록"""
+        ids = self.tokenizer(text, add_special_tokens=False)["input_ids"]
+        starts = range(0, max(len(ids) - self.body, 0) + self.step, self.step)
+        return [self.tokenizer.build_inputs_with_special_tokens(ids[s:s + self.body]) for s in starts]
+
+    def key(self, text):
+        return self.engine.key(f"window:{self.body}:{self.step}\t{text}")
+
+    def _lookup(self, keys):
+        found = {}
+        if self._conn is None:
+            return found
+        unique = list(set(keys))
+        for i in range(0, len(unique), 500):
+            part = unique[i:i + 500]
+            rows = self._conn.execute(
+                f"SELECT key, probs FROM review_probs WHERE key IN ({','.join('?' * len(part))})", part)
+            for k, value in rows:
+                value = json.loads(value)
+                found[k] = (np.array(value["probs"], dtype=np.float32), value["n_windows"])
+        return found
+
+    def score(self, texts):
+        """
+        리뷰 목록 -> (n, 라벨 수) 확률 배열, 구간 수 배열
+        모든 리뷰의 구간을 한 번에 모아서 배치 추론 (캐시에 있는 리뷰는 건너뜀)
+        """
+        keys = [self.key(t) for t in texts]
+        found = self._lookup(keys)
+
+        owners, id_lists, weights = [], [], []
+        pending = {}
+        for k, t in zip(keys, texts):
+            if k in found or k in pending:
+                continue
+            pending[k] = len(pending)
+            for w in self.windows(t):
+                owners.append(pending[k])
+                id_lists.append(w)
+                weights.append(len(w))
+
+        if id_lists:
+            probs = self.engine.predict_proba_ids(id_lists)
+            owners, weights = np.asarray(owners), np.asarray(weights, dtype=np.float32)
+            sums = np.zeros((len(pending), probs.shape[1]), dtype=np.float32)
+            np.add.at(sums, owners, probs * weights[:, None])
+            totals = np.bincount(owners, weights=weights, minlength=len(pending))
+            counts = np.bincount(owners, minlength=len(pending))
+            new_rows = []
+            for k, i in pending.items():
+                found[k] = (sums[i] / totals[i], int(counts[i]))
+                new_rows.append((k, json.dumps({"probs": found[k][0].tolist(), "n_windows": found[k][1]})))
+            if self._conn is not None:
+                with self._conn:
+                    self._conn.executemany("INSERT OR REPLACE INTO review_probs VALUES (?, ?)", new_rows)
+
+        probs = np.stack([found[k][0] for k in keys])
+        n_windows = np.array([found[k][1] for k in keys], dtype=np.int32)
+        return probs, n_windows
+
+
+# ====================================================================================
+def score_reviews(scorer, data_dir=DATA_DIR, results_dir=RESULTS_DIR, out_path=REVIEW_OUT,
+                  block_size=1024, resume=True):
+    """리뷰 단위 결과를 block_size개씩 out_path에 이어 쓰기. 반환: 새로 처리한 리뷰 수"""
+    labels = scorer.engine.labels
+    prob_cols = [f"prob_{label}" for label in labels]
+
+    done = set()
+    if resume and os.path.exists(out_path):
+        saved = pd.read_csv(out_path, usecols=["Park_nm", "Review_idx"])
+        done = set(zip(saved["Park_nm"], saved["Review_idx"]))
+    write_header = not (resume and os.path.exists(out_path))
+
+    def flush(block):
+        nonlocal write_header
+        probs, n_windows = scorer.score([b[3] for b in block])
+        df = pd.DataFrame(block, columns=["Park_nm", "Review_idx", "Topic_ID", "Review"]).drop(columns="Review")
+        df["n_windows"] = n_windows
+        df[prob_cols] = probs
+        best = probs.argmax(axis=1)
+        df["sentiment_label"] = [labels[b] for b in best]
+        df["sentiment_score"] = probs[np.arange(len(best)), best]
+        df.to_csv(out_path, mode="w" if write_header else "a", header=write_header, index=False,
+                  encoding="utf-8-sig" if write_header else "utf-8")
+        write_header = False
+
+    total, block = 0, []
+    for row in iter_reviews(data_dir, results_dir, skip=done):
+        block.append(row)
+        if len(block) >= block_size:
+            flush(block)
+            total += len(block)
+            print(f"리뷰 {total}개 처리")
+            block = []
+    if block:
+        flush(block)
+        total += len(block)
+    print(f"리뷰 단위 감성 분석 완료: 새로 {total}개 (이미 처리 {len(done)}개)")
+    return total
+
+
+def aggregate_topics(review_path=REVIEW_OUT, out_path=TOPIC_OUT, chunksize=50000):
+    """
+    리뷰 결과 -> 공원 x 토픽 평균 확률 (청크 단위 합산이라 전체를 메모리에 올리지 않음)
+    sentiment_label / sentiment_score는 평균 확률이 가장 높은 라벨과 그 확률
+    """
+    sums = None
+    for chunk in pd.read_csv(review_path, chunksize=chunksize):
+        prob_cols = [c for c in chunk.columns if c.startswith("prob_")]
+        chunk = chunk.dropna(subset=["Topic_ID"])
+        part = chunk.groupby(["Park_nm", "Topic_ID"])[prob_cols].agg("sum")
+        part["Count"] = chunk.groupby(["Park_nm", "Topic_ID"]).size()
+        sums = part if sums is None else sums.add(part, fill_value=0)
+
+    if sums is None or sums.empty:
+        print("집계할 토픽 결과가 없습니다.")
+        return None
+    prob_cols = [c for c in sums.columns if c.startswith("prob_")]
+    result = sums[prob_cols].div(sums["Count"], axis=0)
+    result.insert(0, "Count", sums["Count"].astype(int))
+    result["sentiment_label"] = result[prob_cols].idxmax(axis=1).str.replace("prob_", "", regex=False)
+    result["sentiment_score"] = result[prob_cols].max(axis=1)
+    result = result.reset_index().rename(columns={"Topic_ID": "Topic"})
+    result["Topic"] = result["Topic"].astype(int)
+    result.to_csv(out_path, index=False, encoding="utf-8-sig")
+    print(f"Results saved to {out_path}")
+    return result
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="리뷰 단위 감성 분석 (긴 리뷰는 겹치는 구간으로 분할)")
+    parser.add_argument("--data-dir", default=DATA_DIR)
+    parser.add_argument("--results-dir", default=RESULTS_DIR)
+    parser.add_argument("--review-out", default=REVIEW_OUT)
+    parser.add_argument("--topic-out", default=TOPIC_OUT)
+    parser.add_argument("--backend", default="torch", choices=["torch", "int8", "onnx"])
+    parser.add_argument("--batch-size", type=int, default=32)
+    parser.add_argument("--threads", type=int, default=None)
+    parser.add_argument("--stride", type=int, default=128, help="구간끼리 겹치는 토큰 수")
+    parser.add_argument("--block-size", type=int, default=1024, help="한 번에 처리 / 저장할 리뷰 수")
+    parser.add_argument("--restart", action="store_true", help="기존 결과를 무시하고 처음부터")
+    args = parser.parse_args()
+
+    engine = SentimentEngine(backend=args.backend, batch_size=args.batch_size, num_threads=args.threads)
+    scorer = ReviewSentimentScorer(engine, stride=args.stride)
+    score_reviews(scorer, args.data_dir, args.results_dir, args.review_out, args.block_size, resume=not args.restart)
+    aggregate_topics(args.review_out, args.topic_out)
@@ -0,0 +1,177 @@
+## 토픽 문서 감성 분석 (bertopic_results/sentiment/sentiment_results.ipynb의 배치 버전)
+# - pipeline 대신 토크나이저 / 모델을 직접 호출: 토큰 길이가 비슷한 문서끼리 묶어서 패딩 낭비를 줄임
+# - 배치 크기 / torch 스레드 수를 명시적으로 지정
+# - 같은 문장은 다시 계산하지 않도록 텍스트 해시 -> (라벨, 점수)를 SQLite에 캐시
+# - backend: "torch"(기본) / "int8"(torch dynamic quantization) / "onnx"(optimum + onnxruntime)
+# 출력 컬럼(sentiment_label, sentiment_score)은 노트북과 동일하므로
+# final_sentiment_analysis_results.csv를 그대로 대체할 수 있다.
+import os
+import ast
+import sqlite3
+import hashlib
+import argparse
+
+import numpy as np
+import pandas as pd
+
+MODEL_NAME = "alsgyu/sentiment-analysis-fine-tuned-model"
+SENTIMENT_DIR = "./bertopic_results/sentiment/"
+CACHE_PATH = "./bertopic_results/sentiment/sentiment_cache.sqlite"
+
+# 라벨 매핑 (노트북과 동일)
+label_mapping = {"LABEL_0": "부정", "LABEL_1": "중립", "LABEL_2": "긍정"}
+
+
+# ====================================================================================
+def join_docs(docs_field):
+    """각 행의 Representative_Docs를 합쳐 문서 1개로 만듦 (리스트 또는 리스트 문자열)"""
+    docs = docs_field if isinstance(docs_field, (list, tuple, np.ndarray)) else ast.literal_eval(docs_field)
+    return " ".join([t for t in docs if isinstance(t, str) and t.strip()])
+
+
+class SentimentEngine:
+    def __init__(self, model_name=MODEL_NAME, backend="torch", batch_size=32, num_threads=None,
+                 max_length=512, cache_path=CACHE_PATH):
+        import torch
+        from transformers import AutoTokenizer
+
+        if num_threads:
+            torch.set_num_threads(num_threads)
+        self.model_name = model_name
+        self.backend = backend
+        self.batch_size = batch_size
+        self.tokenizer = AutoTokenizer.from_pretrained(model_name)
+        self.max_length = min(max_length, self.tokenizer.model_max_length)
+        self.model = self._load_model(backend)
+        self.id2label = self.model.config.id2label
+
+        self.cache_path = cache_path
+        self._conn = None
+        if cache_path:
+            os.makedirs(os.path.dirname(cache_path) or ".", exist_ok=True)
+            self._conn = sqlite3.connect(cache_path)
+            self._conn.execute("CREATE TABLE IF NOT EXISTS sentiment "
+                               "(key TEXT PRIMARY KEY, label TEXT NOT NULL, score REAL NOT NULL)")
+
+    def _load_model(self, backend):
+        if backend == "onnx":
+            # 처음 한 번 ONNX로 변환 (optimum[onnxruntime] 필요)
+            from optimum.onnxruntime import ORTModelForSequenceClassification
+            return ORTModelForSequenceClassification.from_pretrained(self.model_name, export=True)
+
+        import torch
+        from transformers import AutoModelForSequenceClassification
+        model = AutoModelForSequenceClassification.from_pretrained(self.model_name).eval()
+        if backend == "int8":
+            # Linear 레이어만 int8로 동적 양자화 (CPU 전용)
+            model = torch.quantization.quantize_dynamic(model, {torch.nn.Linear}, dtype=torch.qint8)
+        elif backend != "torch":
+            raise ValueError(f"지원하지 않는 backend: {backend} (torch / int8 / onnx)")
+        return model
+
+    def key(self, text):
+        # 모델 / backend / 최대 길이가 같아야 같은 결과
+        return hashlib.sha1(f"{self.model_name}\t{self.backend}\t{self.max_length}\t{text}".encode("utf-8")).hexdigest()
+
+    def _lookup(self, keys):
+        found = {}
+        if self._conn is None:
+            return found
+        unique = list(set(keys))
+        for i in range(0, len(unique), 500):
+            part = unique[i:i + 500]
+            rows = self._conn.execute(
+                f"SELECT key, label, score FROM sentiment WHERE key IN ({','.join('?' * len(part))})", part)
+            for k, label, score in rows:
+                found[k] = (label, score)
+        return found
+
+    @property
+    def labels(self):
+        # 확률 벡터의 열 순서에 맞춘 한글 라벨
+        return [label_mapping.get(self.id2label[i], self.id2label[i]) for i in range(len(self.id2label))]
+
+    def predict_proba_ids(self, id_lists):
+        """
+        special token까지 포함된 input_ids 목록 -> (n, 라벨 수) 확률 배열
+        길이순으로 정렬해 batch_size개씩 패딩 후 추론하고 원래 순서로 복원
+        """
+        import torch
+
+        order = np.argsort([len(ids) for ids in id_lists], kind="stable")
+        probs = np.zeros((len(id_lists), len(self.id2label)), dtype=np.float32)
+        with torch.inference_mode():
+            for start in range(0, len(order), self.batch_size):
+                idx = order[start:start + self.batch_size]
+                batch = self.tokenizer.pad({"input_ids": [id_lists[i] for i in idx]}, return_tensors="pt")
+                logits = self.model(**batch).logits
+                probs[idx] = torch.softmax(logits.float(), dim=-1).numpy()
+        return probs
+
+    def _infer(self, texts):
+        """texts -> [(원래 라벨, 점수)] (max_length 이후는 잘라냄, 노트북의 truncation=True와 동일)"""
+        id_lists = self.tokenizer(texts, truncation=True, max_length=self.max_length)["input_ids"]
+        probs = self.predict_proba_ids(id_lists)
+        best = probs.argmax(axis=1)
+        return [(self.id2label[int(b)], float(p[b])) for b, p in zip(best, probs)]
+
+    def predict(self, texts):
+        """
+        texts -> (sentiment_label 리스트, sentiment_score 리스트)
+        캐시에 없는 문장만 모델에 넣음
+        """
+        texts = [str(t) for t in texts]
+        keys = [self.key(t) for t in texts]
+        found = self._lookup(keys)
+
+        missing = {}
+        for k, t in zip(keys, texts):
+            if k not in found and k not in missing:
+                missing[k] = t
+        if missing:
+            new_keys = list(missing)
+            for k, (label, score) in zip(new_keys, self._infer([missing[k] for k in new_keys])):
+                found[k] = (label, score)
+            if self._conn is not None:
+                with self._conn:
+                    self._conn.executemany("INSERT OR REPLACE INTO sentiment VALUES (?, ?, ?)",
+                                           [(k, *found[k]) for k in new_keys])
+
+        labels = [label_mapping.get(found[k][0], found[k][0]) for k in keys]
+        scores = [found[k][1] for k in keys]
+        return labels, scores
+
+
+def score_topics(df, engine, docs_column="Representative_Docs"):
+    """토픽 요약 데이터프레임에 sentiment_label / sentiment_score 컬럼 추가"""
+    texts = df[docs_column].apply(join_docs)
+    df = df.copy()
+    df["sentiment_label"], df["sentiment_score"] = engine.predict(texts.tolist())
+    return df
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="토픽 대표 문서 감성 분석")
+    parser.add_argument("--input", default=os.path.join(SENTIMENT_DIR, "combine_topic_summary_cleaned.csv"),
+                        help="토픽 요약 CSV (Representative_Docs 컬럼 필요)")
+    parser.add_argument("--from-store", action="store_true", help="CSV 대신 topic_store.py 저장소 사용")
+    parser.add_argument("--out", default=os.path.join(SENTIMENT_DIR, "final_sentiment_analysis_results.csv"))
+    parser.add_argument("--backend", default="torch", choices=["torch", "int8", "onnx"])
+    parser.add_argument("--batch-size", type=int, default=32)
+    parser.add_argument("--threads", type=int, default=None, help="torch 스레드 수 (기본: torch 기본값)")
+    parser.add_argument("--no-cache", action="store_true")
+    args = parser.parse_args()
+
+    if args.from_store:
+        from topic_store import load_topic_store
+        df = load_topic_store()
+    else:
+        df = pd.read_csv(args.input)
+
+    engine = SentimentEngine(backend=args.backend, batch_size=args.batch_size, num_threads=args.threads,
+                             cache_path=None if args.no_cache else CACHE_PATH)
+    df = score_topics(df, engine)
+    print(df[["sentiment_label", "sentiment_score"]].head(20))
+
+    df.to_csv(args.out, index=False, encoding='utf-8-sig')
+    print(f"Results saved to {args.out}")
@@ -0,0 +1,108 @@
+## Mecab 형태소 분석 결과 캐시 (문서 해시 -> 품사 필터링된 토큰 목록)
+# CountVectorizer는 BERTopic 학습 중(nr_topics='auto' 토픽 병합 등) 같은 문서를 여러 번 토크나이즈하므로
+# Mecab 결과를 메모리(LRU) + SQLite에 저장해 두고 재사용한다.
+# 불용어는 캐시에 반영하지 않고 꺼낼 때 거르므로, 불용어를 수정해도 Mecab을 다시 돌릴 필요가 없다.
+import os
+import json
+import sqlite3
+import hashlib
+from collections import OrderedDict
+
+TOKEN_CACHE_PATH = "./bertopic_results/token_cache/tokens.sqlite"
+
+
+# ====================================================================================
+class TokenCache:
+    def __init__(self, tagger, allowed_pos, db_path=TOKEN_CACHE_PATH, maxsize=50000):
+        self.tagger = tagger
+        self.allowed_pos = set(allowed_pos)
+        self.db_path = db_path
+        self.maxsize = maxsize
+        self._lru = OrderedDict()
+        # 허용 품사가 바뀌면 다른 결과이므로 키에 포함
+        self._pos_sig = ",".join(sorted(self.allowed_pos))
+        self._conn = None
+
+    @property
+    def conn(self):
+        # 연결은 처음 사용할 때 생성 (프로세스마다 별도 연결)
+        if self._conn is None:
+            os.makedirs(os.path.dirname(self.db_path) or ".", exist_ok=True)
+            self._conn = sqlite3.connect(self.db_path, timeout=30)
+            self._conn.execute("PRAGMA journal_mode=WAL")
+            self._conn.execute("CREATE TABLE IF NOT EXISTS tokens (key TEXT PRIMARY KEY, tokens TEXT NOT NULL)")
+        return self._conn
+
+    def __getstate__(self):
+        # sqlite 연결과 LRU는 복사하지 않음 (CountVectorizer / 모델 pickle 대비)
+        state = self.__dict__.copy()
+        state["_conn"] = None
+        state["_lru"] = OrderedDict()
+        return state
+
+    def key(self, sent):
+        return hashlib.sha1(f"{self._pos_sig}\t{sent}".encode("utf-8")).hexdigest()
+
+    def _remember(self, key, tokens):
+        self._lru[key] = tokens
+        self._lru.move_to_end(key)
+        if len(self._lru) > self.maxsize:
+            self._lru.popitem(last=False)
+
+    def _tag(self, sent):
+        # 품사 / 길이 조건만 적용 (불용어는 CustomTokenizer에서)
+        return [word for word, pos in self.tagger.pos(sent) if pos in self.allowed_pos and len(word) > 1]
+
+    def tokens(self, sent):
+        """문서 하나의 품사 필터링 토큰 (LRU -> SQLite -> Mecab 순서로 조회)"""
+        key = self.key(sent)
+        if key in self._lru:
+            self._lru.move_to_end(key)
+            return self._lru[key]
+
+        row = self.conn.execute("SELECT tokens FROM tokens WHERE key = ?", (key,)).fetchone()
+        if row is not None:
+            tokens = json.loads(row[0])
+        else:
+            tokens = self._tag(sent)
+            with self.conn:
+                self.conn.execute("INSERT OR REPLACE INTO tokens VALUES (?, ?)",
+                                  (key, json.dumps(tokens, ensure_ascii=False)))
+        self._remember(key, tokens)
+        return tokens
+
+    def tokens_many(self, sents, chunk=500):
+        """
+        여러 문서를 한 번에 처리: SQLite는 chunk개씩 묶어 조회하고,
+        캐시에 없는 문서만 Mecab으로 분석한 뒤 한 트랜잭션으로 저장
+        반환: sents와 같은 순서의 토큰 목록 리스트
+        """
+        keys = [self.key(s) for s in sents]
+        found = {k: self._lru[k] for k in keys if k in self._lru}
+
+        lookup = list({k for k in keys if k not in found})
+        for i in range(0, len(lookup), chunk):
+            part = lookup[i:i + chunk]
+            placeholders = ",".join("?" * len(part))
+            for k, tokens in self.conn.execute(f"SELECT key, tokens FROM tokens WHERE key IN ({placeholders})", part):
+                found[k] = json.loads(tokens)
+
+        new_rows = []
+        for k, s in zip(keys, sents):
+            if k not in found:
+                found[k] = self._tag(s)
+                new_rows.append((k, json.dumps(found[k], ensure_ascii=False)))
+        if new_rows:
+            with self.conn:
+                self.conn.executemany("INSERT OR REPLACE INTO tokens VALUES (?, ?)", new_rows)
+
+        for k in keys:
+            self._remember(k, found[k])
+        return [found[k] for k in keys]
+
+    def warm(self, docs, lowercase=True):
+        """
+        학습 전에 문서들을 미리 캐시에 올려 둠
+        CountVectorizer는 기본적으로 소문자로 바꾼 뒤 토크나이저를 호출하므로 같은 형태로 저장
+        """
+        self.tokens_many([d.lower() if lowercase else d for d in docs])
@@ -0,0 +1,75 @@
+## 전체 공원 BERTopic 일괄 실행 (임베딩 캐시 사용)
+# 리뷰 임베딩은 embedding_cache에서 읽고, BERTopic에는 embeddings=로 직접 넘긴다.
+# 불용어나 CountVectorizer 설정만 바꿔서 다시 돌릴 때는 트랜스포머를 전혀 불러오지 않는다.
+import argparse
+
+from tqdm import tqdm
+
+from topic_config import (DATA_DIR, OUTPUT_DIR, list_park_files, park_name_from_path, load_park_docs,
+                          make_tokenizer, make_topic_model, save_topic_results)
+from embedding_cache import CACHE_DIR, EmbeddingCache
+
+
+# ====================================================================================
+def encode_all_parks(files, cache):
+    """모든 공원의 리뷰를 한 번에 캐시에 인코딩 (이미 있는 문장은 건너뜀)"""
+    all_docs = []
+    for file_path in files:
+        all_docs.extend(load_park_docs(file_path))
+    before = len(cache)
+    cache.encode(all_docs, show_progress_bar=True)
+    print(f"임베딩 캐시: 새로 인코딩 {len(cache) - before}개 / 전체 {len(cache)}개")
+
+
+def fit_park(file_path, cache, tokenizer, output_dir=OUTPUT_DIR, min_docs=100):
+    """
+    공원 하나의 BERTopic 학습 및 결과 저장
+    반환: 저장된 경로 dict (리뷰 수 부족 시 None)
+    """
+    park_name = park_name_from_path(file_path)
+    docs = load_park_docs(file_path)
+
+    # 리뷰 수가 너무 적으면 토픽 모델링이 의미 없으므로 건너뛰기
+    if len(docs) < min_docs:
+        print(f"⚠️ {park_name}: 리뷰 수가 {min_docs}개 미만이므로 분석을 건너뜁니다. (리뷰 수: {len(docs)}개)")
+        return None
+
+    embeddings = cache.encode(docs)
+    tokenizer.warm(docs)
+    model = make_topic_model(tokenizer, embedding_model=None)
+    topics, _ = model.fit_transform(docs, embeddings=embeddings)
+    return save_topic_results(model, docs, topics, park_name, output_dir)
+
+
+def run_batch(data_dir=DATA_DIR, output_dir=OUTPUT_DIR, cache_dir=CACHE_DIR, min_docs=100):
+    files = list_park_files(data_dir)
+    print(f"총 {len(files)}개의 공원 데이터를 분석합니다.")
+
+    cache = EmbeddingCache(cache_dir)
+    encode_all_parks(files, cache)
+
+    tokenizer = make_tokenizer()
+    results = {}
+    for file_path in tqdm(files, desc="전체 공원 분석 진행률"):
+        park_name = park_name_from_path(file_path)
+        try:
+            results[park_name] = fit_park(file_path, cache, tokenizer, output_dir, min_docs)
+            if results[park_name]:
+                print(f"✅ {park_name} 저장 완료: {results[park_name]['summary']}")
+        except Exception as e:
+            results[park_name] = None
+            print(f"⚠️ {park_name} 처리 중 오류 발생: {e}")
+
+    print(f"\n{'='*25} 모든 공원 분석 완료 {'='*25}")
+    return results
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="전체 공원 BERTopic 일괄 실행")
+    parser.add_argument("--data-dir", default=DATA_DIR)
+    parser.add_argument("--output-dir", default=OUTPUT_DIR)
+    parser.add_argument("--cache-dir", default=CACHE_DIR)
+    parser.add_argument("--min-docs", type=int, default=100, help="이보다 리뷰가 적은 공원은 건너뜀")
+    args = parser.parse_args()
+
+    run_batch(args.data_dir, args.output_dir, args.cache_dir, args.min_docs)
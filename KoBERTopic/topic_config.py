@@ -0,0 +1,170 @@
+## 토픽 모델링 공통 설정 (불용어, 토크나이저, BERTopic 구성, 결과 저장)
+import os
+import shutil
+
+import pandas as pd
+import stopwordsiso as stopwords  # ✅ 불용어 패키지
+from konlpy.tag import Mecab
+from sklearn.feature_extraction.text import CountVectorizer
+from bertopic import BERTopic
+from umap import UMAP
+
+from park_names import park_name_from_path  # noqa: F401  (topic_batch / topic_global / topic_parallel에서 사용)
+from token_cache import TOKEN_CACHE_PATH, TokenCache
+
+DATA_DIR = "./measure/NAT/data/"
+OUTPUT_DIR = "./bertopic_results/"
+EMBEDDING_MODEL = "sentence-transformers/xlm-r-100langs-bert-base-nli-stsb-mean-tokens"
+MECAB_PATH = "/opt/homebrew/Cellar/mecab-ko-dic/2.1.1-20180720/lib/mecab/dic/mecab-ko-dic"
+
+# 1. 한국어 불용어 불러오기
+stopwords_ko = stopwords.stopwords("ko")
+
+# 2. 추가 불용어 (존댓말, 의미 없는 단어 등)
+extra_stopwords = {
+    "아요", "어요","입니다","예요","네요","같아요","거에요","거예요","습니다",
+    "그리고","가장","정말","진짜","너무", "는데", "어서", "다는", "이렇게",
+    "여소", "달리", "^^", "~^^", "거나", "합니다", "로운", "끼리", "면서",
+    "to", "1988", "88", "마다", "지요", "중국", "시킬", "아닌", "한때",
+    "신영복", "든다", "원하", "비축", "기지", "마시", "면서", "방사장", "어서",
+    "다면", "나갈", "터도", "이러", "군요", "아서", "01", "으러", "인데",
+    "은데", "아주", "데리", "나오", "", "정도", "요즘", "오랜만", "자체",
+    "짱개", "듬뿍", "울산", "매우", "많이", "그렇", "가운데", "레이", "그냥", "슬슬",
+    "직접", "활짝", "시작", "이파", "신발", "포원", "물끼", "무소", "메기", "접이식", "차시", "우동", "더불",
+    "당시", "배우", "제일", "아직", "도중", "그리", "리모", "취하",
+    '비올', '수많', '해치', '사울', '너무나', '중간', '가끔', '한눈',
+    '그나마'
+}
+
+# 3. 도메인 불용어 (리뷰마다 반복되는 단어)
+domain_stopwords = {"한강","공원", "서울", "서울시", "도산", "율현", "길동", "허브천문", "북서울꿈의숲", "방화", "서울식물원",
+                    "우장산", "관악산", "서울대공원", "아차산", "어린이대공원", "고척", "푸른수목원", "금천체육공원", "금천폭포공원",
+                    "불암산", "수락산", "서울창포원", "배봉산근린공원", "용두근린공원", "국립서울현충원", "보라매공원", "경의선숲길공원", "문화비축기지",
+                    "서대문독립공원", "매헌시민의숲", "청계산매봉", "달맞이공원", "서울숲공원", "천장산", "석촌호수공원", "올림픽공원", "서서울호수공원",
+                    "파리공원", "선유도공원", "여의도공원", "용산가족공원", "효창공원", "구파발폭포", "낙산공원", "인왕산", "남산공원",
+                    "서울로7017", "사가정공원", "중랑캠핑숲", "중랑가족캠핑장", "강서한강공원", "광나루한강공원", "난지한강공원", "뚝섬한강공원", "망원한강공원",
+                    "반포한강공원", "양화한강공원", "여의도한강공원", "이촌한강공원", "잠실한강공원", "잠원한강공원", "북한산국립공원", "북한산",
+                    "구로구", "식생", "라떼", "더욱", "항동", "히기", "시대", "살짝", "고리", "수지"}
+
+# 4. 최종 불용어 집합
+stopwords_ko = stopwords_ko.union(extra_stopwords).union(domain_stopwords)
+
+
+# --- 토크나이저 ---
+class CustomTokenizer:
+    def __init__(self, tagger, stopwords, cache_path=None):
+        self.tagger = tagger
+        self.stopwords = stopwords
+        # allowed_pos를 조금 넓혀봄 (형용사, 부사까지 추가 가능)
+        self.allowed_pos = {"NNG", "NNP", "VV", "VA", "MAG"}  # 일반부사(MAG) 추가
+        # cache_path가 있으면 Mecab 결과를 token_cache에 저장해 두고 재사용
+        self.cache = TokenCache(tagger, self.allowed_pos, cache_path) if cache_path else None
+
+    def __call__(self, sent):
+        if self.cache is not None:
+            return [word for word in self.cache.tokens(sent) if word not in self.stopwords]
+        tokens = []
+        for word, pos in self.tagger.pos(sent):
+            if pos in self.allowed_pos and word not in self.stopwords and len(word) > 1:
+                tokens.append(word)
+        return tokens
+
+    def tokenize_many(self, sents):
+        """여러 문서를 한 번에 토크나이즈 (캐시 사용 시 SQLite 조회 / 저장을 묶어서 처리)"""
+        if self.cache is None:
+            return [self(s) for s in sents]
+        return [[word for word in tokens if word not in self.stopwords] for tokens in self.cache.tokens_many(sents)]
+
+    def warm(self, docs):
+        # CountVectorizer 호출 전에 문서들을 미리 캐시에 올려 둠
+        if self.cache is not None:
+            self.cache.warm(docs)
+
+
+def make_tokenizer(cache_path=TOKEN_CACHE_PATH):
+    """cache_path=None이면 캐시 없이 매번 Mecab 실행"""
+    return CustomTokenizer(Mecab(dicpath=MECAB_PATH), stopwords=stopwords_ko, cache_path=cache_path)
+
+
+# ====================================================================================
+# BERTopic 구성 (모든 공원에 동일한 하이퍼파라미터 적용)
+def make_topic_model(tokenizer, embedding_model=EMBEDDING_MODEL, min_df=2, verbose=False, umap_n_jobs=1,
+                     hdbscan_n_jobs=None):
+    """
+    embedding_model=None이면 임베딩을 fit_transform(embeddings=...)으로 직접 넘겨야 하며,
+    이 경우 트랜스포머 모델을 전혀 불러오지 않음
+    hdbscan_n_jobs: HDBSCAN core distance 계산 스레드 수 (None이면 BERTopic 기본값 그대로)
+    """
+    vectorizer = CountVectorizer(tokenizer=tokenizer, max_features=3000, min_df=min_df, max_df=0.85)
+    umap_model = UMAP(n_neighbors=15, n_components=5, min_dist=0.0,
+                      metric='cosine', random_state=42, n_jobs=umap_n_jobs)
+    hdbscan_model = None
+    if hdbscan_n_jobs is not None:
+        from hdbscan import HDBSCAN
+        # BERTopic 기본 HDBSCAN 설정과 동일, 스레드 수만 제한
+        hdbscan_model = HDBSCAN(min_cluster_size=10, metric='euclidean', cluster_selection_method='eom',
+                                prediction_data=True, core_dist_n_jobs=hdbscan_n_jobs)
+    return BERTopic(
+        embedding_model=embedding_model,
+        vectorizer_model=vectorizer,
+        umap_model=umap_model,
+        hdbscan_model=hdbscan_model,
+        nr_topics='auto',
+        top_n_words=10,
+        calculate_probabilities=True,
+        verbose=verbose
+    )
+
+
+def list_park_files(data_dir=DATA_DIR):
+    return sorted(os.path.join(data_dir, f) for f in os.listdir(data_dir) if f.endswith(".csv"))
+
+
+def load_park_docs(file_path):
+    df = pd.read_csv(file_path)
+    df.dropna(subset=['내용'], inplace=True)
+    return df['내용'].astype(str).tolist()
+
+
+def write_csv_atomic(df, path):
+    # 임시 파일에 다 쓴 뒤 교체 -> 중간에 끊겨도 이전 결과 파일은 그대로 남음
+    tmp_path = path + ".tmp"
+    df.to_csv(tmp_path, index=False, encoding='utf-8-sig')
+    os.replace(tmp_path, path)
+
+
+def save_model_atomic(model, path):
+    # safetensors 저장은 폴더이므로 임시 폴더에 저장 후 이름 변경
+    tmp_path = path + ".tmp"
+    shutil.rmtree(tmp_path, ignore_errors=True)
+    model.save(tmp_path, serialization="safetensors", save_embedding_model=EMBEDDING_MODEL)
+    if os.path.isdir(path):
+        old_path = path + ".old"
+        shutil.rmtree(old_path, ignore_errors=True)
+        os.replace(path, old_path)
+        os.replace(tmp_path, path)
+        shutil.rmtree(old_path, ignore_errors=True)
+    else:
+        os.replace(tmp_path, path)
+
+
+def save_topic_results(model, docs, topics, park_name, output_dir=OUTPUT_DIR):
+    """
+    _topic_summary.csv / _document_topics.csv / .bertopic 저장 (각각 임시 경로에 쓴 뒤 교체)
+    반환: 저장된 경로 dict
+    """
+    os.makedirs(output_dir, exist_ok=True)
+
+    # 토픽 요약 정보
+    summary_filepath = os.path.join(output_dir, f"{park_name}_topic_summary.csv")
+    write_csv_atomic(model.get_topic_info(), summary_filepath)
+
+    # 원본 리뷰 + 할당된 토픽 ID
+    detailed_filepath = os.path.join(output_dir, f"{park_name}_document_topics.csv")
+    write_csv_atomic(pd.DataFrame({'Review': docs, 'Topic_ID': topics}), detailed_filepath)
+
+    # 학습된 모델 (임베딩 모델은 이름만 기록)
+    model_filepath = os.path.join(output_dir, f"{park_name}.bertopic")
+    save_model_atomic(model, model_filepath)
+
+    return {"summary": summary_filepath, "documents": detailed_filepath, "model": model_filepath}
@@ -0,0 +1,154 @@
+## 서울시 전체 리뷰로 BERTopic 하나를 학습하고 공원별로 토픽 할당
+# 공원마다 따로 학습하면 토픽 ID가 서로 달라서 combine.py / keyword.py에서 Representation 문자열로 맞춰야 했다.
+# 여기서는 모든 공원 리뷰로 모델 하나를 학습하고, 각 공원 리뷰는 transform(캐시된 임베딩)으로만 할당하므로
+# 모든 공원이 같은 토픽 ID를 공유한다.
+# 새 리뷰가 들어오면 update_city_model()로 새 리뷰만 작은 모델로 학습해 기존 모델과 merge_models로 합친다.
+# (기존 토픽 ID는 유지되고, 새로 생긴 토픽만 뒤에 추가됨)
+#
+# 결과 ({output_dir}/city/):
+#   city.bertopic               전체 모델
+#   city_topic_summary.csv      토픽 요약 (get_topic_info)
+#   city_document_topics.csv    Park_nm / Review / Topic_ID
+#   city_park_topics.csv        공원별 토픽 리뷰 수 (Park_nm / Topic / Count / Name / Representation)
+import os
+import argparse
+
+import pandas as pd
+from bertopic import BERTopic
+
+from topic_config import (DATA_DIR, OUTPUT_DIR, list_park_files, park_name_from_path, load_park_docs,
+                          make_tokenizer, make_topic_model, write_csv_atomic, save_model_atomic)
+from embedding_cache import CACHE_DIR, EmbeddingCache
+
+
+# ====================================================================================
+def city_paths(output_dir=OUTPUT_DIR):
+    city_dir = os.path.join(output_dir, "city")
+    return {
+        "dir": city_dir,
+        "model": os.path.join(city_dir, "city.bertopic"),
+        "summary": os.path.join(city_dir, "city_topic_summary.csv"),
+        "documents": os.path.join(city_dir, "city_document_topics.csv"),
+        "park_topics": os.path.join(city_dir, "city_park_topics.csv"),
+    }
+
+
+def load_all_docs(data_dir=DATA_DIR):
+    """모든 공원 리뷰를 Park_nm / Review 데이터프레임 하나로"""
+    frames = []
+    for file_path in list_park_files(data_dir):
+        docs = load_park_docs(file_path)
+        frames.append(pd.DataFrame({"Park_nm": park_name_from_path(file_path), "Review": docs}))
+    if not frames:
+        return pd.DataFrame(columns=["Park_nm", "Review"])
+    return pd.concat(frames, ignore_index=True)
+
+
+def park_topic_counts(model, doc_df):
+    """공원 x 토픽 리뷰 수 (토픽 이름 / 키워드 포함)"""
+    counts = doc_df.groupby(["Park_nm", "Topic_ID"]).size().reset_index(name="Count")
+    counts = counts.rename(columns={"Topic_ID": "Topic"})
+    info = model.get_topic_info()[["Topic", "Name", "Representation"]]
+    return counts.merge(info, on="Topic", how="left").sort_values(["Park_nm", "Count"], ascending=[True, False])
+
+
+def _save_city(model, doc_df, paths):
+    os.makedirs(paths["dir"], exist_ok=True)
+    write_csv_atomic(model.get_topic_info(), paths["summary"])
+    write_csv_atomic(doc_df, paths["documents"])
+    write_csv_atomic(park_topic_counts(model, doc_df), paths["park_topics"])
+    save_model_atomic(model, paths["model"])
+
+
+def assign_topics(model, docs, cache):
+    """학습 없이 캐시된 임베딩으로 토픽만 할당"""
+    if not docs:
+        return []
+    topics, _ = model.transform(docs, embeddings=cache.encode(docs))
+    return list(topics)
+
+
+# ====================================================================================
+def fit_city_model(data_dir=DATA_DIR, output_dir=OUTPUT_DIR, cache_dir=CACHE_DIR, min_df=5):
+    """
+    전체 리뷰로 모델 하나 학습 후 공원별 결과 저장
+    반환: (model, Park_nm / Review / Topic_ID 데이터프레임)
+    """
+    doc_df = load_all_docs(data_dir)
+    docs = doc_df["Review"].tolist()
+    print(f"전체 {doc_df['Park_nm'].nunique()}개 공원, 리뷰 {len(docs)}개로 통합 모델 학습")
+
+    cache = EmbeddingCache(cache_dir)
+    embeddings = cache.encode(docs, show_progress_bar=True)
+    tokenizer = make_tokenizer()
+    tokenizer.warm(docs)
+
+    # 문서 수가 많으므로 min_df를 높이고, 공원별 할당은 토픽 ID만 필요하므로 확률 계산은 생략
+    model = make_topic_model(tokenizer, embedding_model=None, min_df=min_df, verbose=True)
+    model.calculate_probabilities = False
+    topics, _ = model.fit_transform(docs, embeddings=embeddings)
+
+    doc_df["Topic_ID"] = topics
+    _save_city(model, doc_df, city_paths(output_dir))
+    print(f"✅ 통합 모델 저장 완료: 토픽 {len(model.get_topic_info())}개")
+    return model, doc_df
+
+
+def update_city_model(data_dir=DATA_DIR, output_dir=OUTPUT_DIR, cache_dir=CACHE_DIR,
+                      min_new_docs=100, min_similarity=0.7):
+    """
+    새 리뷰만 반영하는 증분 업데이트 (partial_fit 대용)
+    - 새 리뷰가 min_new_docs개 이상이면 새 리뷰만으로 작은 모델을 학습해 merge_models로 합침
+      (기존 토픽과 min_similarity 이상 비슷한 토픽은 기존 ID로 흡수, 나머지는 새 ID로 추가)
+    - 적으면 기존 토픽에 transform으로만 할당
+    """
+    paths = city_paths(output_dir)
+    if not os.path.exists(paths["model"]):
+        print("통합 모델이 없어 새로 학습합니다.")
+        return fit_city_model(data_dir, output_dir, cache_dir)
+
+    old_df = pd.read_csv(paths["documents"])
+    all_df = load_all_docs(data_dir)
+    known = set(zip(old_df["Park_nm"], old_df["Review"].astype(str)))
+    is_new = [(p, r) not in known for p, r in zip(all_df["Park_nm"], all_df["Review"])]
+    new_df = all_df[is_new].copy()
+    if new_df.empty:
+        print("새 리뷰가 없습니다.")
+        return None, old_df
+
+    cache = EmbeddingCache(cache_dir)
+    new_docs = new_df["Review"].tolist()
+    cache.encode(new_docs, show_progress_bar=True)
+    tokenizer = make_tokenizer()
+    tokenizer.warm(new_docs)
+
+    model = BERTopic.load(paths["model"])
+    if len(new_docs) >= min_new_docs:
+        new_model = make_topic_model(tokenizer, embedding_model=None)
+        new_model.calculate_probabilities = False
+        new_model.fit(new_docs, embeddings=cache.encode(new_docs))
+        n_before = len(model.get_topic_info())
+        model = BERTopic.merge_models([model, new_model], min_similarity=min_similarity)
+        print(f"새 리뷰 {len(new_docs)}개로 모델 병합: 토픽 {n_before}개 -> {len(model.get_topic_info())}개")
+    else:
+        print(f"새 리뷰 {len(new_docs)}개 (< {min_new_docs}) -> 기존 토픽에 할당만 합니다.")
+
+    new_df["Topic_ID"] = assign_topics(model, new_docs, cache)
+    doc_df = pd.concat([old_df, new_df], ignore_index=True)
+    _save_city(model, doc_df, paths)
+    return model, doc_df
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="서울시 전체 통합 BERTopic 모델")
+    parser.add_argument("mode", choices=["fit", "update"], help="fit: 전체 재학습 / update: 새 리뷰만 반영")
+    parser.add_argument("--data-dir", default=DATA_DIR)
+    parser.add_argument("--output-dir", default=OUTPUT_DIR)
+    parser.add_argument("--cache-dir", default=CACHE_DIR)
+    parser.add_argument("--min-new-docs", type=int, default=100, help="update 시 새 모델을 학습할 최소 새 리뷰 수")
+    args = parser.parse_args()
+
+    if args.mode == "fit":
+        fit_city_model(args.data_dir, args.output_dir, args.cache_dir)
+    else:
+        update_city_model(args.data_dir, args.output_dir, args.cache_dir, args.min_new_docs)
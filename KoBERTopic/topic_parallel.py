@@ -0,0 +1,136 @@
+## 공원별 BERTopic 병렬 실행 (프로세스 풀)
+# 공원마다 모델이 독립적이므로 여러 프로세스에 나눠서 학습한다.
+# - 임베딩은 부모 프로세스에서 embedding_cache에 먼저 채워 두고, 워커는 캐시(mmap)만 읽음
+# - 워커마다 torch / numba(UMAP) / BLAS / HDBSCAN 스레드 수를 제한해 코어 과다 점유를 막음
+# - 리뷰가 많은 공원부터 제출해서 전체 소요 시간이 가장 오래 걸리는 공원 하나에 가깝도록 함
+# 주의: 이 모듈은 워커에서 스레드 설정을 먼저 한 뒤 무거운 라이브러리를 불러오도록
+#       topic_config / embedding_cache를 함수 안에서만 import 한다.
+import os
+import time
+import argparse
+import multiprocessing as mp
+from concurrent.futures import ProcessPoolExecutor, as_completed
+
+DATA_DIR = "./measure/NAT/data/"
+OUTPUT_DIR = "./bertopic_results/"
+CACHE_DIR = "./bertopic_results/embedding_cache/"
+
+THREAD_ENV_VARS = ("OMP_NUM_THREADS", "MKL_NUM_THREADS", "OPENBLAS_NUM_THREADS",
+                   "NUMEXPR_NUM_THREADS", "VECLIB_MAXIMUM_THREADS", "NUMBA_NUM_THREADS")
+
+
+# ====================================================================================
+def plan_workers(n_tasks, workers=None, threads_per_worker=None):
+    """
+    (프로세스 수, 프로세스당 스레드 수) 결정
+    두 값의 곱이 CPU 코어 수를 넘지 않도록 맞춤
+    """
+    cpu = os.cpu_count() or 1
+    if workers is None:
+        workers = cpu if threads_per_worker is None else cpu // threads_per_worker
+    workers = max(1, min(workers, n_tasks, cpu))
+    if threads_per_worker is None:
+        threads_per_worker = cpu // workers
+    return workers, max(1, threads_per_worker)
+
+
+def _init_worker(n_threads):
+    # 라이브러리 import 전에 환경변수로 스레드 수 고정
+    for var in THREAD_ENV_VARS:
+        os.environ[var] = str(n_threads)
+    os.environ["TOKENIZERS_PARALLELISM"] = "false"
+    try:
+        import torch
+        torch.set_num_threads(n_threads)
+    except ImportError:
+        pass
+    try:
+        import numba
+        numba.set_num_threads(n_threads)
+    except (ImportError, ValueError):
+        pass
+
+
+_worker_state = {}
+
+
+def _fit_one(file_path, cache_dir, output_dir, min_docs, n_threads):
+    from topic_config import park_name_from_path, load_park_docs, make_tokenizer, make_topic_model, save_topic_results
+    from embedding_cache import EmbeddingCache
+
+    # 토크나이저(Mecab)와 캐시 인덱스는 워커마다 한 번만 생성
+    if "cache" not in _worker_state:
+        _worker_state["cache"] = EmbeddingCache(cache_dir)
+        _worker_state["tokenizer"] = make_tokenizer()
+    cache, tokenizer = _worker_state["cache"], _worker_state["tokenizer"]
+
+    start = time.perf_counter()
+    park_name = park_name_from_path(file_path)
+    docs = load_park_docs(file_path)
+    if len(docs) < min_docs:
+        return park_name, None, len(docs), time.perf_counter() - start
+
+    embeddings = cache.encode(docs)
+    tokenizer.warm(docs)
+    model = make_topic_model(tokenizer, embedding_model=None, umap_n_jobs=n_threads, hdbscan_n_jobs=n_threads)
+    topics, _ = model.fit_transform(docs, embeddings=embeddings)
+    paths = save_topic_results(model, docs, topics, park_name, output_dir)
+    return park_name, paths, len(docs), time.perf_counter() - start
+
+
+def run_parallel(data_dir=DATA_DIR, output_dir=OUTPUT_DIR, cache_dir=CACHE_DIR, min_docs=100,
+                 workers=None, threads_per_worker=None):
+    """
+    전체 공원 병렬 학습
+    반환: {공원명: 저장 경로 dict 또는 None}
+    """
+    from topic_config import list_park_files
+    from topic_batch import encode_all_parks
+    from embedding_cache import EmbeddingCache
+
+    files = list_park_files(data_dir)
+    # 파일 크기(≈리뷰 수) 내림차순으로 제출 -> 큰 공원이 마지막에 남아 혼자 도는 상황 방지
+    files.sort(key=os.path.getsize, reverse=True)
+    workers, n_threads = plan_workers(len(files), workers, threads_per_worker)
+    print(f"총 {len(files)}개 공원 / 프로세스 {workers}개 x 스레드 {n_threads}개")
+
+    # 트랜스포머 인코딩은 부모 프로세스에서 한 번만 (워커는 모델을 불러오지 않음)
+    encode_all_parks(files, EmbeddingCache(cache_dir))
+
+    start = time.perf_counter()
+    results = {}
+    ctx = mp.get_context("spawn")  # torch / numba 스레드 풀을 fork로 복제하지 않도록
+    with ProcessPoolExecutor(max_workers=workers, mp_context=ctx,
+                             initializer=_init_worker, initargs=(n_threads,)) as pool:
+        futures = {pool.submit(_fit_one, f, cache_dir, output_dir, min_docs, n_threads): f for f in files}
+        for i, future in enumerate(as_completed(futures), 1):
+            file_path = futures[future]
+            try:
+                park_name, paths, n_docs, elapsed = future.result()
+            except Exception as e:
+                park_name = os.path.basename(file_path)
+                results[park_name] = None
+                print(f"[{i}/{len(files)}] ⚠️ {park_name} 처리 중 오류 발생: {e}")
+                continue
+            results[park_name] = paths
+            if paths is None:
+                print(f"[{i}/{len(files)}] ⚠️ {park_name}: 리뷰 수 {n_docs}개 (< {min_docs}) 건너뜀")
+            else:
+                print(f"[{i}/{len(files)}] ✅ {park_name} ({n_docs}개 리뷰, {elapsed:.1f}s)")
+
+    print(f"\n{'='*25} 모든 공원 분석 완료 ({time.perf_counter() - start:.1f}s) {'='*25}")
+    return results
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="전체 공원 BERTopic 병렬 실행")
+    parser.add_argument("--data-dir", default=DATA_DIR)
+    parser.add_argument("--output-dir", default=OUTPUT_DIR)
+    parser.add_argument("--cache-dir", default=CACHE_DIR)
+    parser.add_argument("--min-docs", type=int, default=100, help="이보다 리뷰가 적은 공원은 건너뜀")
+    parser.add_argument("--workers", type=int, default=None, help="프로세스 수 (기본: CPU 코어 수)")
+    parser.add_argument("--threads-per-worker", type=int, default=None, help="프로세스당 스레드 수")
+    args = parser.parse_args()
+
+    run_parallel(args.data_dir, args.output_dir, args.cache_dir, args.min_docs,
+                 args.workers, args.threads_per_worker)
@@ -0,0 +1,147 @@
+## 저장된 .bertopic(safetensors) 모델 레지스트리
+# 새 리뷰가 어느 토픽에 속하는지 물을 때마다 BERTopic.load()로 임베딩 모델까지 다시 불러오지 않도록
+# - topic_embeddings.safetensors는 numpy memmap으로 열고 (헤더만 직접 파싱)
+# - topics.json에서 토픽 이름만 읽고
+# - 임베딩 모델(SentenceTransformer)은 모든 공원이 하나를 공유한다.
+# 공원 모델은 처음 조회할 때 불러오고, maxsize개를 넘으면 가장 오래 안 쓴 것부터 내린다.
+# 토픽 할당은 BERTopic.transform(저장된 모델)과 같은 방식: 토픽 임베딩과의 코사인 유사도 argmax
+# bertopic / umap import 비용도 피하기 위해 topic_config는 불러오지 않는다.
+import os
+import json
+import struct
+import argparse
+from collections import OrderedDict
+
+import numpy as np
+import pandas as pd
+
+OUTPUT_DIR = "./bertopic_results/"
+EMBEDDING_MODEL = "sentence-transformers/xlm-r-100langs-bert-base-nli-stsb-mean-tokens"
+SAFETENSORS_DTYPES = {"F32": np.float32, "F64": np.float64, "F16": np.float16}
+
+
+# ====================================================================================
+def mmap_safetensors(path):
+    """safetensors 파일의 텐서들을 복사 없이 memmap으로 반환 {이름: 배열}"""
+    with open(path, "rb") as f:
+        header_len = struct.unpack("<Q", f.read(8))[0]
+        header = json.loads(f.read(header_len))
+    tensors = {}
+    for name, meta in header.items():
+        if name == "__metadata__":
+            continue
+        start, end = meta["data_offsets"]
+        dtype = SAFETENSORS_DTYPES[meta["dtype"]]
+        tensors[name] = np.memmap(path, dtype=dtype, mode="r", offset=8 + header_len + start,
+                                  shape=tuple(meta["shape"]))
+        if tensors[name].nbytes != end - start:
+            raise ValueError(f"{path}: '{name}' 텐서 크기가 헤더와 다릅니다.")
+    return tensors
+
+
+class ParkTopics:
+    """공원 하나의 토픽 임베딩 + 토픽 이름"""
+    def __init__(self, model_dir):
+        self.model_dir = model_dir
+        with open(os.path.join(model_dir, "topics.json"), "r", encoding="utf-8") as f:
+            topics = json.load(f)
+        with open(os.path.join(model_dir, "config.json"), "r", encoding="utf-8") as f:
+            self.embedding_model = json.load(f).get("embedding_model")
+
+        self.embeddings = mmap_safetensors(os.path.join(model_dir, "topic_embeddings.safetensors"))["topic_embeddings"]
+        self.norms = np.linalg.norm(self.embeddings, axis=1)
+        # 토픽 임베딩 i번째 행 = 토픽 (i - _outliers), -1(노이즈) 토픽이 있으면 0번 행
+        self.outliers = int(topics.get("_outliers", 0))
+        labels = topics.get("custom_labels") or topics.get("topic_labels", {})
+        if isinstance(labels, list):
+            labels = {str(i - self.outliers): label for i, label in enumerate(labels)}
+        self.labels = {int(k): v for k, v in labels.items()}
+
+    def nearest(self, query, query_norms=None):
+        """query: (n, dim) 임베딩 -> (토픽 ID 배열, 코사인 유사도 배열)"""
+        if query_norms is None:
+            query_norms = np.linalg.norm(query, axis=1)
+        sims = (query @ self.embeddings.T) / (np.outer(query_norms, self.norms) + 1e-12)
+        best = sims.argmax(axis=1)
+        return best - self.outliers, sims[np.arange(len(best)), best]
+
+
+class TopicRegistry:
+    def __init__(self, results_dir=OUTPUT_DIR, maxsize=16, embedding_model=EMBEDDING_MODEL):
+        self.results_dir = results_dir
+        self.maxsize = maxsize
+        self.embedding_model = embedding_model
+        self._encoder = None
+        self._loaded = OrderedDict()
+        self._paths = self._scan()
+
+    def _scan(self):
+        # {공원명: 모델 폴더}, 통합 모델(city/city.bertopic)은 "city"로 등록
+        paths = {}
+        if os.path.isdir(self.results_dir):
+            for name in sorted(os.listdir(self.results_dir)):
+                if name.endswith(".bertopic"):
+                    paths[name[:-len(".bertopic")]] = os.path.join(self.results_dir, name)
+        city_path = os.path.join(self.results_dir, "city", "city.bertopic")
+        if os.path.isdir(city_path):
+            paths["city"] = city_path
+        return paths
+
+    def parks(self):
+        return list(self._paths)
+
+    @property
+    def encoder(self):
+        # 모든 공원이 공유하는 임베딩 모델 (처음 인코딩할 때만 불러옴)
+        if self._encoder is None:
+            from sentence_transformers import SentenceTransformer
+            self._encoder = SentenceTransformer(self.embedding_model)
+        return self._encoder
+
+    def get(self, park_name):
+        if park_name in self._loaded:
+            self._loaded.move_to_end(park_name)
+            return self._loaded[park_name]
+        if park_name not in self._paths:
+            raise KeyError(f"'{park_name}' 모델을 찾을 수 없습니다. ({self.results_dir})")
+
+        topics = ParkTopics(self._paths[park_name])
+        if topics.embedding_model and topics.embedding_model != self.embedding_model:
+            raise ValueError(f"'{park_name}' 모델의 임베딩 모델({topics.embedding_model})이 "
+                             f"레지스트리({self.embedding_model})와 다릅니다.")
+        self._loaded[park_name] = topics
+        if len(self._loaded) > self.maxsize:
+            self._loaded.popitem(last=False)
+        return topics
+
+    def encode(self, reviews, batch_size=64):
+        return np.asarray(self.encoder.encode(list(reviews), batch_size=batch_size, convert_to_numpy=True))
+
+    def assign(self, park_name, reviews, embeddings=None):
+        """
+        새 리뷰들의 토픽 할당
+        embeddings를 넘기면 인코딩을 건너뜀 (여러 공원에 같은 리뷰를 물어볼 때 재사용)
+        반환: Review / Topic_ID / Name / Similarity 데이터프레임
+        """
+        reviews = list(reviews)
+        topics = self.get(park_name)
+        if embeddings is None:
+            embeddings = self.encode(reviews)
+        topic_ids, sims = topics.nearest(embeddings)
+        return pd.DataFrame({
+            "Review": reviews,
+            "Topic_ID": topic_ids,
+            "Name": [topics.labels.get(int(t), "") for t in topic_ids],
+            "Similarity": sims,
+        })
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="저장된 공원 토픽 모델로 새 리뷰 토픽 할당")
+    parser.add_argument("park", help="공원명 (예: 강남_도산공원) 또는 city")
+    parser.add_argument("reviews", nargs="+", help="할당할 리뷰 문장")
+    parser.add_argument("--results-dir", default=OUTPUT_DIR)
+    args = parser.parse_args()
+
+    registry = TopicRegistry(args.results_dir)
+    print(registry.assign(args.park, args.reviews).to_string(index=False))
@@ -0,0 +1,148 @@
+## 공원별 _topic_summary.csv 통합 저장소 (Parquet)
+# combine.py처럼 매번 모든 요약 CSV를 다시 읽지 않고, 저장소보다 새로 바뀐 요약 파일만 다시 읽어서 갱신한다.
+# Representation / Representative_Docs는 문자열이 아니라 리스트 컬럼으로 저장하므로
+# 이후 단계(키워드 빈도, 감성 분석, 생태·경관 점수)에서 ast.literal_eval을 반복할 필요가 없다.
+#
+# 저장소 ({results_dir}/topic_summary.parquet):
+#   Park_nm / Topic / Count / Name / Representation(list) / Representative_Docs(list)
+#   파일별 수정 시각은 topic_summary.manifest.json에 기록
+import os
+import re
+import ast
+import json
+import argparse
+
+import pandas as pd
+
+RESULTS_DIR = "./bertopic_results/"
+STORE_NAME = "topic_summary.parquet"
+MANIFEST_NAME = "topic_summary.manifest.json"
+SUMMARY_SUFFIX = "_topic_summary.csv"
+# 공원별 요약은 '{구}_{공원}_topic_summary.csv' (combine_ / city_ 같은 통합 요약 파일은 제외)
+PARK_SUMMARY_PATTERN = re.compile(r"^[^_]+_.+" + re.escape(SUMMARY_SUFFIX) + "$")
+COMBINED_PREFIXES = ("combine_", "city_")
+LIST_COLUMNS = ["Representation", "Representative_Docs"]
+COLUMNS = ["Park_nm", "Topic", "Count", "Name"] + LIST_COLUMNS
+
+
+# ====================================================================================
+def is_park_summary(filename):
+    return bool(PARK_SUMMARY_PATTERN.match(filename)) and not filename.startswith(COMBINED_PREFIXES)
+
+
+def park_name_from_summary(filename):
+    # '중구_남산공원_reviews_url_cleaned.csv_topic_summary.csv' 처럼 원본 파일명이 섞인 경우도 공원명만 남김
+    name = filename[:-len(SUMMARY_SUFFIX)]
+    return re.sub(r"_reviews_\w+_cleaned(\.csv)?$", "", name)
+
+
+def _to_list(value):
+    if isinstance(value, list):
+        return value
+    if not isinstance(value, str) or not value:
+        return []
+    try:
+        parsed = ast.literal_eval(value)
+    except (ValueError, SyntaxError):
+        return []
+    return [str(v) for v in parsed] if isinstance(parsed, (list, tuple)) else []
+
+
+def read_summary(file_path, park_name):
+    """요약 CSV 하나 -> 저장소 형식 (리스트 컬럼은 파일을 새로 읽을 때 한 번만 파싱)"""
+    df = pd.read_csv(file_path)
+    df = df.drop(columns="Park_nm", errors="ignore")   # 이미 공원명 컬럼이 있는 파일이어도 파일명 기준으로 통일
+    df.insert(0, "Park_nm", park_name)
+    for col in LIST_COLUMNS:
+        df[col] = df[col].map(_to_list) if col in df.columns else [[] for _ in range(len(df))]
+    return df.reindex(columns=COLUMNS)
+
+
+def store_paths(results_dir=RESULTS_DIR):
+    return os.path.join(results_dir, STORE_NAME), os.path.join(results_dir, MANIFEST_NAME)
+
+
+def build_topic_store(results_dir=RESULTS_DIR, force=False):
+    """
+    저장소 갱신 후 전체 데이터프레임 반환
+    - 새로 생기거나 수정 시각이 바뀐 요약 파일만 다시 읽음
+    - 사라진 요약 파일의 공원은 저장소에서도 제거
+    """
+    store_path, manifest_path = store_paths(results_dir)
+    summaries = {f: os.path.getmtime(os.path.join(results_dir, f))
+                 for f in os.listdir(results_dir) if is_park_summary(f)}
+
+    manifest, store = {}, pd.DataFrame(columns=COLUMNS)
+    if not force and os.path.exists(store_path) and os.path.exists(manifest_path):
+        with open(manifest_path, "r", encoding="utf-8") as f:
+            manifest = json.load(f)
+        store = pd.read_parquet(store_path)
+        for col in LIST_COLUMNS:
+            store[col] = store[col].map(list)
+
+    changed = [f for f, mtime in summaries.items() if manifest.get(f) != mtime]
+    removed = [f for f in manifest if f not in summaries]
+    if not changed and not removed:
+        return store
+
+    # 바뀐 공원의 기존 행을 지우고 새로 읽은 행으로 교체
+    stale = {park_name_from_summary(f) for f in changed + removed}
+    frames = [store[~store["Park_nm"].isin(stale)]]
+    for f in sorted(changed):
+        frames.append(read_summary(os.path.join(results_dir, f), park_name_from_summary(f)))
+    store = pd.concat(frames, ignore_index=True).sort_values(["Park_nm", "Topic"], ignore_index=True)
+
+    tmp_path = store_path + ".tmp"
+    store.to_parquet(tmp_path, index=False)
+    os.replace(tmp_path, store_path)
+    with open(manifest_path + ".tmp", "w", encoding="utf-8") as f:
+        json.dump(summaries, f, ensure_ascii=False)
+    os.replace(manifest_path + ".tmp", manifest_path)
+    print(f"토픽 저장소 갱신: 다시 읽은 파일 {len(changed)}개, 제거 {len(removed)}개 -> 전체 {len(store)}행")
+    return store
+
+
+def load_topic_store(results_dir=RESULTS_DIR, refresh=True):
+    """감성 분석 / 생태·경관 점수 등 이후 단계에서 쓰는 진입점"""
+    if refresh:
+        return build_topic_store(results_dir)
+    store = pd.read_parquet(store_paths(results_dir)[0])
+    for col in LIST_COLUMNS:
+        store[col] = store[col].map(list)
+    return store
+
+
+# ====================================================================================
+def keyword_counts(store, exclude_noise=True, by_park=False):
+    """
+    Representation 리스트 컬럼을 explode해서 키워드 빈도 계산 (keyword.py 대체)
+    by_park=True면 공원별 빈도
+    """
+    df = store[store["Topic"] != -1] if exclude_noise else store
+    keys = ["Park_nm", "Keyword"] if by_park else ["Keyword"]
+    words = df[["Park_nm", "Representation"]].explode("Representation").dropna(subset=["Representation"])
+    words = words.rename(columns={"Representation": "Keyword"})
+    counts = words.groupby(keys).size().reset_index(name="Frequency")
+    return counts.sort_values(keys[:-1] + ["Frequency"], ascending=[True] * (len(keys) - 1) + [False],
+                              ignore_index=True)
+
+
+def to_summary_csv(store, path):
+    """예전 combine_topic_summary.csv 형식으로 내보내기 (리스트 컬럼은 문자열로)"""
+    out = store.copy()
+    for col in LIST_COLUMNS:
+        out[col] = out[col].map(str)
+    out.to_csv(path, index=False, encoding='utf-8-sig')
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="공원별 토픽 요약 통합 저장소 갱신")
+    parser.add_argument("--results-dir", default=RESULTS_DIR)
+    parser.add_argument("--force", action="store_true", help="모든 요약 파일을 다시 읽음")
+    parser.add_argument("--csv", default=None, help="combine_topic_summary.csv 형식으로도 저장할 경로")
+    args = parser.parse_args()
+
+    store = build_topic_store(args.results_dir, force=args.force)
+    if args.csv:
+        to_summary_csv(store, args.csv)
+    print(f"{store['Park_nm'].nunique()}개 공원, {len(store)}개 토픽")
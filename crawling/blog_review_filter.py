@@ -0,0 +1,66 @@
+## 네이버 블로그 리뷰 필터링 (4.filter_naver_blog_reviews.ipynb의 스트리밍 버전)
+# 키워드 목록을 정규식 하나로 컴파일하고, CSV를 청크 단위로 읽어
+# 유지할 행과 제거할 행(매칭된 키워드 포함)을 각각 다른 파일에 이어 쓴다.
+import re
+import argparse
+
+import pandas as pd
+
+strict_irrelevant_keywords = [
+    "임대", "부동산", "사무실", "월세", "상가",
+    "왁싱", "의료", "클리닉",
+    "분양", "아파트", "오피스텔", "분양권",
+    "택배", "쇼핑몰", "브랜드", "리뷰어", "체험단"
+]
+
+
+# ====================================================================================
+def build_keyword_pattern(keywords):
+    """
+    키워드 목록 -> 컴파일된 정규식 하나
+    긴 키워드를 먼저 두어 '분양권'처럼 다른 키워드를 포함하는 단어가 우선 매칭되도록 함
+    """
+    unique = sorted(set(k for k in keywords if k), key=len, reverse=True)
+    if not unique:
+        raise ValueError("필터링할 키워드가 없습니다.")
+    return re.compile("(" + "|".join(re.escape(k) for k in unique) + ")")
+
+
+def iter_filtered_chunks(csv_path, keywords, column="content", chunksize=20000):
+    """
+    CSV를 chunksize 행씩 읽으면서 (kept, dropped) 데이터프레임 쌍을 생성
+    dropped에는 처음 매칭된 키워드가 matched_keyword 컬럼으로 추가됨
+    """
+    pattern = build_keyword_pattern(keywords)
+    for chunk in pd.read_csv(csv_path, chunksize=chunksize):
+        matched = chunk[column].fillna("").astype(str).str.extract(pattern, expand=False)
+        is_dropped = matched.notna()
+        dropped = chunk[is_dropped].assign(matched_keyword=matched[is_dropped])
+        yield chunk[~is_dropped], dropped
+
+
+def filter_blog_reviews(csv_path, kept_path, dropped_path, keywords=strict_irrelevant_keywords,
+                        column="content", chunksize=20000):
+    """필터링 결과를 청크마다 이어 쓰기. 반환: (전체 행 수, 유지 행 수)"""
+    total = kept_total = 0
+    for i, (kept, dropped) in enumerate(iter_filtered_chunks(csv_path, keywords, column, chunksize)):
+        mode, header = ("w", True) if i == 0 else ("a", False)
+        kept.to_csv(kept_path, mode=mode, header=header, index=False)
+        dropped.to_csv(dropped_path, mode=mode, header=header, index=False)
+        total += len(kept) + len(dropped)
+        kept_total += len(kept)
+    return total, kept_total
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="관련 없는 블로그 리뷰 제거")
+    parser.add_argument("--input", default="naver_blog_reviews.csv")
+    parser.add_argument("--kept", default="naver_blog_reviews_filtered.csv")
+    parser.add_argument("--dropped", default="naver_blog_reviews_dropped.csv")
+    parser.add_argument("--column", default="content")
+    parser.add_argument("--chunksize", type=int, default=20000)
+    args = parser.parse_args()
+
+    total, kept = filter_blog_reviews(args.input, args.kept, args.dropped, column=args.column, chunksize=args.chunksize)
+    print(f"필터링 전: {total}개 → 필터링 후: {kept}개")
+    print(f"필터링된 결과 저장 완료: {args.kept} (제거된 행: {args.dropped})")
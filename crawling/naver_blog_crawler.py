@@ -0,0 +1,216 @@
+## 네이버 블로그 리뷰 크롤러
+# - Selenium은 검색 결과 페이지에서 포스트 URL만 수집
+# - 포스트 본문은 asyncio + aiohttp로 동시에 HTTP 요청 (커넥션 풀, 호스트별 요청 간격, 재시도)
+import time
+import random
+import asyncio
+import argparse
+from collections import defaultdict
+from urllib.parse import urlparse, parse_qs
+
+import aiohttp
+import pandas as pd
+from bs4 import BeautifulSoup
+from selenium import webdriver
+from selenium.webdriver.common.by import By
+from selenium.webdriver.chrome.service import Service
+from selenium.webdriver.chrome.options import Options
+from selenium.webdriver.support.ui import WebDriverWait
+from selenium.webdriver.support import expected_conditions as EC
+from selenium.common.exceptions import TimeoutException
+from webdriver_manager.chrome import ChromeDriverManager
+
+# 1. 기본 설정 (3.seoul_parks_naver_blog_crawler.ipynb와 동일)
+SEARCH_QUERY_PATH = "search_query_list.csv"
+RESULT_CSV_PATH = "naver_blog_reviews.csv"
+MAX_POSTS_PER_QUERY = 20
+MIN_CONTENT_LENGTH = 1000
+SEARCH_URL = "https://section.blog.naver.com/Search/Post.naver?pageNo={page}&rangeType=ALL&orderBy=sim&keyword={query}"
+
+HEADERS = {
+    "User-Agent": ("Mozilla/5.0 (Macintosh; Intel Mac OS X 10_15_7) AppleWebKit/537.36 "
+                   "(KHTML, like Gecko) Chrome/124.0 Safari/537.36"),
+    "Accept-Language": "ko-KR,ko;q=0.9",
+}
+
+
+# ====================================================================================
+# 1) Selenium: 검색 결과에서 포스트 URL 수집
+def collect_post_links(queries, pages_per_query=1, headless=True, timeout=10):
+    """
+    검색어별 포스트 링크 목록 수집
+    반환: [{"search_query", "title", "href"}, ...]
+    """
+    options = Options()
+    if headless:
+        options.add_argument("--headless=new")
+    options.add_argument("--disable-gpu")
+    options.add_argument("--no-sandbox")
+    driver = webdriver.Chrome(service=Service(ChromeDriverManager().install()), options=options)
+
+    links = []
+    try:
+        wait = WebDriverWait(driver, timeout)
+        for i, query in enumerate(queries):
+            found = 0
+            for page in range(1, pages_per_query + 1):
+                driver.get(SEARCH_URL.format(page=page, query=query))
+                try:
+                    # 고정 대기 대신 검색 결과 링크가 렌더링되는 즉시 진행
+                    wait.until(EC.presence_of_element_located((By.CSS_SELECTOR, "a.desc_inner")))
+                except TimeoutException:
+                    break
+                for a in driver.find_elements(By.CSS_SELECTOR, "a.desc_inner"):
+                    href = a.get_attribute("href")
+                    if href:
+                        links.append({"search_query": query, "title": a.text, "href": href})
+                        found += 1
+            print(f"{i+1}/{len(queries)} 링크 수집: {query} -> {found}개")
+    finally:
+        driver.quit()
+    return links
+
+
+# ====================================================================================
+# 2) aiohttp: 포스트 본문 동시 수집
+def to_post_view_url(href):
+    """
+    블로그 포스트 URL을 iframe(mainFrame) 안의 본문 페이지 URL로 변환
+    blog.naver.com/{blogId}/{logNo} -> blog.naver.com/PostView.naver?blogId=..&logNo=..
+    """
+    parsed = urlparse(href)
+    if parsed.netloc.endswith("blog.naver.com"):
+        qs = parse_qs(parsed.query)
+        if "blogId" in qs and "logNo" in qs:
+            blog_id, log_no = qs["blogId"][0], qs["logNo"][0]
+        else:
+            parts = [p for p in parsed.path.split("/") if p]
+            if len(parts) < 2 or not parts[1].isdigit():
+                return href
+            blog_id, log_no = parts[0], parts[1]
+        return f"https://blog.naver.com/PostView.naver?blogId={blog_id}&logNo={log_no}"
+    return href
+
+
+def parse_post(html):
+    """본문 / 작성일 추출 (노트북의 Selenium 셀렉터와 동일)"""
+    soup = BeautifulSoup(html, "html.parser")
+    content_elements = soup.select("div.se-main-container, div#postViewArea")
+    content_text = "\n".join(e.get_text("\n", strip=True) for e in content_elements).strip()
+    date_el = soup.select_one("span.se_publishDate, span.date")
+    date_text = date_el.get_text(strip=True) if date_el else ""
+    return content_text, date_text
+
+
+class HostRateLimiter:
+    """호스트별 최소 요청 간격(min_interval초) 보장"""
+    def __init__(self, min_interval=0.05):
+        self.min_interval = min_interval
+        self._locks = defaultdict(asyncio.Lock)
+        self._last = defaultdict(float)
+
+    async def wait(self, host):
+        async with self._locks[host]:
+            delay = self._last[host] + self.min_interval - time.monotonic()
+            if delay > 0:
+                await asyncio.sleep(delay)
+            self._last[host] = time.monotonic()
+
+
+async def fetch_html(session, url, limiter, retries=3, backoff=1.0):
+    """429/5xx/네트워크 오류는 지수 백오프로 재시도"""
+    host = urlparse(url).netloc
+    for attempt in range(retries + 1):
+        await limiter.wait(host)
+        try:
+            async with session.get(url) as resp:
+                if resp.status == 200:
+                    return await resp.text()
+                if resp.status != 429 and resp.status < 500:
+                    return None
+        except (aiohttp.ClientError, asyncio.TimeoutError):
+            pass
+        if attempt < retries:
+            await asyncio.sleep(backoff * (2 ** attempt) + random.random() * 0.5)
+    return None
+
+
+async def fetch_posts(links, concurrency=16, per_host_interval=0.05, retries=3, timeout=15):
+    """
+    links: collect_post_links 결과
+    concurrency: 동시에 진행할 요청 수 (커넥션 풀 크기)
+    per_host_interval: 같은 호스트에 대한 요청 간 최소 간격(초)
+    반환: links와 같은 순서의 (본문, 작성일) 리스트 (실패 시 본문은 "")
+    """
+    limiter = HostRateLimiter(per_host_interval)
+    semaphore = asyncio.Semaphore(concurrency)
+    connector = aiohttp.TCPConnector(limit=concurrency, ttl_dns_cache=300)
+    client_timeout = aiohttp.ClientTimeout(total=timeout)
+
+    async with aiohttp.ClientSession(connector=connector, timeout=client_timeout, headers=HEADERS) as session:
+        async def fetch_one(link):
+            url = to_post_view_url(link["href"])
+            async with semaphore:
+                html = await fetch_html(session, url, limiter, retries=retries)
+            if html is None:
+                return "", ""
+            return parse_post(html)
+
+        return await asyncio.gather(*(fetch_one(link) for link in links))
+
+
+# ====================================================================================
+def crawl_naver_blog(queries, max_posts=MAX_POSTS_PER_QUERY, concurrency=16, per_host_interval=0.05,
+                     pages_per_query=1, headless=True, min_length=MIN_CONTENT_LENGTH):
+    """
+    검색어 목록 전체를 크롤링해 노트북과 같은 컬럼의 DataFrame 반환
+    (search_query, title, content, date, blog_url, park_name)
+    """
+    start = time.perf_counter()
+    links = collect_post_links(queries, pages_per_query=pages_per_query, headless=headless)
+    print(f"포스트 링크 {len(links)}개 수집 ({time.perf_counter() - start:.1f}s)")
+
+    start = time.perf_counter()
+    fetched = asyncio.run(fetch_posts(links, concurrency=concurrency, per_host_interval=per_host_interval))
+    print(f"본문 {len(fetched)}개 요청 완료 ({time.perf_counter() - start:.1f}s, 동시 요청 {concurrency})")
+
+    results = []
+    counts = defaultdict(int)
+    for link, (content, date) in zip(links, fetched):
+        query = link["search_query"]
+        if counts[query] >= max_posts or len(content) < min_length:
+            continue
+        counts[query] += 1
+        results.append({
+            "search_query": query,
+            "title": link["title"],
+            "content": content,
+            "date": date,
+            "blog_url": link["href"],
+            "park_name": query.split()[0],  # 관광지명 추출
+        })
+    return pd.DataFrame(results, columns=["search_query", "title", "content", "date", "blog_url", "park_name"])
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="네이버 블로그 공원 리뷰 크롤링")
+    parser.add_argument("--queries", default=SEARCH_QUERY_PATH, help="search_query 컬럼이 있는 CSV")
+    parser.add_argument("--out", default=RESULT_CSV_PATH)
+    parser.add_argument("--max-posts", type=int, default=MAX_POSTS_PER_QUERY, help="검색어별 저장할 최대 포스트 수")
+    parser.add_argument("--pages", type=int, default=1, help="검색어별 검색 결과 페이지 수")
+    parser.add_argument("--concurrency", type=int, default=16, help="동시 HTTP 요청 수")
+    parser.add_argument("--per-host-interval", type=float, default=0.05, help="같은 호스트 요청 간 최소 간격(초)")
+    parser.add_argument("--show-browser", action="store_true")
+    args = parser.parse_args()
+
+    queries = pd.read_csv(args.queries)["search_query"].tolist()
+    df = crawl_naver_blog(
+        queries,
+        max_posts=args.max_posts,
+        concurrency=args.concurrency,
+        per_host_interval=args.per_host_interval,
+        pages_per_query=args.pages,
+        headless=not args.show_browser,
+    )
+    df.to_csv(args.out, index=False)
+    print(len(df))
@@ -0,0 +1,187 @@
+## 공원 x 반경 x 날짜 x 시간대 접근성 큐브
+# 생활인구 캐시(population_ingest.py)의 시간대별 인구로 아래 배열을 미리 계산해서 .npy(memmap)로 저장한다.
+#   total_pop[p, r, d, h]  반경 안 생활인구합
+#   wsum[p, r, d, h]       반경 안 (생활인구 × 거리) 합
+#   near_cnt[p, r, d]      반경 안에서 그 날짜에 데이터가 있는 행정동 수
+# 합계로 저장하므로 어떤 날짜 / 시간대 구간이든 wsum 합 / total_pop 합으로
+# 그 구간의 인구가중 평균거리를 바로 구할 수 있다. (예: 주말 저녁 = 토·일 x 18~22시)
+# 하루 전체(07~22시)로 자르면 accessibility.py / 노트북의 날짜별 결과와 같다.
+#
+# 저장 구조 ({cube_dir}/): axes.json, total_pop.npy, wsum.npy, near_cnt.npy
+import os
+import json
+import argparse
+from pathlib import Path
+from datetime import datetime
+
+import numpy as np
+import pandas as pd
+
+from accessibility import DongIndex, radius_matrices, RADII_M
+from population_ingest import CACHE_DIR, PopulationCache, read_dong_coords
+
+CUBE_DIR = Path("measure/ACC/access_cube")
+
+
+# ====================================================================================
+def build_cube(parks_df, pop_hourly, dongxy, radii=RADII_M, cube_dir=CUBE_DIR):
+    """
+    parks_df: name_raw / lat / lng
+    pop_hourly: stdr_de_id / tmzon_pd_se / code8 / pop (PopulationCache.load())
+    dongxy: code8 / dong_lat / dong_lng
+    """
+    cube_dir = Path(cube_dir)
+    cube_dir.mkdir(parents=True, exist_ok=True)
+
+    index = DongIndex(dongxy)
+    pop_hourly = pop_hourly[pop_hourly["code8"].astype(str).isin(index.position)]
+    dates = sorted(pop_hourly["stdr_de_id"].astype(str).unique())
+    hours = sorted(pop_hourly["tmzon_pd_se"].astype(str).unique())
+
+    # (날짜·시간대 x 행정동) 인구 행렬, 없는 칸은 0
+    table = pop_hourly.pivot_table(index=["stdr_de_id", "tmzon_pd_se"], columns="code8", values="pop", aggfunc="sum")
+    table.columns = table.columns.astype(str)
+    table = table.reindex(index=pd.MultiIndex.from_product([dates, hours]), columns=index.position)
+    pop = table.fillna(0).to_numpy(dtype=np.float64)
+    # (날짜 x 행정동) 그 날짜에 데이터가 있는지
+    present = table.notna().groupby(level=0).any().reindex(dates).to_numpy(dtype=np.float64)
+
+    names = parks_df["name_raw"].astype(str).tolist()
+    plat = parks_df["lat"].to_numpy(dtype=float)
+    plng = parks_df["lng"].to_numpy(dtype=float)
+    shape = (len(names), len(radii), len(dates), len(hours))
+
+    arrays = {
+        "total_pop": np.lib.format.open_memmap(cube_dir / "total_pop.npy.tmp", mode="w+", dtype=np.float64, shape=shape),
+        "wsum": np.lib.format.open_memmap(cube_dir / "wsum.npy.tmp", mode="w+", dtype=np.float64, shape=shape),
+        "near_cnt": np.lib.format.open_memmap(cube_dir / "near_cnt.npy.tmp", mode="w+", dtype=np.int32, shape=shape[:3]),
+    }
+    for ri, (within, weighted) in enumerate(radius_matrices(index, plat, plng, radii).values()):
+        arrays["total_pop"][:, ri] = (within @ pop.T).reshape(len(names), len(dates), len(hours))
+        arrays["wsum"][:, ri] = (weighted @ pop.T).reshape(len(names), len(dates), len(hours))
+        arrays["near_cnt"][:, ri] = within @ present.T
+
+    for arr in arrays.values():
+        arr.flush()
+    names_saved = list(arrays)
+    arrays.clear()   # memmap을 닫은 뒤 교체 (Windows에서는 열린 파일을 바꿀 수 없음)
+    for name in names_saved:
+        os.replace(cube_dir / f"{name}.npy.tmp", cube_dir / f"{name}.npy")
+    axes = {"parks": names, "lat": plat.tolist(), "lng": plng.tolist(),
+            "radii": list(radii), "dates": dates, "hours": hours}
+    with open(cube_dir / "axes.json", "w", encoding="utf-8") as f:
+        json.dump(axes, f, ensure_ascii=False, indent=2)
+    print(f"큐브 저장: 공원 {shape[0]} x 반경 {shape[1]} x 날짜 {shape[2]} x 시간대 {shape[3]} -> {cube_dir}")
+    return AccessCube(cube_dir)
+
+
+class AccessCube:
+    def __init__(self, cube_dir=CUBE_DIR):
+        cube_dir = Path(cube_dir)
+        with open(cube_dir / "axes.json", "r", encoding="utf-8") as f:
+            self.axes = json.load(f)
+        self.total_pop = np.load(cube_dir / "total_pop.npy", mmap_mode="r")
+        self.wsum = np.load(cube_dir / "wsum.npy", mmap_mode="r")
+        self.near_cnt = np.load(cube_dir / "near_cnt.npy", mmap_mode="r")
+        self.parks = np.array(self.axes["parks"])
+        self.radii = np.array(self.axes["radii"])
+        self.dates = np.array(self.axes["dates"])
+        self.hours = np.array(self.axes["hours"])
+        self.weekday = np.array([datetime.strptime(d, "%Y%m%d").weekday() for d in self.dates])
+
+    def date_mask(self, dates=None, weekdays=None):
+        """dates: 날짜 목록 / weekdays: 요일 번호 목록 (월=0 ... 일=6)"""
+        mask = np.ones(len(self.dates), dtype=bool)
+        if dates:
+            mask &= np.isin(self.dates, [str(d) for d in dates])
+        if weekdays is not None:
+            mask &= np.isin(self.weekday, list(weekdays))
+        return mask
+
+    def hour_mask(self, hours=None):
+        if not hours:
+            return np.ones(len(self.hours), dtype=bool)
+        return np.isin(self.hours, [f"{int(h):02d}" for h in hours])
+
+    def window(self, dates=None, hours=None, weekdays=None):
+        """
+        선택한 날짜 x 시간대 구간 전체의 공원 x 반경 접근성
+        인구가중 평균거리 = 구간 내 wsum 합 / total_pop 합
+        """
+        d, h = self.date_mask(dates, weekdays), self.hour_mask(hours)
+        total = self.total_pop[:, :, d][:, :, :, h].sum(axis=(2, 3))
+        wsum = self.wsum[:, :, d][:, :, :, h].sum(axis=(2, 3))
+        with np.errstate(invalid="ignore", divide="ignore"):
+            wavg = np.where(total > 0, wsum / np.where(total > 0, total, 1), np.nan)
+        n_parks, n_radii = total.shape
+        return pd.DataFrame({
+            "공원명": np.repeat(self.parks, n_radii),
+            "반경(m)": np.tile(self.radii, n_parks),
+            "반경내_생활인구합": total.ravel(),
+            "인구가중_평균거리(m)": wavg.ravel(),
+        })
+
+    def daily(self, hours=None, dates=None, weekdays=None):
+        """
+        날짜별 결과 (accessibility.py / 노트북 allradii CSV와 같은 형식, 반경 -> 날짜 -> 공원 순서)
+        final_data_analysis_zscore.ipynb의 POP_FILES 대신 사용할 수 있음
+        """
+        d, h = self.date_mask(dates, weekdays), self.hour_mask(hours)
+        total = self.total_pop[:, :, d][:, :, :, h].sum(axis=3)   # (공원, 반경, 날짜)
+        wsum = self.wsum[:, :, d][:, :, :, h].sum(axis=3)
+        near = np.asarray(self.near_cnt[:, :, d])
+        ok = total > 0
+        with np.errstate(invalid="ignore", divide="ignore"):
+            wavg = np.where(ok, wsum / np.where(ok, total, 1), np.nan)
+
+        # (반경, 날짜, 공원) 순서로 펼침
+        order = (1, 2, 0)
+        n_parks, n_radii, n_dates = total.shape
+        return pd.DataFrame({
+            "날짜": np.tile(np.repeat(self.dates[d], n_parks), n_radii),
+            "공원명": np.tile(self.parks, n_radii * n_dates),
+            "반경(m)": np.repeat(self.radii, n_dates * n_parks),
+            "반경내_행정동수": np.where(ok, near, 0).transpose(order).ravel(),
+            "반경내_생활인구합": np.where(ok, total, 0.0).transpose(order).ravel(),
+            "인구가중_평균거리(m)": wavg.transpose(order).ravel(),
+            "공원_lat": np.tile(self.axes["lat"], n_radii * n_dates),
+            "공원_lng": np.tile(self.axes["lng"], n_radii * n_dates),
+        })
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="공원 접근성 큐브 (공원 x 반경 x 날짜 x 시간대)")
+    sub = parser.add_subparsers(dest="command", required=True)
+
+    p_build = sub.add_parser("build", help="생활인구 캐시로 큐브 생성")
+    p_build.add_argument("--parks", required=True, help="name_raw / lat / lng 컬럼이 있는 공원 CSV")
+    p_build.add_argument("--dong", required=True, help="행정동 좌표 파일 (.csv/.xlsx)")
+    p_build.add_argument("--cache-dir", default=str(CACHE_DIR))
+    p_build.add_argument("--cube-dir", default=str(CUBE_DIR))
+    p_build.add_argument("--radii", type=int, nargs="+", default=RADII_M)
+
+    p_query = sub.add_parser("query", help="날짜 / 시간대 구간 접근성 조회")
+    p_query.add_argument("--cube-dir", default=str(CUBE_DIR))
+    p_query.add_argument("--dates", nargs="+", default=None)
+    p_query.add_argument("--hours", type=int, nargs="+", default=None, help="예: 18 19 20 21 22")
+    p_query.add_argument("--weekend", action="store_true", help="토·일만")
+    p_query.add_argument("--weekday", action="store_true", help="월~금만")
+    p_query.add_argument("--daily", action="store_true", help="날짜별로 출력 (allradii CSV 형식)")
+    p_query.add_argument("--out", default=None)
+    args = parser.parse_args()
+
+    if args.command == "build":
+        pop_hourly = PopulationCache(args.cache_dir).load(by_hour=True)
+        build_cube(pd.read_csv(args.parks), pop_hourly, read_dong_coords(args.dong), args.radii, args.cube_dir)
+    else:
+        cube = AccessCube(args.cube_dir)
+        weekdays = [5, 6] if args.weekend else ([0, 1, 2, 3, 4] if args.weekday else None)
+        if args.daily:
+            result = cube.daily(hours=args.hours, dates=args.dates, weekdays=weekdays)
+        else:
+            result = cube.window(dates=args.dates, hours=args.hours, weekdays=weekdays)
+        if args.out:
+            result.to_csv(args.out, index=False, encoding="utf-8-sig")
+            print("저장:", args.out)
+        else:
+            print(result.to_string(index=False))
@@ -0,0 +1,156 @@
+## 공원 접근성(ACC): 반경 내 생활인구 가중 평균거리 (access_csv_data.ipynb의 compute_popweighted_distance 대체)
+# 노트북은 날짜 x 공원 x 반경마다 모든 행정동과의 거리를 다시 계산했다.
+# 여기서는
+#   1) 행정동 중심점으로 haversine BallTree를 한 번 만들고
+#   2) 모든 공원에 대해 가장 큰 반경으로 query_radius를 한 번만 호출한 뒤
+#   3) 반경별 (공원 x 행정동) 희소 행렬과 (날짜 x 행정동) 인구 행렬의 곱으로
+#      모든 날짜의 반경내 인구합 / 인구가중 평균거리를 한 번에 계산한다.
+# 결과 컬럼과 행 순서(반경 -> 날짜 -> 공원)는 노트북과 동일하다.
+import argparse
+from pathlib import Path
+
+import numpy as np
+import pandas as pd
+from scipy import sparse
+from sklearn.neighbors import BallTree
+
+EARTH_RADIUS_M = 6371000.0
+RADII_M = [500, 1000, 2000]                   # 500m / 1km / 2km
+OUTPUT_DIR = Path("measure/ACC/outputs")
+
+
+# ====================================================================================
+def haversine_vec(lat1_arr, lon1_arr, lat2, lon2):
+    """벡터화 하버사인 거리(m)"""
+    R = EARTH_RADIUS_M
+    lat1 = np.radians(lat1_arr); lon1 = np.radians(lon1_arr)
+    lat2 = np.radians(lat2);     lon2 = np.radians(lon2)
+    dlat = lat2 - lat1
+    dlon = lon2 - lon1
+    a = np.sin(dlat/2)**2 + np.cos(lat1)*np.cos(lat2)*np.sin(dlon/2)**2
+    c = 2 * np.arcsin(np.sqrt(a))
+    return R * c
+
+
+class DongIndex:
+    """행정동 중심점 BallTree (haversine, 라디안 좌표)"""
+    def __init__(self, dong_df, key_col="code8", lat_col="dong_lat", lng_col="dong_lng"):
+        dongs = dong_df.drop_duplicates(subset=[key_col]).reset_index(drop=True)
+        self.keys = dongs[key_col].astype(str).to_numpy()
+        self.position = pd.Index(self.keys)
+        self.coords = np.radians(dongs[[lat_col, lng_col]].to_numpy(dtype=float))
+        self.tree = BallTree(self.coords, metric="haversine")
+
+    def __len__(self):
+        return len(self.keys)
+
+    def neighbors(self, lats, lngs, radius_m):
+        """
+        여러 지점의 반경 내 행정동을 한 번에 조회
+        반환: (지점 번호, 행정동 번호, 거리(m)) 평탄화 배열
+        """
+        points = np.radians(np.column_stack([lats, lngs]).astype(float))
+        ind, dist = self.tree.query_radius(points, r=radius_m / EARTH_RADIUS_M, return_distance=True)
+        owner = np.repeat(np.arange(len(points)), [len(i) for i in ind])
+        if len(owner) == 0:
+            return owner, np.array([], dtype=int), np.array([], dtype=float)
+        return owner, np.concatenate(ind), np.concatenate(dist) * EARTH_RADIUS_M
+
+    def pop_matrix(self, pop_agg_df, date_col="stdr_de_id", key_col="code8", pop_col="pop"):
+        """
+        (날짜 x 행정동) 인구 행렬과 해당 날짜에 행정동 데이터가 있는지 여부 행렬
+        반환: (날짜 배열, 인구 행렬, 존재 행렬)
+        """
+        table = pop_agg_df.pivot_table(index=date_col, columns=key_col, values=pop_col, aggfunc="sum")
+        table.columns = table.columns.astype(str)
+        table = table.reindex(columns=self.position)
+        present = table.notna().to_numpy(dtype=float)
+        return table.index.astype(str).to_numpy(), table.fillna(0).to_numpy(dtype=float), present
+
+
+def radius_matrices(index, plat, plng, radii=RADII_M):
+    """
+    반경별 (공원 x 행정동) 희소 행렬 쌍
+    within: 반경 안이면 1 / weighted: 반경 안이면 거리(m)
+    가장 큰 반경으로 한 번만 조회하고, 작은 반경은 거리로 걸러냄
+    """
+    owner, dong, dist = index.neighbors(plat, plng, max(radii))
+    shape = (len(plat), len(index))
+    matrices = {}
+    for r in radii:
+        m = dist <= r
+        within = sparse.csr_matrix((np.ones(m.sum()), (owner[m], dong[m])), shape=shape)
+        weighted = sparse.csr_matrix((dist[m], (owner[m], dong[m])), shape=shape)
+        matrices[r] = (within, weighted)
+    return matrices
+
+
+def compute_popweighted_distance_all(parks_df, pop_agg_df, radii=RADII_M, date_col="stdr_de_id", index=None):
+    """
+    모든 공원 x 반경 x 날짜의 인구가중 평균거리
+    parks_df: name_raw / lat / lng (prepare_for_compute 결과)
+    pop_agg_df: stdr_de_id / code8 / dong_lat / dong_lng / pop (popxy_agg)
+    반환: {반경: 노트북 compute_popweighted_distance(반경)과 같은 형식의 DataFrame}
+    """
+    index = index or DongIndex(pop_agg_df)
+    dates, pop, present = index.pop_matrix(pop_agg_df, date_col=date_col)
+
+    names = parks_df["name_raw"].astype(str).to_numpy()
+    plat = parks_df["lat"].to_numpy(dtype=float)
+    plng = parks_df["lng"].to_numpy(dtype=float)
+    n_parks, n_dates = len(names), len(dates)
+
+    results = {}
+    for r, (within, weighted) in radius_matrices(index, plat, plng, radii).items():
+        # (날짜 x 공원)
+        total_pop = (within @ pop.T).T
+        wsum = (weighted @ pop.T).T
+        near_cnt = (within @ present.T).T
+
+        ok = total_pop > 0
+        with np.errstate(invalid="ignore", divide="ignore"):
+            wavg = np.where(ok, wsum / np.where(ok, total_pop, 1), np.nan)
+        total_pop = np.where(ok, total_pop, 0.0)
+        near_cnt = np.where(ok, near_cnt, 0).astype(int)
+
+        results[r] = pd.DataFrame({
+            "날짜": np.repeat(dates, n_parks),
+            "공원명": np.tile(names, n_dates),
+            "반경(m)": r,
+            "반경내_행정동수": near_cnt.ravel(),
+            "반경내_생활인구합": total_pop.ravel(),
+            "인구가중_평균거리(m)": wavg.ravel(),
+            "공원_lat": np.tile(plat, n_dates),
+            "공원_lng": np.tile(plng, n_dates),
+        })
+    return results
+
+
+def save_results(results, prefix, output_dir=OUTPUT_DIR):
+    """반경별 CSV + 통합 CSV (노트북과 같은 파일명)"""
+    output_dir = Path(output_dir)
+    output_dir.mkdir(parents=True, exist_ok=True)
+    for r, res_r in results.items():
+        out_path = output_dir / f"{prefix}_park_popweighted_distance_admin_dong_{r}m.csv"
+        res_r.to_csv(out_path, index=False, encoding="utf-8-sig")
+        print("저장:", out_path)
+
+    result_all = pd.concat(results.values(), ignore_index=True)
+    out_all = output_dir / f"{prefix}_park_popweighted_distance_admin_dong_allradii.csv"
+    result_all.to_csv(out_all, index=False, encoding="utf-8-sig")
+    print("통합 저장:", out_all)
+    return result_all
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="공원 반경 내 생활인구 가중 평균거리")
+    parser.add_argument("--parks", required=True, help="name_raw / lat / lng 컬럼이 있는 공원 CSV")
+    parser.add_argument("--pop", required=True, help="stdr_de_id / code8 / dong_lat / dong_lng / pop 컬럼이 있는 CSV")
+    parser.add_argument("--prefix", required=True, help="출력 파일명 앞부분 (예: 241106)")
+    parser.add_argument("--radii", type=int, nargs="+", default=RADII_M)
+    parser.add_argument("--output-dir", default=str(OUTPUT_DIR))
+    args = parser.parse_args()
+
+    parks_df = pd.read_csv(args.parks)
+    pop_agg_df = pd.read_csv(args.pop, dtype={"stdr_de_id": str, "code8": str})
+    save_results(compute_popweighted_distance_all(parks_df, pop_agg_df, args.radii), args.prefix, args.output_dir)
@@ -0,0 +1,246 @@
+## 행정동 단위 생활인구 적재 (access_csv_data.ipynb / access_json_data.ipynb의 생활인구 로드 부분)
+# - 인코딩은 파일 앞부분만 읽어서 한 번 판별 (실패할 때마다 전체 파일을 다시 읽지 않음)
+# - CSV는 필요한 컬럼만 타입을 지정해서 chunksize 단위로 읽고, 시간대(07~22시) / 날짜 필터를 청크마다 적용
+# - 청크마다 (날짜, 시간대, code8)로 바로 합산해서 원본 행을 메모리에 쌓지 않음
+# - 결과는 날짜별 Parquet 캐시로 저장하고, 원본 파일의 수정 시각이 그대로면 다시 읽지 않음
+#
+# 캐시 ({cache_dir}/):
+#   pop_{YYYYMMDD}.parquet   stdr_de_id / tmzon_pd_se / code8 / pop
+#   manifest.json            원본 파일별 (수정 시각, 크기, 만든 날짜 목록, 시간대 / 날짜 필터)
+import os
+import json
+import argparse
+from pathlib import Path
+
+import pandas as pd
+
+CACHE_DIR = Path("measure/ACC/pop_cache")
+HOURS = [f"{h:02d}" for h in range(7, 23)]  # 07~22시
+ENCODINGS = ("utf-8-sig", "cp949", "euc-kr", "utf-8")
+
+# 원본 컬럼명 -> 표준 컬럼명 (서울 생활인구 CSV / Open API JSON)
+COLUMN_MAP = {
+    "기준일ID": "stdr_de_id", "stdr_de_id": "stdr_de_id", "STDR_DE_ID": "stdr_de_id",
+    "시간대구분": "tmzon_pd_se", "tmzon_pd_se": "tmzon_pd_se", "TMZON_PD_SE": "tmzon_pd_se",
+    "행정동코드": "adstrd_code_se", "adstrd_code_se": "adstrd_code_se", "ADSTRD_CODE_SE": "adstrd_code_se",
+    "총생활인구수": "pop", "생활인구": "pop", "tot_lvpop_co": "pop", "TOT_LVPOP_CO": "pop",
+}
+
+
+# ====================================================================================
+def detect_encoding(path, sample_bytes=1 << 16):
+    """파일 앞부분(sample_bytes)만 읽어서 디코딩되는 첫 인코딩 반환"""
+    with open(path, "rb") as f:
+        sample = f.read(sample_bytes)
+    # 멀티바이트 문자가 중간에 잘리지 않도록 마지막 줄바꿈까지만 사용
+    if len(sample) == sample_bytes and b"\n" in sample:
+        sample = sample[:sample.rfind(b"\n")]
+    for enc in ENCODINGS:
+        try:
+            sample.decode(enc)
+            return enc
+        except UnicodeDecodeError:
+            continue
+    raise ValueError(f"CSV 인코딩 자동 판별 실패: {path}")
+
+
+def _standardize(df, hours=HOURS, dates=None):
+    """표준 컬럼 / 타입 정리 + 시간대 / 날짜 필터 (청크 하나)"""
+    df = df.rename(columns={c: COLUMN_MAP[c.strip().strip('"')] for c in df.columns
+                            if c.strip().strip('"') in COLUMN_MAP})
+    df["stdr_de_id"] = df["stdr_de_id"].astype(str)
+    df["tmzon_pd_se"] = df["tmzon_pd_se"].astype(str).str.zfill(2)
+    if dates:
+        df = df[df["stdr_de_id"].isin([str(d) for d in dates])]
+    if hours:
+        df = df[df["tmzon_pd_se"].isin(hours)]
+    df = df.assign(code8=df["adstrd_code_se"].astype(str).str[:8],
+                   pop=pd.to_numeric(df["pop"], errors="coerce"))
+    return df.dropna(subset=["pop"])
+
+
+def _aggregate(df):
+    return df.groupby(["stdr_de_id", "tmzon_pd_se", "code8"], as_index=False)["pop"].sum()
+
+
+def iter_population_chunks(path, hours=HOURS, dates=None, chunksize=200_000):
+    """
+    생활인구 파일 -> (날짜, 시간대, code8)별 인구합 청크 생성
+    CSV는 청크 단위로 스트리밍, JSON은 한 번만 파싱
+    """
+    path = Path(path)
+    if path.suffix.lower() == ".json":
+        with open(path, "r", encoding="utf-8") as f:
+            pop_json = json.load(f)
+        # JSON → DataFrame (list/dict 모두 대응)
+        if isinstance(pop_json, dict):
+            list_keys = [k for k, v in pop_json.items() if isinstance(v, list)]
+            pop_json = pop_json[list_keys[0]] if list_keys else pop_json
+        yield _aggregate(_standardize(pd.json_normalize(pop_json, max_level=2), hours, dates))
+        return
+
+    encoding = detect_encoding(path)
+    header = pd.read_csv(path, encoding=encoding, nrows=0).columns
+    usecols = [c for c in header if c.strip().strip('"') in COLUMN_MAP]
+    dtypes = {c: ("float64" if COLUMN_MAP[c.strip().strip('"')] == "pop" else str) for c in usecols}
+    for chunk in pd.read_csv(path, encoding=encoding, usecols=usecols, dtype=dtypes, chunksize=chunksize):
+        yield _aggregate(_standardize(chunk, hours, dates))
+
+
+# ====================================================================================
+class PopulationCache:
+    def __init__(self, cache_dir=CACHE_DIR):
+        self.cache_dir = Path(cache_dir)
+        self.cache_dir.mkdir(parents=True, exist_ok=True)
+        self.manifest_path = self.cache_dir / "manifest.json"
+        self.manifest = {}
+        if self.manifest_path.exists():
+            with open(self.manifest_path, "r", encoding="utf-8") as f:
+                self.manifest = json.load(f)
+
+    def date_path(self, date):
+        return self.cache_dir / f"pop_{date}.parquet"
+
+    def _save_manifest(self):
+        tmp_path = str(self.manifest_path) + ".tmp"
+        with open(tmp_path, "w", encoding="utf-8") as f:
+            json.dump(self.manifest, f, ensure_ascii=False, indent=2)
+        os.replace(tmp_path, self.manifest_path)
+
+    def is_fresh(self, path, hours=HOURS, dates=None):
+        """
+        파일이 그대로이고 같은 시간대 필터로 만든 캐시가 모두 남아 있으면 다시 읽지 않음
+        날짜 필터로 일부만 적재한 기록은 그 날짜들을 요청할 때만 최신으로 봄 (전체 요청이면 다시 적재)
+        """
+        stat = os.stat(path)
+        entry = self.manifest.get(str(Path(path).resolve()))
+        if (entry is None or entry["mtime"] != stat.st_mtime or entry["size"] != stat.st_size
+                or entry.get("hours") != (list(hours) if hours else None)
+                or not all(self.date_path(d).exists() for d in entry["dates"])):
+            return False
+        if "date_filter" not in entry:      # 필터를 기록하기 전 형식 -> 전체인지 알 수 없으므로 다시 적재
+            return False
+        covered = entry["date_filter"]
+        if covered is None:
+            return True
+        return bool(dates) and {str(d) for d in dates} <= set(covered)
+
+    def ingest(self, path, hours=HOURS, dates=None, chunksize=200_000):
+        """파일 하나를 읽어 날짜별 Parquet으로 저장 (이미 최신이면 건너뜀). 반환: 날짜 목록"""
+        key = str(Path(path).resolve())
+        if self.is_fresh(path, hours, dates):
+            cached = self.manifest[key]["dates"]
+            return [d for d in cached if d in {str(x) for x in dates}] if dates else cached
+
+        parts = list(iter_population_chunks(path, hours, dates, chunksize))
+        if not parts:
+            return []
+        # 청크 경계에 걸친 같은 (날짜, 시간대, 동)을 한 번 더 합산
+        agg = _aggregate(pd.concat(parts, ignore_index=True))
+        agg["pop"] = agg["pop"].astype("float64")
+
+        written = []
+        for date, grp in agg.groupby("stdr_de_id"):
+            out_path = self.date_path(date)
+            tmp_path = str(out_path) + ".tmp"
+            grp.reset_index(drop=True).to_parquet(tmp_path, index=False)
+            os.replace(tmp_path, out_path)
+            written.append(str(date))
+
+        stat = os.stat(path)
+        date_filter = sorted({str(d) for d in dates}) if dates else None
+        cached_dates = written
+        prev = self.manifest.get(key)
+        if (date_filter and prev and prev.get("date_filter") and prev["mtime"] == stat.st_mtime
+                and prev["size"] == stat.st_size and prev.get("hours") == (list(hours) if hours else None)):
+            # 같은 파일을 날짜 필터로 여러 번 적재하면 적재한 날짜 범위를 합침
+            date_filter = sorted(set(date_filter) | set(prev["date_filter"]))
+            cached_dates = set(written) | set(prev["dates"])
+        self.manifest[key] = {"mtime": stat.st_mtime, "size": stat.st_size, "dates": sorted(cached_dates),
+                              "hours": list(hours) if hours else None, "date_filter": date_filter}
+        self._save_manifest()
+        print(f"적재: {Path(path).name} -> 날짜 {len(written)}개, {len(agg)}행")
+        return written
+
+    def ingest_many(self, paths, **kwargs):
+        dates = []
+        for path in paths:
+            dates.extend(self.ingest(path, **kwargs))
+        return sorted(set(dates))
+
+    def dates(self):
+        return sorted(p.stem[len("pop_"):] for p in self.cache_dir.glob("pop_*.parquet"))
+
+    def load(self, dates=None, hours=None, by_hour=True):
+        """
+        캐시에서 생활인구 읽기
+        by_hour=False면 노트북의 popxy_agg처럼 시간대를 합산한 (날짜, code8)별 인구
+        """
+        dates = [str(d) for d in dates] if dates else self.dates()
+        frames = [pd.read_parquet(self.date_path(d)) for d in dates if self.date_path(d).exists()]
+        if not frames:
+            return pd.DataFrame(columns=["stdr_de_id", "tmzon_pd_se", "code8", "pop"])
+        pop = pd.concat(frames, ignore_index=True)
+        if hours:
+            pop = pop[pop["tmzon_pd_se"].isin(hours)]
+        if not by_hour:
+            pop = pop.groupby(["stdr_de_id", "code8"], as_index=False)["pop"].sum()
+        return pop
+
+
+# ====================================================================================
+# 행정동 좌표 파일 컬럼 후보 (access_csv_data.ipynb와 동일)
+DONG_COLUMN_CANDIDATES = {
+    "code":     ["code", "adm_cd", "h_code", "adstrd_code_se", "법정동코드", "행정동코드", "emd_cd", "emd_code"],
+    "dong_lat": ["dong_lat", "lat", "latitude", "위도", "y", "center_lat", "centroid_lat"],
+    "dong_lng": ["dong_lng", "lng", "lon", "longitude", "경도", "x", "center_lng", "centroid_lng"],
+    "행정동":   ["행정동", "행정동명", "법정동", "법정동명", "동", "adm_nm", "adm_dr_nm",
+                 "emd_nm", "emd_kor_nm", "dong", "dong_name"],
+    "자치구":   ["자치구", "자치구명", "구", "구명", "sgg_nm", "sgg_name",
+                 "sig_kor_nm", "시군구명", "sigungu", "gu"],
+}
+
+
+def read_dong_coords(path):
+    """행정동 좌표 파일(.csv/.xlsx) -> code8 / 행정동 / 자치구 / dong_lat / dong_lng"""
+    path = Path(path)
+    if path.suffix.lower() in [".xlsx", ".xls"]:
+        raw = pd.read_excel(path)
+    else:
+        raw = pd.read_csv(path, encoding=detect_encoding(path))
+    raw = raw.rename(columns={c: str(c).strip().lower().replace(" ", "_") for c in raw.columns})
+
+    rename = {}
+    for std, cands in DONG_COLUMN_CANDIDATES.items():
+        col = next((c for c in cands if c in raw.columns), None)
+        if col is None:
+            raise KeyError(f"좌표 파일에서 '{std}' 컬럼을 찾지 못했습니다. (현재: {list(raw.columns)})")
+        rename[col] = std
+    dongxy = raw.rename(columns=rename)[list(rename.values())].copy()
+    dongxy["code8"] = dongxy["code"].astype(str).str[:8]
+    dongxy["dong_lat"] = pd.to_numeric(dongxy["dong_lat"], errors="coerce")
+    dongxy["dong_lng"] = pd.to_numeric(dongxy["dong_lng"], errors="coerce")
+    return dongxy.dropna(subset=["dong_lat", "dong_lng"])
+
+
+def attach_dong_coords(pop_df, dongxy):
+    """
+    (날짜, code8) 인구에 행정동 좌표 / 자치구 / 행정동명 붙이기 -> accessibility.py 입력 형식(popxy_agg)
+    dongxy: code8 / 행정동 / 자치구 / dong_lat / dong_lng
+    """
+    keys = [c for c in ["stdr_de_id", "tmzon_pd_se"] if c in pop_df.columns]
+    popxy = pop_df.merge(dongxy[["code8", "행정동", "자치구", "dong_lat", "dong_lng"]], on="code8", how="inner")
+    return popxy[keys + ["code8", "자치구", "행정동", "dong_lat", "dong_lng", "pop"]]
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="생활인구 파일을 날짜별 Parquet 캐시로 적재")
+    parser.add_argument("files", nargs="+", help="생활인구 CSV / JSON 파일")
+    parser.add_argument("--cache-dir", default=str(CACHE_DIR))
+    parser.add_argument("--chunksize", type=int, default=200_000)
+    parser.add_argument("--all-hours", action="store_true", help="07~22시 필터를 적용하지 않음")
+    args = parser.parse_args()
+
+    cache = PopulationCache(args.cache_dir)
+    dates = cache.ingest_many(args.files, hours=None if args.all_hours else HOURS, chunksize=args.chunksize)
+    print(f"캐시된 날짜 {len(cache.dates())}개 (이번 실행: {len(dates)}개)")
@@ -1,63 +1,20 @@
 ## 한강공원 운동시설 여가도
 import pandas as pd
-import numpy as np
 import json
 
-# 분석할 운동시설 종류 9개로 정의
-TARGET_LABELS = {
-    "운동시설", "야구장", "론볼링장", "트랙구장", "롤러장",
-    "자전거공원", "수영장/물놀이장", "강변물놀이장", "골프장"
-}
+from lei_scorer import load_sports, sports_score
 
 input_filename = 'measure/LEI/data/monthly_hanriver.csv'
 
 try:
-    # 2. JSON 파일 읽기 및 데이터 구조화
-    with open(input_filename, 'r', encoding='utf-8') as f:
-        # f.readline() 대신 json.load(f)를 사용하여 파일 전체를 한 번에 읽어들이기
-        data = json.load(f)
+    # 1~2. JSON 파일 읽기 -> 공원별 보유 운동시설 종류 (TARGET_LABELS 9종, 공원마다 고유 시설만)
+    df_unique_sports = load_sports(input_filename)
 
-    # 시설 코드와 시설명을 매칭하는 딕셔너리 생성
-    code_map = {k.lower(): v for k, v in data['DESCRIPTION'].items()}
-
-    # 각 공원이 보유한 시설 목록을 담을 리스트
-    facilities_list = []
-
-    # 실제 데이터 부분(DATA)을 순회하며 공원별 시설을 추출
-    for record in data['DATA']:
-        park_name = record.get('park_nm')
-        if not park_name:
-            continue
-        
-        for code, value in record.items():
-            if code.startswith('cnt') and isinstance(value, (int, float)) and value > 0:
-                facility_name = code_map.get(code)
-                if facility_name in TARGET_LABELS:
-                    facilities_list.append({'공원명': park_name, '시설종류': facility_name})
-
-    df_sports = pd.DataFrame(facilities_list)
-
-    if df_sports.empty:
+    if df_unique_sports.empty:
         print("분석 대상에 해당하는 운동시설 데이터를 찾을 수 없습니다.")
     else:
-        # 3. 샤논 다양성 지수 계산 함수 정의
-        def calculate_shannon_diversity(series):
-            counts = series.value_counts()
-            proportions = counts / counts.sum()
-            shannon_index = -np.sum(proportions * np.log(proportions))
-            return shannon_index
-
-        # 4. 공원별 데이터 분석
-        # 고유한 시설만 남겨서 공원별 보유 시설 목록을 만듭니다.
-        df_unique_sports = df_sports.drop_duplicates()
-
-        sport_analysis = df_unique_sports.groupby('공원명').agg(
-            총_운동시설_수=('시설종류', 'count'),
-            시설_다양성_지수=('시설종류', calculate_shannon_diversity)
-        ).reset_index()
-
-        # 5. 최종 '운동 여가도 점수' 산출
-        sport_analysis['운동_여가도_점수'] = sport_analysis['총_운동시설_수'] * (1 + sport_analysis['시설_다양성_지수'])
+        # 3~5. 공원별 총 운동시설 수 / 시설 다양성 지수(샤논) / 운동 여가도 점수 (lei_scorer)
+        sport_analysis = sports_score(df_unique_sports)
 
         # 6. 결과 정렬 및 출력
         results_sorted = sport_analysis.sort_values(by='운동_여가도_점수', ascending=False).reset_index(drop=True)
@@ -1,33 +1,14 @@
 ## 한강공원 축제 여가도 분석 스크립트
 import pandas as pd
-import numpy as np
+
+from lei_scorer import load_festivals, festival_score
 
 # 1. 데이터 불러오기
 try:
-    df = pd.read_csv('measure/LEI/data/hangang_festival_list.csv')
-
-    # 2. 샤논 다양성 지수 계산 함수 정의
-    def calculate_shannon_diversity(series):
-        # 축제 종류별 개수를 셉니다.
-        counts = series.value_counts()
-        # 각 축제가 전체에서 차지하는 비율을 계산합니다.
-        proportions = counts / counts.sum()
-        # 샤논 지수 공식을 적용합니다.
-        shannon_index = -np.sum(proportions * np.log(proportions))
-        return shannon_index
-
-    # 3. 공원별 데이터 분석 및 여가도 계산
-    # '공원명'을 기준으로 그룹화하여 분석을 수행합니다.
-    park_analysis = df.groupby('공원명').agg(
-        # '축제명'의 개수를 세어 '총 축제 수'를 계산합니다.
-        총_축제_수=('festival_nm', 'count'),
-        # 함수를 이용해 '축제 다양성 지수'를 계산합니다.
-        축제_다양성_지수=('festival_nm', calculate_shannon_diversity)
-    ).reset_index()
-
-    # 4. 최종 '여가도 점수' 산출
-    # 공식을 적용하여 최종 점수를 계산합니다.
-    park_analysis['여가도_점수'] = park_analysis['총_축제_수'] * (1 + park_analysis['축제_다양성_지수'])
+    df = load_festivals('measure/LEI/data/hangang_festival_list.csv')
+
+    # 2~4. 공원별 총 축제 수 / 축제 다양성 지수(샤논) / 여가도 점수 = 총 축제 수 x (1 + 다양성) (lei_scorer)
+    park_analysis = festival_score(df)
 
     # 5. 결과 정렬 및 출력
     results_sorted = park_analysis.sort_values(by='여가도_점수', ascending=False)
@@ -0,0 +1,157 @@
+## LEI(여가도) 공통 점수 모듈
+# gu_leisure_score.py / han_festival_lei.py / exercise.py에 복사돼 있던 calculate_shannon_diversity를
+# groupby().agg 콜백(그룹마다 value_counts) 대신 (그룹 x 종류) 교차표 한 번 + NumPy 연산으로 계산한다.
+#   여가도 점수 = 개수 x (1 + 샤논 다양성 지수)
+#   조정점수(T-점수) = (x - 평균) / 표준편차 x 10 + 50   (hangang_total_lei_score.py)
+#
+# 이 파일을 직접 실행하면 축제 / 운동시설 / 문화행사 여가도와 한강공원 종합 여가도를 한 번에 만든다.
+#   python measure/LEI/lei_scorer.py
+import sys
+import json
+from pathlib import Path
+
+import numpy as np
+import pandas as pd
+
+sys.path.append(str(Path(__file__).resolve().parents[1]))   # measure/
+from gu_resolver import resolve_gu_columns
+from park_registry import ParkRegistry
+
+LEI_DIR = Path("measure/LEI")
+DATA_DIR = LEI_DIR / "data"
+RESULT_DIR = LEI_DIR / "results"
+
+# 분석할 운동시설 종류 9개
+TARGET_LABELS = {
+    "운동시설", "야구장", "론볼링장", "트랙구장", "롤러장",
+    "자전거공원", "수영장/물놀이장", "강변물놀이장", "골프장"
+}
+
+
+# ====================================================================================
+def shannon_diversity(df, group_col, category_col):
+    """
+    그룹별 개수와 샤논 다양성 지수 (-Σ p·ln p)
+    반환: DataFrame(index=그룹, columns=[count, shannon])
+    종류 값이 없는(NaN) 행은 세지 않음 (value_counts / count와 같음)
+    """
+    groups = pd.Index(df[group_col].dropna().unique()).sort_values()
+    counts = pd.crosstab(df[group_col], df[category_col]).reindex(groups, fill_value=0)
+    C = counts.to_numpy(dtype=float)
+    total = C.sum(axis=1)
+    with np.errstate(divide="ignore", invalid="ignore"):
+        P = C / total[:, None]
+        H = -np.where(C > 0, P * np.log(P), 0.0).sum(axis=1)
+    return pd.DataFrame({"count": total.astype(int), "shannon": H}, index=groups)
+
+
+def leisure_score(df, group_col, category_col, count_name, diversity_name, score_name):
+    """그룹별 개수 / 다양성 지수 / 여가도 점수(개수 x (1 + 다양성)) 표 (노트북 / 스크립트와 같은 컬럼명)"""
+    div = shannon_diversity(df, group_col, category_col)
+    out = pd.DataFrame({
+        group_col: div.index,
+        count_name: div["count"].to_numpy(),
+        diversity_name: div["shannon"].to_numpy(),
+    })
+    out[score_name] = out[count_name] * (1 + out[diversity_name])
+    return out
+
+
+def t_score(series):
+    """표준점수를 평균 50 / 표준편차 10으로 조정 (모든 값이 같으면 50)"""
+    std = series.std()
+    if not std > 0:
+        return pd.Series(50.0, index=series.index)
+    return (series - series.mean()) / std * 10 + 50
+
+
+# ====================================================================================
+def load_culture_events(path=DATA_DIR / "seoul_culture_event.csv"):
+    """문화행사 목록, 자치구 표기가 '서울' / 공백이면 장소 주소에서 자치구를 찾음"""
+    df = pd.read_csv(path)
+    df["자치구"] = resolve_gu_columns(df, ["자치구", "장소"])
+    return df.dropna(subset=["자치구", "분류"])
+
+
+def load_festivals(path=DATA_DIR / "hangang_festival_list.csv"):
+    """한강공원 축제 목록 (make_hanpark.py 결과: festival_nm / park_nm [/ park_id]) -> 공원명 컬럼으로 통일"""
+    df = pd.read_csv(path)
+    if "공원명" not in df.columns:
+        df = df.rename(columns={"park_nm": "공원명"})
+    return df
+
+
+def load_sports(path=DATA_DIR / "monthly_hanriver.csv", labels=TARGET_LABELS):
+    """한강공원 시설 JSON -> 공원명 / 시설종류 (공원마다 보유 시설 종류 한 번씩)"""
+    with open(path, "r", encoding="utf-8") as f:
+        data = json.load(f)
+    code_map = {k.lower(): v for k, v in data["DESCRIPTION"].items()}
+
+    records = pd.DataFrame(data["DATA"])
+    records = records[records["park_nm"].notna() & (records["park_nm"] != "")]
+    cnt_cols = [c for c in records.columns if str(c).startswith("cnt")]
+    long = records.melt(id_vars="park_nm", value_vars=cnt_cols, var_name="code", value_name="value")
+    long = long[pd.to_numeric(long["value"], errors="coerce") > 0]
+    long["시설종류"] = long["code"].str.lower().map(code_map)
+    long = long[long["시설종류"].isin(labels)]
+    return long.rename(columns={"park_nm": "공원명"})[["공원명", "시설종류"]].drop_duplicates()
+
+
+def festival_score(df):
+    return leisure_score(df, "공원명", "festival_nm", "총_축제_수", "축제_다양성_지수", "여가도_점수")
+
+
+def sports_score(df):
+    return leisure_score(df, "공원명", "시설종류", "총_운동시설_수", "시설_다양성_지수", "운동_여가도_점수")
+
+
+def culture_event_score(df):
+    out = leisure_score(df, "자치구", "분류", "총_행사_수", "행사_다양성_지수", "여가도_점수_원본")
+    out["여가도_조정점수"] = t_score(out["여가도_점수_원본"])
+    return out
+
+
+def hangang_total_score(festival, sports, registry=None):
+    """축제 / 운동 여가도를 park_id로 합치고 각각 T-점수 후 5:5 평균"""
+    registry = registry or ParkRegistry()
+    festival = registry.attach(festival, "공원명")
+    sports = registry.attach(sports, "공원명")
+    merged = pd.merge(festival[["park_id", "여가도_점수"]], sports[["park_id", "운동_여가도_점수"]],
+                      on="park_id", how="outer").fillna(0)
+    merged.insert(0, "공원명", merged["park_id"].map(registry.name_of))
+    merged["축제_조정점수"] = t_score(merged["여가도_점수"])
+    merged["운동_조정점수"] = t_score(merged["운동_여가도_점수"])
+    merged["종합_여가도_점수"] = merged["축제_조정점수"] * 0.5 + merged["운동_조정점수"] * 0.5
+    return merged[["공원명", "park_id", "종합_여가도_점수", "축제_조정점수", "운동_조정점수"]]
+
+
+def _sorted(df, by):
+    return df.sort_values(by=by, ascending=False).reset_index(drop=True)
+
+
+def run(data_dir=DATA_DIR, result_dir=RESULT_DIR):
+    data_dir, result_dir = Path(data_dir), Path(result_dir)
+    result_dir.mkdir(parents=True, exist_ok=True)
+
+    festival = _sorted(festival_score(load_festivals(data_dir / "hangang_festival_list.csv")), "여가도_점수")
+    sports = _sorted(sports_score(load_sports(data_dir / "monthly_hanriver.csv")), "운동_여가도_점수")
+    culture = _sorted(culture_event_score(load_culture_events(data_dir / "seoul_culture_event.csv")), "여가도_조정점수")
+    total = _sorted(hangang_total_score(festival, sports), "종합_여가도_점수")
+
+    outputs = {
+        "hangang_park_leisure_score.csv": festival,
+        "hangang_sports_leisure_score.csv": sports,
+        "gu_leisure_score.csv": culture,
+        "hangang_total_leisure_score_adjusted.csv": total,
+    }
+    for name, df in outputs.items():
+        df.to_csv(result_dir / name, encoding="utf-8-sig", index=False)
+        print("저장:", result_dir / name)
+    return outputs
+
+
+if __name__ == "__main__":
+    pd.options.display.float_format = "{:.2f}".format
+    results = run()
+    print("\n--- 한강공원 종합 여가도 ---")
+    print(results["hangang_total_leisure_score_adjusted.csv"])
@@ -1,6 +1,14 @@
 ## 한강공원 축제 목록을 CSV 파일로 저장하는 스크립트
+import sys
+from pathlib import Path
+
 import pandas as pd
 
+sys.path.append(str(Path(__file__).resolve().parents[1]))   # measure/
+from park_registry import ParkRegistry
+
+registry = ParkRegistry()
+
 # 1. 사용자가 제공한 축제 정보 딕셔너리
 # 각 축제 이름을 key로, 개최되는 공원 목록을 value로 정의합니다.
 festival_data = {
@@ -33,15 +41,13 @@ for festival, parks_str in festival_data.items():
     parks = [p.strip() for p in parks_str.split(',')]
 
     for park in parks:
-        # '한강공원'이라는 이름이 빠진 경우 추가하여 데이터 일관성을 유지합니다.
-        # (단, '노들섬', '여의샛강' 같은 특수 지명은 제외)
-        if '한강공원' not in park and '섬' not in park and '샛강' not in park:
-            normalized_park = park + "한강공원"
-        else:
-            normalized_park = park
+        # 공원 레지스트리로 이름을 맞춥니다. ('뚝섬' -> '뚝섬한강공원')
+        # 레지스트리에 없는 '노들섬', '여의샛강' 같은 특수 지명은 그대로 둡니다.
+        park_id = registry.resolve(park)
+        normalized_park = registry.name_of(park_id) if park_id else park
         
         # 'festival_nm'과 'park_nm'을 짝지어 리스트에 추가합니다.
-        processed_data.append({'festival_nm': festival, 'park_nm': normalized_park})
+        processed_data.append({'festival_nm': festival, 'park_nm': normalized_park, 'park_id': park_id})
 
 # 3. Pandas 데이터프레임으로 변환
 df_hangang = pd.DataFrame(processed_data)
@@ -0,0 +1,155 @@
+## NAT(생태·경관성) 점수 계산 (sentiment_total_numbering.ipynb의 스크립트 버전)
+# - 생태/경관 키워드 정규식을 한 번만 컴파일하고 pandas str.count로 컬럼 전체를 한 번에 셈
+# - 토픽 이름(Name)뿐 아니라 리뷰 원문 전체(measure/NAT/data)에도 같은 매처를 적용할 수 있음
+# - 한강공원 / 일반공원 / 지역구 순위 3개를 하나의 점수 테이블에서 함께 생성
+import os
+import re
+import glob
+import argparse
+
+import numpy as np
+import pandas as pd
+from scipy.stats import norm
+
+SENTIMENT_DIR = "bertopic_results/sentiment/"
+DATA_DIR = "measure/NAT/data/"
+
+# 1. 생태/경관 관련 키워드 정의
+# 수동으로 뽑아냈어요~^^
+eco_keywords = [
+    '나무', '자연', '아름답', '공기', '산책로', '정원', '단풍', '벚꽃',
+    '식물', '산책', '전망', '전망대', '호수', '동물', '야경', '경치',
+    '소풍', '향기', '장미', '근린공원', '조깅', '분수', '잔디밭', '고요',
+    '바위', '잔디', '생태', '하늘', '축제', '햇살', '등산', '조망',
+    '나들이', '연못', '조경', '둘레길', '숲길', '저수지', '가을', '산림', '날씨',
+    '풍경', '정취', '꽃구경', '경관', '예쁘', '여름', '바라보', '명소',
+    '운치', '그늘', '조명', '명산', '물소리', '일출', '꽃피', '수국',
+    '개나리', '겨울', '모래', '습지', '수목원', '코스모스', '너구리', '강아지', '개구리',
+    '잉어', '식물원', '물고기', '허브', '나뭇잎', '나무숲', '초록', '계곡',
+    '암벽', '강물', '녹지', '오솔길', '호숫가', '사슴', '토끼', '새싹', '목련', '꽃사슴',
+    '봄꽃', '광장', '만개', '정상', '환경', '아침', '저녁', '탁트인', '아름다우',
+    '어우러지', '흐드러지', '피어나', '천지', '전경', '산행', '조화',
+    '달빛', '선선', '휴식처', '한가로이', '야경', '강과'
+    ]
+
+# 빠진 공원 리스트 (토픽 결과가 없어 최소 점수로 보정)
+missing_parks_hangang = ['한강_강서한강공원']
+missing_parks_general = [
+    '강동_길동생태공원',
+    '관악_관악산 호수공원',
+    '금천_금천폭포공원',
+    '노원_불암산',
+    '동대문_용두근린공원',
+    '동작_국립서울현충원',
+    '서초_매헌시민의숲',
+    '성북_천장산',
+    '은평_구파발폭포'
+]
+
+
+# ====================================================================================
+def build_eco_pattern(keywords=eco_keywords):
+    # 노트북의 '|'.join(eco_keywords)와 같은 순서 (중복만 제거) -> 매칭 개수도 동일
+    return re.compile("|".join(re.escape(k) for k in dict.fromkeys(keywords)))
+
+
+def count_eco_hits(texts, pattern):
+    """문자열 Series 전체에서 키워드 매칭 개수 (re.findall 개수와 동일)"""
+    return texts.fillna("").astype(str).str.count(pattern)
+
+
+def count_review_hits(data_dir=DATA_DIR, pattern=None):
+    """
+    리뷰 원문 전체에 매처 적용
+    반환: Park_nm / 리뷰수 / eco_hits / eco_review_ratio(키워드가 하나라도 있는 리뷰 비율)
+    """
+    pattern = pattern or build_eco_pattern()
+    rows = []
+    for file_path in sorted(glob.glob(os.path.join(data_dir, "*.csv"))):
+        park_name = os.path.basename(file_path).replace('_reviews_dic_cleaned.csv', '').replace('_reviews_url_cleaned.csv', '')
+        hits = count_eco_hits(pd.read_csv(file_path, usecols=["내용"])["내용"], pattern)
+        rows.append({"Park_nm": park_name, "리뷰수": len(hits), "eco_hits": int(hits.sum()),
+                     "eco_review_ratio": float((hits > 0).mean()) if len(hits) else 0.0})
+    return pd.DataFrame(rows)
+
+
+def add_eco_scores(eco_final_df, pattern=None):
+    """topic_counts / topic_weight / eco_score 컬럼 추가"""
+    pattern = pattern or build_eco_pattern()
+    df = eco_final_df.copy()
+    df['topic_counts'] = count_eco_hits(df['Name'], pattern)
+    df['topic_weight'] = np.where(df['topic_counts'] == 0, 0.1, df['topic_counts'])
+    # 생태·경관 점수 계산
+    df['eco_score'] = df['sentiment_score'] * df['Count']
+    return df
+
+
+def add_missing_parks(df):
+    """빠진 공원을 최소 점수(sentiment_score 최솟값 × 0.5)로 추가"""
+    min_score = df['sentiment_score'].min() * 0.5
+    missing = missing_parks_hangang + missing_parks_general
+    missing_df = pd.DataFrame({'Park_nm': missing, 'eco_score': [min_score] * len(missing)})
+    return pd.concat([df, missing_df[~missing_df['Park_nm'].isin(df['Park_nm'])]], ignore_index=True)
+
+
+def rank_scores(df, key, how="sum"):
+    """key별 eco_score 합계(평균) -> z-score -> 정규분포 cdf × 100, 점수 높은 순으로 순위"""
+    ranking = df.groupby(key)['eco_score'].agg(how).reset_index()
+    ranking['z'] = (ranking['eco_score'] - ranking['eco_score'].mean()) / ranking['eco_score'].std(ddof=0)
+    ranking['cdf'] = norm.cdf(ranking['z'])
+    ranking['eco_score_std'] = ranking['cdf'] * 100
+    ranking = ranking.sort_values(by='eco_score', ascending=False)
+    ranking['순위'] = range(1, len(ranking) + 1)
+    return ranking
+
+
+def build_rankings(eco_final_df, pattern=None):
+    """
+    점수 테이블 하나에서 순위 3개 생성
+    반환: {"hangang": 한강공원 순위, "nonhangang": 일반공원 순위, "area": 지역구 순위}
+    """
+    df = add_missing_parks(add_eco_scores(eco_final_df, pattern))
+    is_hangang = df['Park_nm'].str.contains('한강')
+    other_parks_df = df[~is_hangang].assign(District=df.loc[~is_hangang, 'Park_nm'].str.split('_').str[0])
+    return {
+        "hangang": rank_scores(df[is_hangang], 'Park_nm'),
+        "nonhangang": rank_scores(other_parks_df, 'Park_nm'),
+        # 지역구는 공원 점수 평균 (etc 공원은 'etc' 지역구로 집계, 노트북과 동일)
+        "area": rank_scores(other_parks_df, 'District', how="mean"),
+    }
+
+
+def save_rankings(rankings, out_dir=SENTIMENT_DIR):
+    names = {"hangang": "hangang_ranking_topic.csv", "nonhangang": "nonhangang_ranking_topic.csv",
+             "area": "nonhangang_area_ranking_topic.csv"}
+    for key, filename in names.items():
+        output_file_path = os.path.join(out_dir, filename)
+        rankings[key].to_csv(output_file_path, index=False, encoding='utf-8-sig')
+        print(f"Results saved to {output_file_path}")
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="NAT(생태·경관성) 점수 및 순위 계산")
+    parser.add_argument("--input", default=os.path.join(SENTIMENT_DIR, "final_sentiment_analysis_results.csv"))
+    parser.add_argument("--out-dir", default=SENTIMENT_DIR)
+    parser.add_argument("--reviews", action="store_true", help="리뷰 원문 전체의 키워드 매칭 결과도 저장")
+    parser.add_argument("--data-dir", default=DATA_DIR)
+    args = parser.parse_args()
+
+    pattern = build_eco_pattern()
+    eco_final_df = pd.read_csv(args.input)
+    rankings = build_rankings(eco_final_df, pattern)
+    save_rankings(rankings, args.out_dir)
+
+    print("--- 한강공원 생태·경관성 순위 ---")
+    print(rankings["hangang"][['순위', 'Park_nm', 'eco_score_std']].to_string(index=False))
+    print("--- 일반공원 생태·경관성 순위 (상위 10개) ---")
+    print(rankings["nonhangang"][['순위', 'Park_nm', 'eco_score_std']].head(10).to_string(index=False))
+    print("--- 지역구별 공원 생태·경관성 순위 ---")
+    print(rankings["area"][['순위', 'District', 'eco_score_std']].to_string(index=False))
+
+    if args.reviews:
+        review_hits = count_review_hits(args.data_dir, pattern)
+        output_file_path = os.path.join(args.out_dir, "eco_review_hits.csv")
+        review_hits.to_csv(output_file_path, index=False, encoding='utf-8-sig')
+        print(f"Results saved to {output_file_path}")
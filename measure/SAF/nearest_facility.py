@@ -0,0 +1,147 @@
+## 공원 -> 가장 가까운 시설 거리 (KD-tree)
+# FIR / DRM / RST 지표는 구별 시설 수만 세서 공원이 실제로 시설과 얼마나 떨어져 있는지는 반영하지 못한다.
+# 시설 종류마다 투영좌표(EPSG:5186, m) KD-tree를 한 번 만들고, 모든 공원을 한 번에 조회해서
+#   {종류}_d1 ... _d{k}   가장 가까운 k개 시설까지 거리(m)
+#   {종류}_n{반경}        반경 안 시설 수
+# 를 구한 뒤 PARK_SCORES 기준으로 공원 단위 하위 점수(0~100)를 만든다.
+# 시설 좌표는 spatial_join.py의 POINT_SOURCES를 그대로 사용한다.
+# (병원 / 약국은 이 저장소에 좌표 데이터가 없어 MED는 구 단위 점수만 있음)
+#
+# 공원 좌표: 공원명 / 공원_lat / 공원_lng (ACC allradii CSV) 또는 name_raw / lat / lng
+import sys
+import argparse
+from pathlib import Path
+
+import numpy as np
+import pandas as pd
+import geopandas as gpd
+from scipy.spatial import cKDTree
+
+from saf_engine import DATA_DIR, RESULT_DIR
+from spatial_join import POINT_SOURCES, WORK_CRS, load_facilities
+
+sys.path.append(str(Path(__file__).resolve().parents[1]))   # measure/
+from park_registry import ParkRegistry
+
+PARKS_CSV = Path("measure/ACC/outputs/250812_park_popweighted_distance_admin_dong_allradii.csv")
+OUTPUT_NAME = "park_nearest_facility.csv"
+K_NEAREST = 3
+RADII_M = [500, 1000, 2000]
+
+# 공원 단위 하위 점수: {점수 컬럼: [(시설 종류, 지표, 방향)]}, 지표별 공원 간 MinMax 후 평균
+#   방향 -1: 가까울수록(거리 작을수록) 높은 점수
+PARK_SCORES = {
+    "FIR_park_score": [("FIR-FIRESTATION", "d1", -1), ("FIR-FIRESTATION", "n2000", 1)],
+    "DRM_park_score": [("DRM-CIVDEF", "n1000", 1), ("DRM-FLOODSHELTER", "d1", -1),
+                       ("DRM-QUAKEOUTSHELTER", "d1", -1), ("DRM-QUAKESHELTER", "d1", -1),
+                       ("DRM-PMSHELTER", "n1000", 1)],
+    "RST_park_score": [("RST-CLIMATESHELTER", "n1000", 1), ("RST-COLDSHELTER", "n1000", 1),
+                       ("RST-HEATSHELTER", "n1000", 1)],
+}
+
+
+# ====================================================================================
+class FacilityIndex:
+    """시설 종류 하나의 KD-tree (좌표 단위 m)"""
+    def __init__(self, xy):
+        self.xy = np.asarray(xy, dtype=float)
+        self.tree = cKDTree(self.xy)
+
+    def __len__(self):
+        return len(self.xy)
+
+    def nearest(self, query_xy, k=K_NEAREST):
+        """(공원 수, k) 거리 배열, 시설이 k개보다 적으면 inf"""
+        dist, _ = self.tree.query(query_xy, k=k)
+        return dist.reshape(len(query_xy), k)
+
+    def count_within(self, query_xy, radius):
+        return self.tree.query_ball_point(query_xy, r=radius, return_length=True)
+
+
+def build_indexes(facilities):
+    """시설 GeoDataFrame(source, geometry) -> {종류: FacilityIndex}"""
+    xy = np.column_stack([facilities.geometry.x.to_numpy(), facilities.geometry.y.to_numpy()])
+    source = facilities["source"].to_numpy()
+    finite = np.isfinite(xy).all(axis=1)
+    indexes = {}
+    for name in pd.unique(source):
+        mask = (source == name) & finite
+        if (source == name).sum() > mask.sum():
+            print(f"참고: {name}: 좌표가 유한하지 않은 {int((source == name).sum() - mask.sum())}개 제외")
+        if not mask.any():
+            print(f"⚠️ {name}: 좌표가 있는 시설이 없어 제외")
+            continue
+        indexes[name] = FacilityIndex(xy[mask])
+    return indexes
+
+
+def load_parks(path=PARKS_CSV, registry=None):
+    """공원 좌표 CSV -> 공원명 / park_id / x / y (WORK_CRS)"""
+    df = pd.read_csv(path, encoding="utf-8-sig")
+    if "공원_lat" in df.columns:
+        df = df.rename(columns={"공원_lat": "lat", "공원_lng": "lng"})
+    else:
+        df = df.rename(columns={"name_raw": "공원명"})
+    df = df.drop_duplicates("공원명")[["공원명", "lat", "lng"]].dropna().reset_index(drop=True)
+
+    registry = registry or ParkRegistry()
+    df = registry.attach(df, "공원명")
+    pts = gpd.GeoSeries(gpd.points_from_xy(df["lng"], df["lat"]), crs="EPSG:4326").to_crs(WORK_CRS)
+    df["x"], df["y"] = pts.x.to_numpy(), pts.y.to_numpy()
+    return df
+
+
+def nearest_table(parks, indexes, k=K_NEAREST, radii=RADII_M):
+    """모든 공원 x 모든 시설 종류의 k-최근접 거리 / 반경 내 개수 (종류마다 일괄 조회 한 번)"""
+    query_xy = parks[["x", "y"]].to_numpy(dtype=float)
+    columns = {}
+    for name, index in indexes.items():
+        dist = index.nearest(query_xy, k)
+        for j in range(k):
+            columns[f"{name}_d{j + 1}"] = np.where(np.isinf(dist[:, j]), np.nan, dist[:, j])
+        for r in radii:
+            columns[f"{name}_n{r}"] = index.count_within(query_xy, r)
+    return pd.concat([parks[["park_id", "공원명"]], pd.DataFrame(columns, index=parks.index)], axis=1)
+
+
+def park_scores(table, scores=PARK_SCORES):
+    """PARK_SCORES 기준 공원 단위 하위 점수 (공원 간 MinMax 0~100, 방향 반영 후 평균)"""
+    out = pd.DataFrame(index=table.index)
+    for score_col, parts in scores.items():
+        cols = [f"{name}_{metric}" for name, metric, _ in parts if f"{name}_{metric}" in table]
+        if not cols:
+            print(f"⚠️ {score_col}: 시설 데이터 없음")
+            continue
+        X = table[cols].to_numpy(dtype=float)
+        lo, hi = np.nanmin(X, axis=0), np.nanmax(X, axis=0)
+        S = (X - lo) / np.where(hi > lo, hi - lo, 1.0) * 100
+        direction = np.array([d for name, metric, d in parts if f"{name}_{metric}" in table])
+        S = np.where(direction < 0, 100 - S, S)
+        out[score_col] = np.nanmean(S, axis=1)
+    return out
+
+
+def run(parks_csv=PARKS_CSV, data_dir=DATA_DIR, result_dir=RESULT_DIR, k=K_NEAREST, radii=RADII_M):
+    indexes = build_indexes(load_facilities(POINT_SOURCES, data_dir))
+    parks = load_parks(parks_csv)
+    table = nearest_table(parks, indexes, k, radii)
+    table = pd.concat([table, park_scores(table)], axis=1)
+
+    out_path = Path(result_dir) / OUTPUT_NAME
+    table.to_csv(out_path, index=False, encoding="utf-8-sig")
+    print(f"공원 {len(parks)}개 x 시설 {len(indexes)}종 -> {out_path}")
+    return table
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="공원별 최근접 시설 거리 / 반경 내 시설 수")
+    parser.add_argument("--parks", default=str(PARKS_CSV), help="공원명 / 공원_lat / 공원_lng (또는 name_raw / lat / lng) CSV")
+    parser.add_argument("--data-dir", default=str(DATA_DIR))
+    parser.add_argument("--result-dir", default=str(RESULT_DIR))
+    parser.add_argument("--k", type=int, default=K_NEAREST)
+    parser.add_argument("--radii", type=int, nargs="+", default=RADII_M)
+    args = parser.parse_args()
+
+    table = run(args.parks, args.data_dir, args.result_dir, args.k, args.radii)
+    print(table[["공원명"] + [c for c in PARK_SCORES if c in table]].to_string(index=False))
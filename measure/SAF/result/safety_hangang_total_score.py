@@ -1,6 +1,12 @@
 # 한강 공원 안전성 점수 계산
-import pandas as pd
 import io
+import sys
+from pathlib import Path
+
+import pandas as pd
+
+sys.path.append(str(Path(__file__).resolve().parents[2]))   # measure/
+from park_registry import ParkRegistry
 
 # 1. 자치구별 안전성 점수 데이터 불러오기
 safety_data = pd.read_csv('measure/SAF/result/safety_total_score.csv').to_csv(index=False)
@@ -9,20 +15,12 @@ saf_df = pd.read_csv(io.StringIO(safety_data))
 # '자치구'를 인덱스로 설정
 saf_df.set_index('자치구', inplace=True)
 
-# 2. 한강공원과 해당 자치구 목록 정의
-han_parks = {
-    '광나루한강공원': ['강동구', '송파구'],
-    '잠실한강공원': ['송파구'],
-    '뚝섬한강공원': ['광진구'],
-    '잠원한강공원': ['강남구', '서초구'],
-    '반포한강공원': ['서초구'],
-    '이촌한강공원': ['용산구'],
-    '망원한강공원': ['마포구'],
-    '양화한강공원': ['영등포구'],
-    '난지한강공원': ['마포구'],
-    '강서한강공원': ['강서구'],
-    '여의도한강공원': ['영등포구']
-}
+# 2. 한강공원과 해당 자치구 목록 (공원 레지스트리)
+registry = ParkRegistry()
+han_parks = {registry.name_of(pid): registry.gu_of(pid) for pid in registry.hangang_ids()}
+
+# 자치구 표기 정규화 ('강남' / '강남구 ' -> '강남구')
+saf_df.index = [registry.resolve_gu(g) or g for g in saf_df.index]
 
 # 3. 계산할 점수 컬럼 목록
 score_columns = ['safety_score', 'CRI_score', 'DRM_score', 'FIR_score', 'MED_score', 'RST_score', 'TRA_score']
@@ -31,7 +29,7 @@ score_columns = ['safety_score', 'CRI_score', 'DRM_score', 'FIR_score', 'MED_sco
 park_safety_scores = []
 
 for park, districts in han_parks.items():
-    park_scores = {'한강공원': park}
+    park_scores = {'한강공원': park, 'park_id': registry.resolve(park)}
     
     for col in score_columns:
         scores = []
@@ -52,6 +50,14 @@ for park, districts in han_parks.items():
 
 # 5. 결과를 DataFrame으로 변환하고 CSV로 저장
 output_df = pd.DataFrame(park_safety_scores)
+
+# 공원 버퍼 안 실제 시설 기반 점수 (spatial_join.py 결과가 있으면 추가)
+facility_path = Path('measure/SAF/result/hangang_park_facilities.csv')
+if facility_path.exists():
+    facility_df = pd.read_csv(facility_path, encoding='utf-8-sig')
+    output_df = output_df.merge(facility_df[['park_id', 'facility_score']], on='park_id', how='left')
+else:
+    print(f"참고: {facility_path} 없음 (spatial_join.py 실행 시 facility_score 추가)")
 output_df = output_df.sort_values(by='safety_score', ascending=False) # 종합 점수 기준 정렬
 
 output_filename = 'safety_hangang_total_score.csv'
@@ -0,0 +1,509 @@
+## SAF(안전성) 지표 엔진: analysis/{CRI,DRM,FIR,MED,RST,TRA}/*.ipynb + safety_integration.ipynb 대체
+# 지표 노트북마다 반복하던 (CSV 읽기 -> 자치구 추출 -> 구별 집계 -> MinMax 점수화 -> _result.csv 저장)을
+# 아래 SOURCES 명세 테이블 하나로 정의하고
+#   1) 모든 원본 파일을 스레드로 병렬 로드 + 구별 집계 (원본 파일 수정 시각 기준 캐시)
+#   2) 구별 집계값을 (자치구 x 지표) 표 하나로 합쳐 모든 점수를 한 번에 계산
+#   3) 분야 가중치(GROUPS) / 종합 가중치(SAFETY_WEIGHTS)로 safety_total_score.csv 바로 생성
+# 점수 계산과 가중치는 노트북과 같다. (MED-PHCENTER의 StandardScaler -> MinMax는 MinMax와 같으므로 MinMax만 적용)
+# 원본 데이터가 없는 지표(예: DRM-EMERGWATER, MED-PHARM)는 result/의 기존 _result.csv 점수를 그대로 사용한다.
+#
+# 명세 필드
+#   path      data/ 기준 원본 파일              read     read_csv 추가 인자 (예: skiprows)
+#   join      다른 파일과 병합 (역 -> 구 매핑 등) filter   {컬럼: 값} 같은 행만 사용
+#   numeric   숫자로 바꿀 컬럼 (쉼표 / '-' 처리) derive   df -> df 파생 컬럼
+#   gu        자치구: {"col"} 자치구 컬럼 / {"address": [주소 컬럼]} 주소에서 추출 (gu_resolver) / {"contains": "short", "cols"}
+#   metrics   {집계 컬럼: (원본 컬럼, 집계 함수)}   scores   {점수 컬럼: score(집계 컬럼, 방법, 방향)}
+#   mean      {평균 점수 컬럼: {점수 컬럼: 가중치} 또는 None(단순 평균)}
+import os
+import re
+import sys
+import json
+import hashlib
+import argparse
+from pathlib import Path
+from concurrent.futures import ThreadPoolExecutor
+
+import numpy as np
+import pandas as pd
+
+sys.path.append(str(Path(__file__).resolve().parents[1]))   # measure/
+from gu_resolver import SEOUL_GU, resolve_gu, resolve_gu_columns
+
+SAF_DIR = Path("measure/SAF")
+DATA_DIR = SAF_DIR / "data"
+RESULT_DIR = SAF_DIR / "result"
+CACHE_DIR = SAF_DIR / "cache"
+OUTPUT_NAME = "safety_total_score.csv"
+ENCODINGS = ("utf-8-sig", "cp949", "euc-kr", "utf-8")
+
+
+
+def score(metric, method="minmax", direction=1):
+    """
+    method: minmax(0~100) / avg50(평균=50점, 0~100 clip) / policy(3개 이상 100, 2개 70, 1개 40)
+    direction: 1이면 값이 클수록 높은 점수, -1이면 반대 (100 - 점수)
+    """
+    return {"metric": metric, "method": method, "direction": direction}
+
+
+# ====================================================================================
+# 지표 명세 (노트북과 같은 순서)
+SOURCES = [
+    # ---------------- CRI ----------------
+    {"name": "CRI-BIG5CRIME", "group": "CRI", "path": "CRI-BIG5CRIME/CRI-BIG5CRIME.csv",
+     "numeric": ["합계 발생", "합계 검거"],
+     "derive": lambda df: df.assign(arrest_rate=df["합계 검거"] / df["합계 발생"] * 100),
+     "gu": {"col": "자치구"},
+     "metrics": {"big5crime_occurrence": ("합계 발생", "first"),
+                 "big5crime_arrest_rate": ("arrest_rate", "first")},
+     "scores": {"big5crime_occurrence_score": score("big5crime_occurrence"),
+                "big5crime_arrest_score": score("big5crime_arrest_rate")}},
+    {"name": "CRI-CCTV", "group": "CRI", "path": "CRI-CCTV/CRI-CCTV.csv",
+     "numeric": ["CCTV 총계"],
+     "gu": {"col": "자치구"},
+     "metrics": {"cctv_count": ("CCTV 총계", "first")},
+     "scores": {"cctv_score": score("cctv_count")}},
+
+    # ---------------- DRM ----------------
+    {"name": "DRM-CIVDEF", "group": "DRM", "path": "DRM-CIVDEF/DRM-CIVDEF.csv",
+     "filter": {"영업상태명": "영업/정상"},
+     "numeric": ["소재지면적"],
+     "gu": {"address": ["도로명주소"]},
+     "metrics": {"civdef_count": ("관리번호", "count"),
+                 "civdef_total_area": ("소재지면적", "sum"),
+                 "civdef_avg_area": ("소재지면적", "mean")},
+     "scores": {"civdef_count_score": score("civdef_count"),
+                "civdef_total_area_score": score("civdef_total_area"),
+                "civdef_avg_area_score": score("civdef_avg_area")},
+     "mean": {"civdef_mean_score": None}},
+    {"name": "DRM-EMERGWATER", "group": "DRM", "path": "DRM-EMERGWATER/DRM-EMERGWATER.csv",
+     "numeric": ["양수량(톤/일)", "자가발전기출력(kw)"],
+     "derive": lambda df: df.assign(has_generator=(df["자가발전기출력(kw)"] > 0).astype(float)),
+     "gu": {"col": "자치구"},
+     "metrics": {"emergwater_count": ("관리번호", "count"),
+                 "emergwater_total_supply": ("양수량(톤/일)", "sum"),
+                 "emergwater_avg_supply": ("양수량(톤/일)", "mean"),
+                 "emergwater_gen_ratio": ("has_generator", "mean")},
+     "scores": {"emergwater_count_score": score("emergwater_count"),
+                "emergwater_total_supply_score": score("emergwater_total_supply"),
+                "emergwater_avg_supply_score": score("emergwater_avg_supply"),
+                "emergwater_gen_ratio_score": score("emergwater_gen_ratio")},
+     "mean": {"emergwater_mean_score": None}},
+    {"name": "DRM-FLOODSHELTER", "group": "DRM", "path": "DRM-FLOODSHELTER/DRM-FLOODSHELTER.csv",
+     "numeric": ["QTY_CPTY"],
+     "gu": {"col": "SGG_NM"},
+     "metrics": {"floodshelter_count": ("EQUP_NM", "count"),
+                 "floodshelter_total_capacity": ("QTY_CPTY", "sum"),
+                 "floodshelter_avg_capacity": ("QTY_CPTY", "mean")},
+     "scores": {"floodshelter_count_score": score("floodshelter_count"),
+                "floodshelter_total_capacity_score": score("floodshelter_total_capacity"),
+                "floodshelter_avg_capacity_score": score("floodshelter_avg_capacity")},
+     "mean": {"floodshelter_mean_score": None}},
+    {"name": "DRM-PMSHELTER", "group": "DRM", "path": "DRM-PMSHELTER/DRM-PMSHELTER.csv",
+     "numeric": ["이용가능인원"],
+     "gu": {"col": "행정동 이름"},
+     "metrics": {"pmshelter_count": ("시설 이름", "count"),
+                 "pmshelter_total_capacity": ("이용가능인원", "sum")},
+     "scores": {"pmshelter_count_score": score("pmshelter_count"),
+                "pmshelter_total_capacity_score": score("pmshelter_total_capacity")},
+     "mean": {"pmshelter_mean_score": {"pmshelter_count_score": 0.4, "pmshelter_total_capacity_score": 0.6}}},
+    {"name": "DRM-QUAKEOUTSHELTER", "group": "DRM", "path": "DRM-QUAKEOUTSHELTER/DRM-QUAKEOUTSHELTER.csv",
+     "numeric": ["시설면적"],
+     "gu": {"col": "시군구명"},
+     "metrics": {"quakeoutshelter_count": ("수용시설명", "count"),
+                 "quakeoutshelter_total_area": ("시설면적", "sum"),
+                 "quakeoutshelter_avg_area": ("시설면적", "mean")},
+     "scores": {"quakeoutshelter_count_score": score("quakeoutshelter_count"),
+                "quakeoutshelter_total_area_score": score("quakeoutshelter_total_area"),
+                "quakeoutshelter_avg_area_score": score("quakeoutshelter_avg_area")},
+     "mean": {"quakeoutshelter_mean_score": None}},
+    {"name": "DRM-QUAKESHELTER", "group": "DRM", "path": "DRM-QUAKESHELTER/DRM-QUAKESHELTER.csv",
+     "numeric": ["시설면적"],
+     "gu": {"col": "시군구명"},
+     "metrics": {"quakeshelter_count": ("시설명", "count"),
+                 "quakeshelter_total_area": ("시설면적", "sum"),
+                 "quakeshelter_avg_area": ("시설면적", "mean")},
+     "scores": {"quakeshelter_count_score": score("quakeshelter_count"),
+                "quakeshelter_total_area_score": score("quakeshelter_total_area"),
+                "quakeshelter_avg_area_score": score("quakeshelter_avg_area")},
+     "mean": {"quakeshelter_mean_score": None}},
+
+    # ---------------- FIR ----------------
+    # 서ㆍ센터명에 구 이름('구' 제외)이 들어 있으면 그 구로 (노트북 extract_gu와 같은 순서로 첫 번째 일치)
+    {"name": "FIR-FIRESTATION", "group": "FIR", "path": "FIR-FIRESTATION/FIR-FIRESTATION.csv",
+     "derive": lambda df: df.assign(is_station=(df["유형구분명"] == "소방서").astype(float)),
+     "gu": {"contains": "short", "cols": ["서ㆍ센터명"]},
+     "metrics": {"firestation_count": ("서ㆍ센터명", "count"),
+                 "firestation_type_ratio": ("is_station", "mean")},
+     "scores": {"firestation_count_score": score("firestation_count"),
+                "firestation_ratio_score": score("firestation_type_ratio")},
+     "mean": {"firestation_mean_score": None}},
+
+    # ---------------- MED ----------------
+    {"name": "MED-MEDINST", "group": "MED", "path": "MED-MEDINST/MED-MEDINST.csv",
+     "numeric": ["병원수 소계", "병상수 소계"],
+     "gu": {"col": "자치구"},
+     "metrics": {"hospital_count": ("병원수 소계", "first"),
+                 "bed_count": ("병상수 소계", "first")},
+     "scores": {"hospital_count_score": score("hospital_count"),
+                "bed_count_score": score("bed_count")},
+     "mean": {"medinst_mean_score": None}},
+    {"name": "MED-PHARM", "group": "MED", "path": "MED-PHARM/MED-PHARM.csv",
+     "filter": {"영업상태명": "영업/정상"},
+     "gu": {"address": ["도로명주소", "지번주소"]},
+     "metrics": {"pharmacy_count": (None, "size")},
+     "scores": {"pharmacy_score": score("pharmacy_count", "avg50")}},
+    {"name": "MED-PHCENTER", "group": "MED", "path": "MED-PHCENTER/MED-PHCENTER.csv",
+     "numeric": ["보건소", "보건분소", "보건지소"],
+     "gu": {"col": "자치구"},
+     "metrics": {"보건소": ("보건소", "sum"), "보건분소": ("보건분소", "sum"), "보건지소": ("보건지소", "sum")},
+     "scores": {"phcenter_score": score("보건소"),
+                "phbranch_score": score("보건분소"),
+                "phsubcenter_score": score("보건지소")},
+     "mean": {"phcenter_mean_score": None}},
+
+    # ---------------- RST ----------------
+    {"name": "RST-CLIMATESHELTER", "group": "RST", "path": "RST-CLIMATESHELTER/RST-CLIMATESHELTER.csv",
+     "gu": {"col": "구이름"},
+     "metrics": {"climateshelter_count": (None, "size")},
+     "scores": {"climateshelter_score": score("climateshelter_count")},
+     "mean": {"climateshelter_mean_score": None}},
+    {"name": "RST-COLDSHELTER", "group": "RST", "path": "RST-COLDSHELTER/RST-COLDSHELTER.csv",
+     "filter": {"사용여부": "Y"},
+     "numeric": ["이용가능인원", "시설면적"],
+     "gu": {"address": ["도로명주소"]},
+     "metrics": {"coldshelter_count": ("쉼터명칭", "count"),
+                 "coldshelter_capacity": ("이용가능인원", "sum"),
+                 "coldshelter_area": ("시설면적", "sum")},
+     "scores": {"coldshelter_count_score": score("coldshelter_count"),
+                "coldshelter_capacity_score": score("coldshelter_capacity"),
+                "coldshelter_area_score": score("coldshelter_area")},
+     "mean": {"coldshelter_mean_score": None}},
+    {"name": "RST-HEATSHELTER", "group": "RST", "path": "RST-HEATSHELTER/RST-HEATSHELTER.csv",
+     "numeric": ["이용가능인원", "시설면적"],
+     "gu": {"address": ["도로명주소"]},
+     "metrics": {"heatshelter_count": ("쉼터명칭", "count"),
+                 "heatshelter_capacity": ("이용가능인원", "sum"),
+                 "heatshelter_area": ("시설면적", "sum")},
+     "scores": {"heatshelter_count_score": score("heatshelter_count"),
+                "heatshelter_capacity_score": score("heatshelter_capacity"),
+                "heatshelter_area_score": score("heatshelter_area")},
+     "mean": {"heatshelter_mean_score": None}},
+    {"name": "RST-LIBSHELTER", "group": "RST", "path": "RST-LIBSHELTER/RST-LIBSHELTER.csv",
+     "gu": {"col": "자치구"},
+     "metrics": {"libshelter_count": ("도서관명", "count")},
+     "scores": {"libshelter_score": score("libshelter_count")}},
+    # 스마트쉼터는 결측이 많아 RST 점수에는 넣지 않음 (safety_integration.ipynb와 동일)
+    {"name": "RST-SMARTSHELTER", "group": "RST", "path": "RST-SMARTSHELTER/RST-SMARTSHELTER.csv",
+     "read": {"skiprows": 3},
+     "gu": {"address": ["상세주소"]},
+     "metrics": {"smartshelter_count": (None, "size")},
+     "scores": {"smartshelter_score": score("smartshelter_count", "policy")}},
+
+    # ---------------- TRA ----------------
+    {"name": "TRA-SUBCONGEST", "group": "TRA", "path": "TRA-SUBCONGEST/TRA-SUBCONGEST.csv",
+     "join": {"path": "TRA-SUBCONGEST/서울시 지하철역 엘리베이터 위치정보.csv",
+              "columns": ["시군구명", "지하철역명"], "left_on": "출발역", "right_on": "지하철역명"},
+     "derive": lambda df: df.assign(
+         station_mean_congest=df[[c for c in df.columns if re.match(r"^\d+시\d+분$", str(c))]].mean(axis=1)),
+     "gu": {"col": "시군구명"},
+     "metrics": {"station_mean_congest": ("station_mean_congest", "mean")},
+     "scores": {"subway_congest_score": score("station_mean_congest")}},
+    {"name": "TRA-TRAACCIDENT", "group": "TRA", "path": "TRA-TRAACCIDENT/TRA-TRAACCIDENT.csv",
+     "numeric": ["발생건수 (건)", "사망자수 (명)", "부상자수 (명)"],
+     "gu": {"col": "자치구"},
+     "metrics": {"발생건수": ("발생건수 (건)", "first"),
+                 "사망자수": ("사망자수 (명)", "first"),
+                 "부상자수": ("부상자수 (명)", "first")},
+     "scores": {"traaccident_count_score": score("발생건수"),
+                "traaccident_death_score": score("사망자수"),
+                "traaccident_injury_score": score("부상자수")},
+     "mean": {"traaccident_score": None}},
+    {"name": "TRA-TRASAFETYIDX", "group": "TRA", "path": "TRA-TRASAFETYIDX/TRA-TRASAFETYIDX.csv",
+     "numeric": ["2023"],
+     "derive": lambda df: df.assign(교통사고위험도_raw=100 - df["2023"]),
+     "gu": {"col": "자치구"},
+     "metrics": {"교통사고위험도_raw": ("교통사고위험도_raw", "first")},
+     "scores": {"교통사고위험도_score": score("교통사고위험도_raw")}},
+]
+
+# 분야별 가중치 (safety_integration.ipynb)
+GROUPS = {
+    # Big5 = (발생 점수 + 검거율 점수) / 2 를 0.7, CCTV 0.3
+    "CRI_score": {"big5crime_occurrence_score": 0.35, "big5crime_arrest_score": 0.35, "cctv_score": 0.3},
+    # 0.5 * (민방위 + 비상급수) / 2 + 0.5 * (홍수 + 미세먼지 + 지진옥외 + 지진실내) / 4
+    "DRM_score": {"civdef_mean_score": 0.25, "emergwater_mean_score": 0.25,
+                  "floodshelter_mean_score": 0.125, "pmshelter_mean_score": 0.125,
+                  "quakeoutshelter_mean_score": 0.125, "quakeshelter_mean_score": 0.125},
+    "FIR_score": {"firestation_mean_score": 1.0},
+    "MED_score": {"medinst_mean_score": 0.5, "pharmacy_score": 0.25, "phcenter_mean_score": 0.25},
+    "RST_score": {"climateshelter_mean_score": 0.4, "coldshelter_mean_score": 0.4,
+                  "heatshelter_mean_score": 0.1, "libshelter_score": 0.1},
+    "TRA_score": {"교통사고위험도_score": 0.6, "traaccident_score": 0.3, "subway_congest_score": 0.1},
+}
+SAFETY_WEIGHTS = {"CRI_score": 0.2, "DRM_score": 0.25, "TRA_score": 0.25,
+                  "FIR_score": 0.1, "MED_score": 0.1, "RST_score": 0.1}
+
+
+# ====================================================================================
+def detect_encoding(path, sample_bytes=1 << 16):
+    """파일 앞부분만 읽어서 디코딩되는 첫 인코딩 반환 (cp949 재시도로 파일 전체를 다시 읽지 않음)"""
+    with open(path, "rb") as f:
+        sample = f.read(sample_bytes)
+    if len(sample) == sample_bytes and b"\n" in sample:
+        sample = sample[:sample.rfind(b"\n")]
+    for enc in ENCODINGS:
+        try:
+            sample.decode(enc)
+            return enc
+        except UnicodeDecodeError:
+            continue
+    raise ValueError(f"CSV 인코딩 자동 판별 실패: {path}")
+
+
+def read_source_csv(path, **kwargs):
+    return pd.read_csv(path, encoding=detect_encoding(path), **kwargs)
+
+
+def to_numeric(series):
+    """'1,234' -> 1234, '-' / 빈 값 -> 0"""
+    s = series.astype(str).str.replace(",", "", regex=False).str.strip().replace({"-": "0"})
+    return pd.to_numeric(s, errors="coerce").fillna(0)
+
+
+def extract_gu(df, rule):
+    """명세의 gu 규칙으로 자치구 Series 생성 (25개 자치구가 아닌 값은 NaN)"""
+    if "col" in rule:
+        gu = resolve_gu(df[rule["col"]], stem=True)
+    elif "address" in rule:
+        gu = resolve_gu_columns(df, rule["address"])
+    else:
+        # 서ㆍ센터명처럼 '구'가 빠진 이름: 목록 순서대로 처음 포함되는 구 (노트북 extract_gu와 같은 규칙)
+        gu = pd.Series(np.nan, index=df.index, dtype=object)
+        for col in rule["cols"]:
+            text = df[col].fillna("").astype(str)
+            for name in SEOUL_GU:
+                gu = gu.mask(gu.isna() & text.str.contains(name.replace("구", ""), regex=False), name)
+    return gu.where(gu.isin(SEOUL_GU))
+
+
+def source_files(spec, data_dir=DATA_DIR):
+    files = [Path(data_dir) / spec["path"]]
+    if "join" in spec:
+        files.append(Path(data_dir) / spec["join"]["path"])
+    return files
+
+
+def aggregate_source(spec, data_dir=DATA_DIR):
+    """원본 파일 하나 -> (자치구 x 집계 컬럼) DataFrame"""
+    data_dir = Path(data_dir)
+    df = read_source_csv(data_dir / spec["path"], **spec.get("read", {}))
+    df.columns = [str(c).strip() for c in df.columns]
+    if "join" in spec:
+        join = spec["join"]
+        right = read_source_csv(data_dir / join["path"])[join["columns"]].drop_duplicates()
+        df = df.merge(right, left_on=join["left_on"], right_on=join["right_on"], how="left")
+    for col, value in spec.get("filter", {}).items():
+        df = df[df[col] == value]
+    for col in spec.get("numeric", []):
+        df[col] = to_numeric(df[col])
+    if "derive" in spec:
+        df = spec["derive"](df)
+
+    df = df.assign(_gu=extract_gu(df, spec["gu"]))
+    dropped = df[df["_gu"].isna()]
+    if len(dropped):
+        rule = spec["gu"]
+        col = rule["col"] if "col" in rule else rule.get("address", rule.get("cols"))[0]
+        sample = pd.unique(dropped[col].astype(str))[:5]
+        print(f"참고: {spec['name']}: 자치구를 찾지 못한 {len(dropped)}행 제외 ({col}: {', '.join(sample)})")
+    df = df.dropna(subset=["_gu"])
+    named = {out: ("_gu" if col is None else col, how) for out, (col, how) in spec["metrics"].items()}
+    agg = df.groupby("_gu").agg(**named)
+    agg.index.name = "자치구"
+    return agg.astype(float)
+
+
+def load_precomputed(spec, result_dir=RESULT_DIR):
+    """원본이 없을 때 기존 _result.csv의 점수 컬럼 사용"""
+    path = Path(result_dir) / spec["group"] / f"{spec['name']}_result.csv"
+    if not path.exists():
+        return None
+    df = read_source_csv(path)
+    gu_col = next(c for c in ("자치구", "gu", "구이름") if c in df.columns)
+    wanted = list(spec["scores"]) + list(spec.get("mean", {}))
+    df = df.set_index(df[gu_col].astype(str).str.strip())[[c for c in wanted if c in df.columns]]
+    df.index.name = "자치구"
+    return df.astype(float)
+
+
+# ====================================================================================
+class SourceCache:
+    """원본 파일별 구별 집계 캐시 (원본 수정 시각 / 크기 / 명세가 그대로면 다시 읽지 않음)"""
+    def __init__(self, cache_dir=CACHE_DIR):
+        self.cache_dir = Path(cache_dir)
+        self.cache_dir.mkdir(parents=True, exist_ok=True)
+        self.manifest_path = self.cache_dir / "manifest.json"
+        self.manifest = {}
+        if self.manifest_path.exists():
+            with open(self.manifest_path, "r", encoding="utf-8") as f:
+                self.manifest = json.load(f)
+
+    @staticmethod
+    def fingerprint(spec, files):
+        def default(obj):
+            code = getattr(obj, "__code__", None)
+            return code.co_code.hex() + repr(code.co_consts) if code else repr(obj)
+        stats = [[str(p), os.stat(p).st_mtime, os.stat(p).st_size] for p in files]
+        payload = json.dumps([spec, stats], sort_keys=True, ensure_ascii=False, default=default)
+        return hashlib.sha1(payload.encode("utf-8")).hexdigest()
+
+    def path(self, name):
+        return self.cache_dir / f"{name}.parquet"
+
+    def get(self, name, key):
+        if self.manifest.get(name) == key and self.path(name).exists():
+            return pd.read_parquet(self.path(name))
+        return None
+
+    def put(self, name, key, agg):
+        tmp_path = str(self.path(name)) + ".tmp"
+        agg.to_parquet(tmp_path)
+        os.replace(tmp_path, self.path(name))
+        self.manifest[name] = key
+
+    def save(self):
+        tmp_path = str(self.manifest_path) + ".tmp"
+        with open(tmp_path, "w", encoding="utf-8") as f:
+            json.dump(self.manifest, f, ensure_ascii=False, indent=2)
+        os.replace(tmp_path, self.manifest_path)
+
+
+def load_sources(sources=SOURCES, data_dir=DATA_DIR, result_dir=RESULT_DIR, cache=None, workers=8):
+    """
+    모든 원본을 병렬로 로드
+    반환: (집계 표: 자치구 x 집계 컬럼, 기존 점수 표: 원본이 없는 지표의 _result.csv 점수)
+    """
+    def load(spec):
+        files = source_files(spec, data_dir)
+        if not all(p.exists() for p in files):
+            return spec["name"], None, load_precomputed(spec, result_dir)
+        key = cache.fingerprint(spec, files) if cache else None
+        agg = cache.get(spec["name"], key) if cache else None
+        if agg is None:
+            agg = aggregate_source(spec, data_dir)
+            if cache:
+                cache.put(spec["name"], key, agg)
+        return spec["name"], agg, None
+
+    with ThreadPoolExecutor(max_workers=max(1, min(workers, len(sources)))) as pool:
+        results = list(pool.map(load, sources))
+    if cache:
+        cache.save()
+
+    metrics, precomputed = [], []
+    for name, agg, pre in results:
+        if agg is not None:
+            metrics.append(agg)
+        elif pre is not None:
+            print(f"⚠️ {name}: 원본 데이터가 없어 기존 _result.csv 점수 사용")
+            precomputed.append(pre)
+        else:
+            print(f"⚠️ {name}: 원본 데이터와 _result.csv가 모두 없어 제외")
+    metrics = pd.concat(metrics, axis=1).reindex(SEOUL_GU) if metrics else pd.DataFrame(index=SEOUL_GU)
+    precomputed = pd.concat(precomputed, axis=1).reindex(SEOUL_GU) if precomputed else pd.DataFrame(index=SEOUL_GU)
+    return metrics, precomputed
+
+
+def compute_scores(metrics, precomputed=None, sources=SOURCES):
+    """(자치구 x 집계 컬럼) -> (자치구 x 점수 컬럼), 같은 방법의 점수는 한 번에 계산"""
+    score_specs = {col: s for spec in sources for col, s in spec["scores"].items() if s["metric"] in metrics}
+    scores = pd.DataFrame(index=metrics.index)
+
+    for method in ("minmax", "avg50", "policy"):
+        cols = [c for c, s in score_specs.items() if s["method"] == method]
+        if not cols:
+            continue
+        X = metrics[[score_specs[c]["metric"] for c in cols]].to_numpy(dtype=float)
+        if method == "minmax":
+            lo, hi = np.nanmin(X, axis=0), np.nanmax(X, axis=0)
+            rng = np.where(hi > lo, hi - lo, 1.0)
+            S = (X - lo) / rng * 100                 # 값이 모두 같으면 0점 (MinMaxScaler와 동일)
+        elif method == "avg50":
+            S = np.clip(X / np.nanmean(X, axis=0) * 50, 0, 100)
+        else:
+            S = np.select([X >= 3, X == 2, X == 1], [100, 70, 40], 0).astype(float)
+            S[np.isnan(X)] = np.nan
+        direction = np.array([score_specs[c]["direction"] for c in cols])
+        S = np.where(direction < 0, 100 - S, S)
+        scores[cols] = S
+
+    # 지표별 평균 점수
+    for spec in sources:
+        for mean_col, weights in spec.get("mean", {}).items():
+            weights = weights or {c: 1 / len(spec["scores"]) for c in spec["scores"]}
+            if all(c in scores for c in weights):
+                scores[mean_col] = sum(scores[c] * w for c, w in weights.items())
+
+    if precomputed is not None and not precomputed.empty:
+        scores = scores.combine_first(precomputed)
+    return scores
+
+
+def integrate(scores, groups=GROUPS, safety_weights=SAFETY_WEIGHTS):
+    """분야 점수(결측 자치구는 분야 중앙값) + 종합 safety_score"""
+    final = pd.DataFrame(index=scores.index)
+    for group_col, weights in groups.items():
+        missing = [c for c in weights if c not in scores]
+        if missing:
+            print(f"⚠️ {group_col}: 점수 컬럼 없음 {missing} -> 나머지 가중치로 계산")
+        weights = {c: w for c, w in weights.items() if c in scores}
+        total = sum(weights.values())
+        # 구성 점수 중 하나라도 없으면 NaN (노트북의 inner merge와 같음) -> 중앙값으로 보정
+        value = sum(scores[c] * (w / total) for c, w in weights.items())
+        final[group_col] = value.fillna(value.median())
+    final["safety_score"] = sum(final[c] * w for c, w in safety_weights.items())
+    final.index.name = "자치구"
+    return final.reset_index()
+
+
+def save_indicator_results(metrics, scores, result_dir=RESULT_DIR, sources=SOURCES):
+    """노트북과 같은 위치에 지표별 _result.csv 저장 (자치구 + 집계 + 점수)"""
+    for spec in sources:
+        cols = [c for c in list(spec["metrics"]) if c in metrics] + \
+               [c for c in list(spec["scores"]) + list(spec.get("mean", {})) if c in scores]
+        if not any(c in scores for c in spec["scores"]):
+            continue
+        out = pd.concat([metrics, scores], axis=1)[cols].dropna(how="all")
+        out_path = Path(result_dir) / spec["group"] / f"{spec['name']}_result.csv"
+        out_path.parent.mkdir(parents=True, exist_ok=True)
+        out.reset_index().to_csv(out_path, index=False, encoding="utf-8-sig")
+
+
+def run(data_dir=DATA_DIR, result_dir=RESULT_DIR, cache_dir=CACHE_DIR, workers=8, write_results=False):
+    cache = SourceCache(cache_dir) if cache_dir else None
+    metrics, precomputed = load_sources(SOURCES, data_dir, result_dir, cache, workers)
+    scores = compute_scores(metrics, precomputed)
+    final = integrate(scores)
+
+    out_path = Path(result_dir) / OUTPUT_NAME
+    final.to_csv(out_path, index=False)
+    print("저장:", out_path)
+    if write_results:
+        save_indicator_results(metrics, scores, result_dir)
+    return final
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="SAF 안전성 지표 계산 (명세 기반)")
+    parser.add_argument("--data-dir", default=str(DATA_DIR))
+    parser.add_argument("--result-dir", default=str(RESULT_DIR))
+    parser.add_argument("--cache-dir", default=str(CACHE_DIR))
+    parser.add_argument("--no-cache", action="store_true")
+    parser.add_argument("--workers", type=int, default=8)
+    parser.add_argument("--write-results", action="store_true", help="지표별 _result.csv도 저장")
+    args = parser.parse_args()
+
+    final = run(args.data_dir, args.result_dir, None if args.no_cache else args.cache_dir,
+                args.workers, args.write_results)
+    print(final.to_string(index=False))
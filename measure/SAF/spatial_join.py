@@ -0,0 +1,187 @@
+## 시설 좌표 -> 자치구 / 한강공원 공간 조인
+# SAF 지표는 주소 문자열의 구 이름으로만 집계되고, 한강공원 안전성은 han_parks에 적힌 구 점수의 평균이었다.
+# 여기서는 좌표가 있는 시설 데이터(대피소 / 쉼터 / 소방서 등)를 한 번에 점으로 만들고
+#   - map/bnd_sigungu_11_2024_2Q 자치구 폴리곤
+#   - map/result/hangang_parks.shp 한강공원 폴리곤 (BUFFER_M 만큼 버퍼)
+# 에 STRtree로 일괄 point-in-polygon 조인한다. (점 수만 개도 쿼리 한 번)
+#
+# 결과 (measure/SAF/result/)
+#   facility_gu_counts.csv        자치구 x 시설 종류 개수 (좌표 기준)
+#   hangang_park_facilities.csv   한강공원 x 시설 종류 개수 + facility_score (공원 간 MinMax 평균, 0~100)
+# safety_hangang_total_score.py가 hangang_park_facilities.csv를 park_id로 붙인다.
+#
+# CCTV / 병원(MED-MEDINST) / 범죄 데이터는 구별 집계표라 좌표가 없어서 대상에서 빠진다.
+import sys
+import argparse
+from pathlib import Path
+
+import numpy as np
+import pandas as pd
+import geopandas as gpd
+from shapely import STRtree
+
+from saf_engine import DATA_DIR, RESULT_DIR, read_source_csv
+
+sys.path.append(str(Path(__file__).resolve().parents[1]))   # measure/
+from park_registry import ParkRegistry
+
+GU_SHP = Path("map/bnd_sigungu_11_2024_2Q/bnd_sigungu_11_2024_2Q.shp")
+HANGANG_SHP = Path("map/result/hangang_parks.shp")
+WORK_CRS = "EPSG:5186"          # 미터 단위 (버퍼 / 거리 계산용)
+BUFFER_M = 500
+# 서울시 경계 여유 범위 (경도 / 위도), 밖에 있는 점은 좌표 오류로 보고 제외
+SEOUL_BBOX = (126.70, 37.40, 127.25, 37.75)
+
+# hangang_parks.shp의 영문 park_name -> 공원 레지스트리 이름
+HANGANG_SHP_NAMES = {
+    "Gwangnaru": "광나루한강공원", "Jamsil": "잠실한강공원", "Ttukseom": "뚝섬한강공원",
+    "Jamwon": "잠원한강공원", "Banpo": "반포한강공원", "Ichon": "이촌한강공원",
+    "Mangwon": "망원한강공원", "Yanghwa": "양화한강공원", "Nanji": "난지한강공원",
+    "Gangseo": "강서한강공원", "Yeouido": "여의도한강공원",
+}
+
+# 좌표가 있는 시설 데이터 (x / y 컬럼과 좌표계)
+#   LOCALDATA(민방위대피시설)는 EPSG:5174, 서울 열린데이터 X/Y는 EPSG:5186, 경도 / 위도는 EPSG:4326
+#   RST-COLDSHELTER는 원본 컬럼명이 뒤바뀌어 있음 ('경도'에 위도, '위도'에 경도 값)
+POINT_SOURCES = [
+    {"name": "DRM-CIVDEF", "path": "DRM-CIVDEF/DRM-CIVDEF.csv",
+     "x": "좌표정보(X)", "y": "좌표정보(Y)", "crs": "EPSG:5174", "filter": {"영업상태명": "영업/정상"}},
+    {"name": "DRM-FLOODSHELTER", "path": "DRM-FLOODSHELTER/DRM-FLOODSHELTER.csv",
+     "x": "XCORD", "y": "YCORD", "crs": "EPSG:4326"},
+    {"name": "DRM-PMSHELTER", "path": "DRM-PMSHELTER/DRM-PMSHELTER.csv",
+     "x": "X좌표", "y": "Y좌표", "crs": "EPSG:5186"},
+    {"name": "DRM-QUAKEOUTSHELTER", "path": "DRM-QUAKEOUTSHELTER/DRM-QUAKEOUTSHELTER.csv",
+     "x": "경도", "y": "위도", "crs": "EPSG:4326"},
+    {"name": "DRM-QUAKESHELTER", "path": "DRM-QUAKESHELTER/DRM-QUAKESHELTER.csv",
+     "x": "경도", "y": "위도", "crs": "EPSG:4326"},
+    {"name": "FIR-FIRESTATION", "path": "FIR-FIRESTATION/FIR-FIRESTATION.csv",
+     "x": "X좌표", "y": "Y좌표", "crs": "EPSG:5186"},
+    {"name": "RST-CLIMATESHELTER", "path": "RST-CLIMATESHELTER/RST-CLIMATESHELTER.csv",
+     "x": "X좌표", "y": "Y좌표", "crs": "EPSG:5186"},
+    {"name": "RST-COLDSHELTER", "path": "RST-COLDSHELTER/RST-COLDSHELTER.csv",
+     "x": "위도", "y": "경도", "crs": "EPSG:4326", "filter": {"사용여부": "Y"}},
+    {"name": "RST-HEATSHELTER", "path": "RST-HEATSHELTER/RST-HEATSHELTER.csv",
+     "x": "경도", "y": "위도", "crs": "EPSG:4326"},
+]
+
+
+# ====================================================================================
+class PolygonIndex:
+    """폴리곤 STRtree (key 컬럼 값으로 결과 반환)"""
+    def __init__(self, gdf, key, buffer_m=0):
+        gdf = gdf.to_crs(WORK_CRS)
+        geoms = gdf.geometry.buffer(buffer_m) if buffer_m else gdf.geometry
+        self.keys = gdf[key].to_numpy()
+        self.geoms = geoms.to_numpy()
+        self.tree = STRtree(self.geoms)
+
+    def pairs(self, points):
+        """점마다 포함하는 모든 폴리곤: (점 위치, key) DataFrame"""
+        pt_idx, poly_idx = self.tree.query(points.to_crs(WORK_CRS).to_numpy(), predicate="intersects")
+        return pd.DataFrame({"point": pt_idx, "key": self.keys[poly_idx]})
+
+    def assign(self, points):
+        """점마다 포함하는 첫 폴리곤의 key (경계 위 점은 먼저 나온 폴리곤, 없으면 NaN)"""
+        pairs = self.pairs(points).drop_duplicates("point")
+        out = np.full(len(points), np.nan, dtype=object)
+        out[pairs["point"].to_numpy()] = pairs["key"].to_numpy()
+        return pd.Series(out, index=points.index)
+
+
+def load_points(spec, data_dir=DATA_DIR):
+    """시설 CSV -> 점 GeoDataFrame (WORK_CRS, 좌표가 없거나 서울 범위 밖인 행 제외)"""
+    df = read_source_csv(Path(data_dir) / spec["path"])
+    df.columns = [str(c).strip() for c in df.columns]
+    for col, value in spec.get("filter", {}).items():
+        df = df[df[col] == value]
+    x = pd.to_numeric(df[spec["x"]], errors="coerce")
+    y = pd.to_numeric(df[spec["y"]], errors="coerce")
+    ok = np.isfinite(x) & np.isfinite(y) & (x != 0) & (y != 0)
+    points = gpd.GeoDataFrame({"source": spec["name"]}, index=df.index[ok],
+                              geometry=gpd.points_from_xy(x[ok], y[ok]), crs=spec["crs"])
+
+    lonlat = points.geometry.to_crs("EPSG:4326")
+    lon, lat = lonlat.x.to_numpy(), lonlat.y.to_numpy()
+    minx, miny, maxx, maxy = SEOUL_BBOX
+    inside = np.isfinite(lon) & np.isfinite(lat) & (lon >= minx) & (lon <= maxx) & (lat >= miny) & (lat <= maxy)
+    dropped = len(df) - int(inside.sum())
+    if not inside.any():
+        print(f"⚠️ {spec['name']}: 서울 범위 안 좌표가 하나도 없음 (x/y 컬럼 / 좌표계 확인: {spec['x']}, {spec['y']}, {spec['crs']})")
+    elif dropped:
+        print(f"참고: {spec['name']}: 좌표 없음 / 서울 범위 밖 {dropped}행 제외")
+    return points[inside].to_crs(WORK_CRS)
+
+
+def load_facilities(sources=POINT_SOURCES, data_dir=DATA_DIR):
+    frames = []
+    for spec in sources:
+        if not (Path(data_dir) / spec["path"]).exists():
+            print(f"⚠️ {spec['name']}: 파일 없음, 제외")
+            continue
+        frames.append(load_points(spec, data_dir))
+    return gpd.GeoDataFrame(pd.concat(frames, ignore_index=True), crs=WORK_CRS)
+
+
+def load_hangang_parks(path=HANGANG_SHP, registry=None):
+    """구 경계로 나뉜 한강공원 폴리곤을 공원 하나로 합치고 레지스트리 park_id 부여"""
+    registry = registry or ParkRegistry()
+    parks = gpd.read_file(path).dissolve(by="park_name", as_index=False)
+    parks["공원명"] = parks["park_name"].map(HANGANG_SHP_NAMES).fillna(parks["park_name"])
+    parks["park_id"] = registry.map_ids(parks["공원명"])
+    return parks[["park_id", "공원명", "geometry"]]
+
+
+# ====================================================================================
+def facility_counts(keys, facilities, index_values):
+    """(key, source) 개수표 -> key x source (없는 칸 0)"""
+    # 한 시설이 여러 공원에 걸리면 keys 인덱스가 중복되므로 값 배열로 교차표
+    counts = pd.crosstab(keys.to_numpy(), facilities.loc[keys.index, "source"].to_numpy())
+    counts.columns.name = None
+    return counts.reindex(index_values, fill_value=0)
+
+
+def run(data_dir=DATA_DIR, result_dir=RESULT_DIR, buffer_m=BUFFER_M):
+    facilities = load_facilities(POINT_SOURCES, data_dir)
+    print(f"시설 점: {len(facilities):,}개 ({facilities['source'].nunique()}종)")
+
+    # 1) 자치구 할당
+    gu = gpd.read_file(GU_SHP)
+    gu_index = PolygonIndex(gu, "SIGUNGU_NM")
+    facilities["자치구"] = gu_index.assign(facilities.geometry)
+    in_gu = facilities["자치구"].notna().groupby(facilities["source"]).sum()
+    for name in in_gu[in_gu == 0].index:
+        print(f"⚠️ {name}: 자치구 폴리곤 안에 든 시설이 없음")
+    gu_counts = facility_counts(facilities["자치구"].dropna(), facilities, sorted(gu["SIGUNGU_NM"]))
+    gu_counts.index.name = "자치구"
+
+    # 2) 버퍼한 한강공원 폴리곤 안의 시설 (한 시설이 두 공원 버퍼에 모두 들 수 있음)
+    parks = load_hangang_parks()
+    park_index = PolygonIndex(parks, "park_id", buffer_m=buffer_m)
+    pairs = park_index.pairs(facilities.geometry)
+    near = pd.Series(pairs["key"].to_numpy(), index=facilities.index[pairs["point"].to_numpy()])
+    park_counts = facility_counts(near, facilities, parks["park_id"])
+
+    # 시설 종류별 공원 간 MinMax(0~100) 평균
+    lo, hi = park_counts.min(), park_counts.max()
+    scaled = (park_counts - lo) / (hi - lo).where(hi > lo, 1) * 100
+    park_counts["facility_score"] = scaled.mean(axis=1)
+    park_counts.index.name = "park_id"
+    park_counts = parks.drop(columns="geometry").merge(park_counts.reset_index(), on="park_id")
+    park_counts.insert(2, "buffer_m", buffer_m)
+
+    result_dir = Path(result_dir)
+    gu_counts.reset_index().to_csv(result_dir / "facility_gu_counts.csv", index=False, encoding="utf-8-sig")
+    park_counts.to_csv(result_dir / "hangang_park_facilities.csv", index=False, encoding="utf-8-sig")
+    print("저장:", result_dir / "facility_gu_counts.csv", "/", result_dir / "hangang_park_facilities.csv")
+    return facilities, gu_counts, park_counts
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="시설 좌표 -> 자치구 / 한강공원 공간 조인")
+    parser.add_argument("--data-dir", default=str(DATA_DIR))
+    parser.add_argument("--result-dir", default=str(RESULT_DIR))
+    parser.add_argument("--buffer", type=int, default=BUFFER_M, help="한강공원 버퍼 거리(m)")
+    args = parser.parse_args()
+
+    _, _, park_counts = run(args.data_dir, args.result_dir, args.buffer)
+    print(park_counts.sort_values("facility_score", ascending=False).to_string(index=False))
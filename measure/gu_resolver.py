@@ -0,0 +1,113 @@
+## 주소 -> 자치구 변환 (SAF / LEI 공통)
+# 노트북의 extract_gu는 행마다 re.search(r"(\S+구)", 주소)를 돌려서 느리고
+# "강서구청로", "중구청" 같은 도로명 / 기관명 일부도 구로 잘못 뽑는다.
+# 여기서는 map/bnd_sigungu_11_2024_2Q의 공식 자치구 이름 25개로 정규식 하나를 미리 만들고
+#   - 앞뒤가 한글이 아닐 때만 일치 (강서구청로 X, "서울 강서구 화곡로" O)
+#   - 고유 주소만 str.extract로 한 번에 처리 후 결과를 메모해서 다시 쓰지 않음
+# 으로 수십만 행도 몇 초 안에 처리한다.
+import re
+import struct
+from pathlib import Path
+
+import pandas as pd
+
+SIGUNGU_DBF = Path("map/bnd_sigungu_11_2024_2Q/bnd_sigungu_11_2024_2Q.dbf")
+
+# shp를 읽을 수 없을 때 사용하는 서울시 25개 자치구
+SEOUL_GU = [
+    "종로구","중구","용산구","성동구","광진구","동대문구","중랑구","성북구","강북구","도봉구",
+    "노원구","은평구","서대문구","마포구","양천구","강서구","구로구","금천구","영등포구",
+    "동작구","관악구","서초구","강남구","송파구","강동구"
+]
+
+
+def read_sigungu_names(dbf_path=SIGUNGU_DBF, field="SIGUNGU_NM"):
+    """시군구 경계 shp의 .dbf에서 자치구 이름 목록 읽기 (geopandas 없이 dBASE 헤더만 해석)"""
+    with open(dbf_path, "rb") as f:
+        data = f.read()
+    n_records, header_len, record_len = struct.unpack("<IHH", data[4:12])
+
+    fields, pos, offset = [], 32, 1           # 레코드 첫 바이트는 삭제 표시
+    while data[pos] != 0x0D:
+        name = data[pos:pos + 11].split(b"\0")[0].decode("ascii")
+        size = data[pos + 16]
+        fields.append((name, offset, size))
+        offset += size
+        pos += 32
+
+    _, start, size = next(f for f in fields if f[0] == field)
+    names = []
+    for i in range(n_records):
+        rec = header_len + i * record_len
+        raw = data[rec + start:rec + start + size]
+        for enc in ("utf-8", "cp949"):
+            try:
+                names.append(raw.decode(enc).strip())
+                break
+            except UnicodeDecodeError:
+                continue
+    return names
+
+
+class GuResolver:
+    def __init__(self, names=None):
+        if names is None:
+            try:
+                names = read_sigungu_names()
+            except (OSError, StopIteration, struct.error):
+                names = SEOUL_GU
+        self.names = list(names)
+        # 긴 이름 먼저 (서대문구가 대문구 등으로 잘리지 않게)
+        alternation = "|".join(re.escape(n) for n in sorted(self.names, key=len, reverse=True))
+        self.pattern = re.compile(rf"(?<![가-힣])({alternation})(?![가-힣])")
+        # '구'가 빠진 자치구 표기 (동대문 -> 동대문구), 컬럼 전체가 그 값일 때만 사용
+        self.stems = {n[:-1]: n for n in self.names}
+        self.memo = {}
+
+    def resolve(self, values, stem=False):
+        """
+        주소(또는 자치구 표기) Series -> 자치구 Series (못 찾으면 NaN)
+        고유값만 한 번 변환하고 결과는 memo에 저장
+        stem=True: 자치구 컬럼처럼 값 전체가 '동대문' / '영등포'인 경우도 자치구로 인정
+        """
+        values = pd.Series(values)
+        text = values.fillna("").astype(str)
+        unique = pd.Series(text.unique())
+        new = unique[~unique.isin(list(self.memo))]
+        if len(new):
+            found = new.str.extract(self.pattern, expand=False)
+            # '강남 구'처럼 띄어 쓴 자치구 표기: 이름과 '구' 사이 공백만 붙이고 나머지 공백은 그대로
+            retry = found.isna()
+            if retry.any():
+                joined = new[retry].str.replace(r"([가-힣]+)\s+구(?![가-힣])", r"\1구", regex=True)
+                found[retry] = joined.str.extract(self.pattern, expand=False)
+            self.memo.update(zip(new, found))
+        gu = text.map(self.memo)
+        if stem:
+            gu = gu.fillna(text.str.strip().map(self.stems))
+        return gu.where(values.notna())
+
+    def resolve_columns(self, df, cols):
+        """여러 주소 컬럼을 순서대로 시도 (예: 도로명주소 -> 지번주소)"""
+        gu = pd.Series(pd.NA, index=df.index, dtype=object)
+        for col in cols:
+            gu = gu.fillna(self.resolve(df[col]))
+        return gu
+
+
+_default = None
+
+
+def resolve_gu(values, stem=False):
+    """모듈 전역 GuResolver로 변환 (memo를 여러 데이터셋이 같이 씀)"""
+    global _default
+    if _default is None:
+        _default = GuResolver()
+    return _default.resolve(values, stem)
+
+
+def resolve_gu_columns(df, cols):
+    global _default
+    if _default is None:
+        _default = GuResolver()
+    return _default.resolve_columns(df, cols)
@@ -0,0 +1,274 @@
+## 공원 레지스트리: 데이터셋마다 다른 공원명 표기를 하나의 park_id로 맞춤
+# ACC 노트북의 PARK_ALIASES / name_candidates / norm_text / _norm, SAF의 han_parks,
+# make_hanpark.py의 이름 보정을 한 곳에 모았다.
+# 정규화한 이름(별칭, 괄호 안 이름, 리뷰 파일의 '구_공원명' 표기 포함) -> park_id 해시 인덱스를 한 번 만들고
+# 각 측정 스크립트는 park_id로 조인한다. (공원마다 전체 테이블을 isin으로 훑지 않음)
+# 매칭에 실패한 이름은 조용히 fillna(0)으로 넘어가지 않도록 경고로 출력한다.
+#
+# 사용 예 (measure/ 아래 스크립트에서)
+#   sys.path.append(str(Path(__file__).resolve().parents[N]))   # measure/ 디렉터리
+#   from park_registry import ParkRegistry
+#   registry = ParkRegistry()
+#   df = registry.attach(df, "공원명")                          # park_id 컬럼 추가
+import re
+from pathlib import Path
+
+import pandas as pd
+
+MEASURE_DIR = Path(__file__).resolve().parent
+PARK_LIST_CSV = MEASURE_DIR / "서울시 관광특구 주요공원 리스트.csv"
+
+# 한강공원과 해당 자치구 (safety_hangang_total_score.py)
+HANGANG_PARKS = {
+    '광나루한강공원': ['강동구', '송파구'],
+    '잠실한강공원': ['송파구'],
+    '뚝섬한강공원': ['광진구'],
+    '잠원한강공원': ['강남구', '서초구'],
+    '반포한강공원': ['서초구'],
+    '이촌한강공원': ['용산구'],
+    '망원한강공원': ['마포구'],
+    '양화한강공원': ['영등포구'],
+    '난지한강공원': ['마포구'],
+    '강서한강공원': ['강서구'],
+    '여의도한강공원': ['영등포구']
+}
+
+# 공원명 별칭(데이터셋 표기 차이를 흡수) - access_csv_data.ipynb / access_json_data.ipynb
+PARK_ALIASES = {
+    "송파나루근린공원(석촌호수)": ["석촌호수","송파나루공원"],
+    "인왕산도시자연공원(인왕산)": ["인왕산도시자연공원","인왕산"],
+    "북한산국립공원(북한산)": ["북한산국립공원","북한산"],
+    "서울로 7017": ["서울로7017"],
+    "낙산공원": ["낙산공원", "낙산근린공원"],
+    "효창근린공원(효창공원)": ["효창공원", "효창근린공원"],
+    "훈련원근린공원(훈련원공원)": ["훈련원근린공원"],
+    "북악산도시자연공원(북악산)": ["북악산도시자연공원"],
+    '삼청근린공원(삼청공원)':["삼청근린공원"],
+    '오금근린공원(오금오름공원/오금공원)':["오금근린공원"],
+    '아시아근린공원(아시아공원)':["아시아근린공원"],
+    '장지근린공원(장지공원)':["장지근린공원"],
+    '도곡근린공원(도곡공원)':["도곡근린공원"],
+    '안산도시자연공원(안산)':["안산도시자연공원"],
+    '백련근린공원(백련산)':["백련근린공원"],
+    '독립공원(서대문독립공원)':["독립공원"],
+    '궁동근린공원(궁동공원)':["궁동근린공원"],
+    '성북근린공원(성북공원)':['성북근린공원'],
+    '개운산근린공원(개운산)':["개운산근린공원"],
+    '청량근린공원(천장산)':["청량근린공원"],
+    '오동근린공원(오패산/오동공원)':["오동근린공원"],
+    '수락산도시자연공원(수락산)':["수락산도시자연공원"],
+    '불암산도시자연공원(불암산)':["불암산도시자연공원"],
+    '용두근린공원(용두공원)':["용두근린공원"],
+    '배봉산근린공원(배봉산)':["배봉산근린공원"],
+    '간데메근린공원(간데메공원)':["간데메근린공원"],
+    '답십리근린공원(답십리공원)':["답십리근린공원"],
+    '대현산배수지공원(응봉근린공원)':["대현산배수지공원"],
+    '성수근린공원(성수동구두테마공원)':["성수근린공원"],
+    '중랑캠핑숲(중랑가족캠핑장)':["중랑캠핑숲"],
+    '봉화산근린공원(봉화산)':["봉화산근린공원"],
+    '사가정공원(용마산)':["사가정공원"],
+    '아차산공원(아차산)':["아차산공원"],
+    '봉제산공원(봉제산근린공원/봉제산)':["봉제산공원"],
+    '개화근린공원(개화산)':["개화근린공원"],
+    '염창근린공원(염창산/증미산)':["염창근린공원"],
+    '우장산근린공원(우장산/우장산근린공원)':["우장산근린공원"],
+    '허준공원(허준근린공원)':["허준공원"],
+    '궁산근린공원(궁산)':["궁산근린공원"],
+    '꿩고개근린공원(치현산)':["꿩고개근린공원"],
+    '용왕산근린공원(용왕산)':["용왕산근린공원"],
+    '파리근린공원(파리공원)':["파리근린공원"],
+    '갈산근린공원(갈산공원/갈산)':["갈산근린공원"],
+    '개웅산근린공원(개웅산)':["개웅산근린공원"],
+    '중마루근린공원(중마루공원)':["중마루근린공원"],
+    '여의도공원(여의도도시근린공원)':["여의도공원"],
+    '영등포근린공원(영등포공원)':["영등포근린공원"],
+    '사육신공원(사육신역사공원)':["사육신공원"],
+    '삼일근린공원(삼일공원)':["삼일근린공원"],
+    '관악산공원(관악산)':["관악산공원"],
+    '문화예술공원(서초문화예술공원)':["문화예술공원"],
+    '청계산도시자연공원(청계산)':["청계산도시자연공원"],
+    '인능산도시자연공원(인릉산)':["인능산도시자연공원"],
+    '명일근린공원(명일공원)':["명일근린공원"],
+    '일자산근린공원(일자산)':["일자산근린공원"],
+    '진관근린공원(구파발폭포/이말산)':["진관근린공원"],
+}
+
+# 리뷰 데이터(NAT / BERTopic 결과 파일명)에서 쓰는 표기
+REVIEW_ALIASES = {
+    "도산근린공원": ["도산공원"],
+    "일자산허브천문공원": ["허브천문공원"],
+    "아차산공원(아차산)": ["아차산생태공원"],
+    "경의선숲길": ["경의선숲길공원"],
+    "서울숲": ["서울숲공원"],
+    "송파나루근린공원(석촌호수)": ["석촌호수공원"],
+    "청계산도시자연공원(청계산)": ["청계산매봉"],
+    "달맞이근린공원": ["달맞이공원"],
+    "우장산근린공원(우장산/우장산근린공원)": ["우장산공원"],
+    "중랑캠핑숲(중랑가족캠핑장)": ["중랑캠핑숲중랑가족캠핑장"],
+    "금천폭포근린공원": ["금천폭포공원"],
+}
+
+# 인덱스 우선순위: 정식 이름 > 명시 별칭 > 괄호 안 이름
+_FULL, _ALIAS, _PAREN = 0, 1, 2
+
+
+# ====================================================================================
+def norm_name(s):
+    """공백 제거 + 소문자 (norm_text와 _norm을 합친 것)"""
+    if pd.isna(s):
+        return ""
+    return re.sub(r"\s+", "", str(s)).lower()
+
+
+def strip_prefix(name):
+    """리뷰 파일 표기 '강남_도산공원' -> '도산공원'"""
+    name = str(name)
+    return name.split("_", 1)[1] if "_" in name else name
+
+
+def split_parens(name):
+    """'오금근린공원(오금오름공원/오금공원)' -> ('오금근린공원', ['오금오름공원', '오금공원'])"""
+    m = re.match(r"^(.*?)\s*\((.*)\)\s*$", str(name))
+    if not m:
+        return str(name), []
+    return m.group(1), [p.strip() for p in m.group(2).split("/") if p.strip()]
+
+
+class ParkRegistry:
+    def __init__(self, park_list_csv=PARK_LIST_CSV, hangang=HANGANG_PARKS,
+                 aliases=(PARK_ALIASES, REVIEW_ALIASES)):
+        self.parks = {}          # park_id -> {"name", "gu", "is_hangang", "aliases"}
+        self.index = {}          # 정규화 이름 -> park_id
+        self._level = {}         # 정규화 이름 -> 인덱스 우선순위
+        self.ambiguous = set()   # 여러 공원에 걸리는 이름 (인덱스에서 제외)
+        self.gu_index = {}       # '강남' / '강남구' -> '강남구'
+
+        park_list = pd.read_csv(park_list_csv)
+        for gu, name in zip(park_list["구"], park_list["공원명"]):
+            self.add(name, gu=gu)
+        for name, gus in hangang.items():
+            self.add(name, gu=gus, is_hangang=True)
+        for alias_map in aliases:
+            for name, alist in alias_map.items():
+                park_id = self.resolve(name)
+                if park_id is None:
+                    park_id = self.add(name)
+                for alias in alist:
+                    self._index(alias, park_id, _ALIAS)
+
+    # --------------------------------------------------------------------------------
+    def _index(self, name, park_id, level):
+        key = norm_name(name)
+        if not key or key in self.ambiguous:
+            return
+        prev = self.index.get(key)
+        if prev is None or level < self._level[key]:
+            self.index[key] = park_id
+            self._level[key] = level
+        elif prev != park_id:
+            if level == self._level[key]:
+                # 같은 우선순위에서 두 공원에 걸리면 어느 쪽도 고르지 않음
+                del self.index[key], self._level[key]
+                self.ambiguous.add(key)
+            return
+        self.parks[park_id]["aliases"].add(str(name))
+
+    def _add_gu(self, gu):
+        if pd.isna(gu) or not str(gu).strip():
+            return
+        gu = str(gu).strip()
+        self.gu_index[norm_name(gu)] = gu
+        if gu.endswith("구") and len(gu) > 2:
+            self.gu_index[norm_name(gu[:-1])] = gu
+
+    def add(self, name, gu=None, is_hangang=False):
+        """공원 하나 등록 (괄호 앞 이름이 같으면 같은 공원). 반환: park_id"""
+        base, inner = split_parens(name)
+        park_id = norm_name(base)
+        park = self.parks.setdefault(park_id, {"name": str(name), "gu": [], "is_hangang": False, "aliases": set()})
+        park["is_hangang"] = park["is_hangang"] or is_hangang
+        for g in ([] if gu is None else [gu] if isinstance(gu, str) else gu):
+            self._add_gu(g)
+            if g not in park["gu"]:
+                park["gu"].append(g)
+
+        self._index(name, park_id, _FULL)
+        self._index(base, park_id, _FULL)
+        for alias in inner:
+            self._index(alias, park_id, _PAREN)
+        if is_hangang and base.endswith("한강공원"):
+            self._index(base[:-len("한강공원")], park_id, _ALIAS)   # '뚝섬' -> 뚝섬한강공원
+        return park_id
+
+    # --------------------------------------------------------------------------------
+    def resolve(self, name):
+        """이름 하나 -> park_id (없으면 None)"""
+        if pd.isna(name):
+            return None
+        for candidate in (name, strip_prefix(name), split_parens(strip_prefix(name))[0]):
+            park_id = self.index.get(norm_name(candidate))
+            if park_id is not None:
+                return park_id
+        return None
+
+    def map_ids(self, names):
+        """이름 Series -> park_id Series (고유값마다 한 번씩만 조회)"""
+        names = pd.Series(names)
+        lookup = {n: self.resolve(n) for n in names.dropna().unique()}
+        return names.map(lookup)
+
+    def attach(self, df, name_col, id_col="park_id", warn=True):
+        """
+        df에 park_id 컬럼 추가, 매칭 실패한 이름은 경고 출력
+        매칭 실패한 행은 정규화한 원래 이름을 id로 씀 (NaN 키끼리 조인되지 않도록)
+        """
+        df = df.copy()
+        ids = self.map_ids(df[name_col])
+        missing = df.loc[ids.isna().to_numpy(), name_col].dropna().unique()
+        if warn and len(missing):
+            print(f"⚠️ 레지스트리에 없는 공원명 ({name_col}): {list(missing)}")
+        df[id_col] = ids.fillna(df[name_col].map(norm_name)).to_numpy()
+        return df
+
+    def name_of(self, park_id):
+        """park_id -> 대표 공원명 (레지스트리에 없는 id는 그대로)"""
+        return self.parks[park_id]["name"] if park_id in self.parks else park_id
+
+    def gu_of(self, park_id):
+        return list(self.parks[park_id]["gu"]) if park_id in self.parks else []
+
+    def is_hangang(self, park_id):
+        return park_id in self.parks and self.parks[park_id]["is_hangang"]
+
+    def hangang_ids(self):
+        return [pid for pid, p in self.parks.items() if p["is_hangang"]]
+
+    def resolve_gu(self, gu):
+        """'강남' / '강남구' / ' 강남구 ' -> '강남구' (자치구가 아니면 None)"""
+        return None if pd.isna(gu) else self.gu_index.get(norm_name(gu))
+
+    def map_gu(self, gus):
+        gus = pd.Series(gus)
+        lookup = {g: self.resolve_gu(g) for g in gus.dropna().unique()}
+        return gus.map(lookup)
+
+    def table(self):
+        """park_id / 공원명 / 자치구(목록) / is_hangang"""
+        return pd.DataFrame([
+            {"park_id": pid, "공원명": p["name"], "자치구": list(p["gu"]), "is_hangang": p["is_hangang"]}
+            for pid, p in self.parks.items()
+        ])
+
+
+if __name__ == "__main__":
+    import argparse
+
+    parser = argparse.ArgumentParser(description="공원명 -> park_id 조회")
+    parser.add_argument("names", nargs="*")
+    args = parser.parse_args()
+
+    registry = ParkRegistry()
+    print(f"공원 {len(registry.parks)}개 / 인덱스 이름 {len(registry.index)}개 / 모호한 이름 {len(registry.ambiguous)}개")
+    for name in args.names:
+        park_id = registry.resolve(name)
+        print(f"{name} -> {park_id} ({registry.name_of(park_id)}, {registry.gu_of(park_id)})")
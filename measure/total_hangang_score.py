@@ -1,7 +1,13 @@
 ## 한강공원 종합 점수 계산
+import sys
+from pathlib import Path
+
 import numpy as np
 import pandas as pd
 
+sys.path.append(str(Path(__file__).resolve().parent))   # measure/
+from park_registry import ParkRegistry
+
 # 1. 파일 경로 정의
 # 실제 파일 이름이 다르다면 이 부분을 수정해주세요.
 # 파일 이름은 사용자가 제공한 스니펫의 접두사를 기반으로 가정합니다.
@@ -17,17 +23,20 @@ try:
     saf_df = pd.read_csv(saf_file)
     nat_df = pd.read_csv(nat_file)
 
-    # 3. 각 파일에서 필요한 컬럼만 선택 및 이름 변경
-    lei_scores = lei_df[['공원명', '종합_여가도_점수']].rename(columns={'종합_여가도_점수': 'LEI_score'})
-    acc_scores = acc_df[['공원명', '종합점수_100']].rename(columns={'종합점수_100': 'ACC_score'})
-    saf_scores = saf_df[['한강공원', '안전성_점수']].rename(columns={'한강공원' : '공원명', '안전성_점수': 'SAF_score'})
-    nat_scores = nat_df[['Park_nm', 'eco_score_std']].rename(columns={'Park_nm': '공원명', 'eco_score_std': 'NAT_score'})
+    # 3. 각 파일의 공원명을 park_id로 맞추고 필요한 컬럼만 선택 및 이름 변경
+    # (NAT는 '한강_뚝섬한강공원' 형식이라 공원명으로 바로 조인하면 매칭되지 않음)
+    registry = ParkRegistry()
+    lei_scores = registry.attach(lei_df, '공원명')[['park_id', '종합_여가도_점수']].rename(columns={'종합_여가도_점수': 'LEI_score'})
+    acc_scores = registry.attach(acc_df, '공원명')[['park_id', '종합점수_100']].rename(columns={'종합점수_100': 'ACC_score'})
+    saf_scores = registry.attach(saf_df, '한강공원')[['park_id', '안전성_점수']].rename(columns={'안전성_점수': 'SAF_score'})
+    nat_scores = registry.attach(nat_df, 'Park_nm')[['park_id', 'eco_score_std']].rename(columns={'eco_score_std': 'NAT_score'})
 
-    # 4. 3개의 데이터프레임을 '자치구' 기준으로 병합
-    merged_df = pd.merge(lei_scores, acc_scores, on='공원명', how='outer')
-    merged_df = pd.merge(merged_df, nat_scores, on='공원명', how='outer')
-    final_df = pd.merge(merged_df, saf_scores, on='공원명', how='outer')
+    # 4. 4개의 데이터프레임을 'park_id' 기준으로 병합
+    merged_df = pd.merge(lei_scores, acc_scores, on='park_id', how='outer')
+    merged_df = pd.merge(merged_df, nat_scores, on='park_id', how='outer')
+    final_df = pd.merge(merged_df, saf_scores, on='park_id', how='outer')
     final_df.fillna(0, inplace=True)
+    final_df.insert(0, '공원명', final_df['park_id'].map(registry.name_of))
 
     # 5. 가중치(LEI:ACC:SAF = 2:2:3)를 적용하여 '원본 총점' 계산
     weights = {'LEI': 2, 'ACC': 2, 'SAF': 3, 'NAT': 3} 
@@ -1,6 +1,12 @@
+import sys
+from pathlib import Path
+
 import pandas as pd
 import numpy as np # 시그모이드 함수를 위해 추가
 
+sys.path.append(str(Path(__file__).resolve().parent))   # measure/
+from park_registry import ParkRegistry
+
 # 1. 파일 경로 정의
 lei_file = 'measure/LEI/results/gu_leisure_score.csv'
 acc_file = 'measure/ACC/final_result/nonhangang_final.csv'
@@ -19,6 +25,15 @@ try:
     saf_scores = saf_df[['자치구', 'safety_score']].rename(columns={'safety_score': 'SAF_score'})
     nat_scores = nat_df[['District', 'eco_score_std']].rename(columns={'District': '자치구', 'eco_score_std': 'NAT_score'})
 
+    # 자치구 표기 통일 (NAT는 '강남' 형식, 나머지는 '강남구' 형식) - 자치구가 아닌 행('etc')은 제외
+    registry = ParkRegistry()
+    for name, scores in [('LEI', lei_scores), ('ACC', acc_scores), ('SAF', saf_scores), ('NAT', nat_scores)]:
+        gu = registry.map_gu(scores['자치구'])
+        if gu.isna().any():
+            print(f"⚠️ {name}: 자치구로 인식하지 못한 값 제외 -> {list(scores.loc[gu.isna(), '자치구'].unique())}")
+        scores['자치구'] = gu
+        scores.dropna(subset=['자치구'], inplace=True)
+
     merged_df = pd.merge(lei_scores, acc_scores, on='자치구', how='outer')
     merged_df = pd.merge(merged_df, nat_scores, on='자치구', how='outer')
     final_df = pd.merge(merged_df, saf_scores, on='자치구', how='outer')
@@ -0,0 +1,33 @@
+import sys
+from pathlib import Path
+
+import pytest
+
+pd = pytest.importorskip("pandas")
+
+ROOT = Path(__file__).resolve().parents[1]
+sys.path.append(str(ROOT / "measure"))
+
+from gu_resolver import SEOUL_GU, GuResolver  # noqa: E402
+
+
+def test_addresses():
+    resolver = GuResolver(SEOUL_GU)
+    gu = resolver.resolve([
+        "서울특별시 강남 구 테헤란로 1",
+        "서울 양천구 강서구청로 3",
+        "서울특별시 강서구 화곡로 1",
+        "강서구청로 5",
+        None,
+    ])
+    assert gu[:3].tolist() == ["강남구", "양천구", "강서구"]
+    assert gu[3:].isna().all()
+
+
+def test_stem_only_for_column_values():
+    resolver = GuResolver(SEOUL_GU)
+    values = ["동대문", " 영등포 ", "서대문구", "합계"]
+    assert resolver.resolve(values, stem=True)[:3].tolist() == ["동대문구", "영등포구", "서대문구"]
+    assert resolver.resolve(values, stem=True)[3:].isna().all()
+    # 주소 모드에서는 '구' 없는 이름을 자치구로 보지 않음
+    assert resolver.resolve(["동대문", "서울 동대문 시장"]).isna().all()
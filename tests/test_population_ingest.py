@@ -0,0 +1,45 @@
+import sys
+from pathlib import Path
+
+import pytest
+
+pd = pytest.importorskip("pandas")
+pytest.importorskip("pyarrow")
+
+sys.path.append(str(Path(__file__).resolve().parents[1] / "measure" / "ACC"))
+
+from population_ingest import PopulationCache  # noqa: E402
+
+DATES = ["20241101", "20241102", "20241103"]
+
+
+def write_population_csv(path):
+    rows = [{"기준일ID": d, "시간대구분": h, "행정동코드": f"1111051500{i}", "총생활인구수": 1234.5678 + i}
+            for d in DATES for h in (7, 12) for i in range(2)]
+    pd.DataFrame(rows).to_csv(path, index=False, encoding="utf-8-sig")
+
+
+def test_filtered_ingest_does_not_hide_other_dates(tmp_path):
+    src = tmp_path / "pop.csv"
+    write_population_csv(src)
+    cache = PopulationCache(tmp_path / "cache")
+
+    assert cache.ingest(src, dates=["20241102"]) == ["20241102"]
+    # 같은 날짜를 다시 요청하면 캐시 사용, 전체 요청이면 나머지 날짜까지 적재
+    assert cache.ingest(src, dates=["20241102"]) == ["20241102"]
+    assert cache.ingest(src) == DATES
+    assert cache.dates() == DATES
+    # 전체 적재 후에는 날짜 필터 요청도 다시 읽지 않음
+    assert cache.is_fresh(src, dates=["20241101"])
+    assert PopulationCache(tmp_path / "cache").ingest(src, dates=["20241103"]) == ["20241103"]
+
+
+def test_population_is_read_as_float64(tmp_path):
+    src = tmp_path / "pop.csv"
+    write_population_csv(src)
+    cache = PopulationCache(tmp_path / "cache")
+    cache.ingest(src)
+    pop = cache.load()
+    assert pop["pop"].dtype == "float64"
+    # 두 행정동 코드가 같은 code8로 합쳐짐 -> 1234.5678 + 1235.5678 (float32면 1e-4 수준 오차)
+    assert pop["pop"].min() == pytest.approx(2470.1356, abs=1e-9)
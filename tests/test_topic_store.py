@@ -0,0 +1,43 @@
+import os
+import sys
+import shutil
+from pathlib import Path
+
+import pytest
+
+pd = pytest.importorskip("pandas")
+pytest.importorskip("pyarrow")
+
+ROOT = Path(__file__).resolve().parents[1]
+RESULTS_DIR = ROOT / "bertopic_results"
+sys.path.append(str(ROOT / "KoBERTopic"))
+
+import topic_store  # noqa: E402
+
+
+def test_combined_summaries_are_not_park_summaries():
+    assert topic_store.is_park_summary("강남_도산공원_topic_summary.csv")
+    assert topic_store.is_park_summary("중구_남산공원_reviews_url_cleaned.csv_topic_summary.csv")
+    assert not topic_store.is_park_summary("combine_topic_summary.csv")
+    assert not topic_store.is_park_summary("city_topic_summary.csv")
+    assert not topic_store.is_park_summary("강남_도산공원_document_topics.csv")
+
+
+def test_build_topic_store_on_repo_results(tmp_path):
+    # 저장소 파일이 repo에 생기지 않도록 실제 bertopic_results/의 CSV를 그대로 복사해서 사용
+    for f in os.listdir(RESULTS_DIR):
+        if f.endswith(".csv"):
+            shutil.copy2(RESULTS_DIR / f, tmp_path / f)
+    assert (tmp_path / "combine_topic_summary.csv").exists()
+
+    store = topic_store.build_topic_store(str(tmp_path))
+
+    expected = {topic_store.park_name_from_summary(f) for f in os.listdir(tmp_path) if topic_store.is_park_summary(f)}
+    assert set(store["Park_nm"]) == expected
+    assert "combine" not in set(store["Park_nm"])
+    assert list(store.columns) == topic_store.COLUMNS
+    assert all(isinstance(v, list) for v in store["Representation"])
+
+    # 다시 실행해도 (바뀐 파일 없음) 같은 결과
+    again = topic_store.build_topic_store(str(tmp_path))
+    assert len(again) == len(store)